@@ -7,6 +7,7 @@ from os import mkdir, listdir, remove, rename
 from os.path import join, isfile
 from abc import ABC
 from typing import List
+from src.results import StageResults
 
 
 @dataclass
@@ -23,12 +24,15 @@ class Data(ABC):
             Currenti working directory
         logger_name: str
             Name of the logger
+        results: StageResults
+            The in-memory results shared by the pipeline stages, if any
 
     """
 
     root_path: str = None
     cur_dir: str = None
     logger_name: str = None
+    results: StageResults = None
 
     def logger_info(self, message: str):
         """Print logger info message"""
@@ -49,6 +53,14 @@ class Data(ABC):
         """Set module logger to critical"""
         logging.getLogger(module).setLevel(logging.CRITICAL)
 
+    def _persist(self, function, *args, **kwargs):
+        """Write an artifact to disk. When the stages hand their results in
+        memory the write is left to the stage results, in the background"""
+        if self.results is None:
+            function(*args, **kwargs)
+        else:
+            self.results.write(function, *args, **kwargs)
+
     def _mkdir(self, folder_name: str) -> None:
         """Creates a folder at current path"""
         # logger = logging.getLogger(self.logger_name)
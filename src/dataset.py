@@ -0,0 +1,45 @@
+"""Columnar cache of the spatial dataset"""
+import os
+import pandas as pd
+from pyarrow import feather
+
+DATA_FILENAME = "data.csv"
+DATA_CACHE_FOLDER = "cache"
+DATA_CACHE_FILENAME = "data.ftr"
+# Coordinate columns left out of the spatial cross-validation
+GEO_COLS = ["[GEO]_LATITUDE", "[GEO]_LONGITUDE"]
+
+
+def _is_cache_fresh(cache_path: str, csv_path: str) -> bool:
+    """Return whether the cache exists and is not older than the csv file"""
+    if not os.path.isfile(cache_path):
+        return False
+    if not os.path.isfile(csv_path):
+        return True
+    return os.path.getmtime(cache_path) >= os.path.getmtime(csv_path)
+
+
+def load_dataset(
+    root_path: str, index_col: str, data: pd.DataFrame = None
+) -> pd.DataFrame:
+    """Return the spatial dataset indexed by index_col. A dataset already in
+    memory is returned as it is. Otherwise data.csv is parsed once into an
+    uncompressed feather file in the root path cache folder, which later runs
+    read through a memory map until the csv file changes"""
+    if data is not None and not data.empty:
+        if index_col is None or data.index.name == index_col:
+            return data
+        return data.set_index(index_col)
+    csv_path = os.path.join(root_path, DATA_FILENAME)
+    cache_dir = os.path.join(root_path, DATA_CACHE_FOLDER)
+    cache_path = os.path.join(cache_dir, DATA_CACHE_FILENAME)
+    if _is_cache_fresh(cache_path, csv_path):
+        dataset = feather.read_table(cache_path, memory_map=True).to_pandas()
+    else:
+        dataset = pd.read_csv(csv_path, low_memory=False)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write then rename, so concurrent stages never read a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        dataset.to_feather(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+    return dataset.set_index(index_col)
@@ -0,0 +1,237 @@
+"""Correlation-based feature selection in NumPy, following Weka's CFS"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+import numpy as np
+from src.feature_selection.fold_stats import FoldRows
+
+# Weka's BestFirst -N option and its minimum merit improvement
+MAX_STALE = 5
+MIN_IMPROVEMENT = 0.00001
+
+
+def _centered(matrix: np.ndarray) -> np.ndarray:
+    """Return the columns minus their mean, missing values counting as the
+    mean, as in Weka"""
+    matrix = np.array(matrix, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[:, np.newaxis]
+    missing = np.isnan(matrix)
+    if missing.any():
+        counts = (~missing).sum(axis=0)
+        sums = np.where(missing, 0.0, matrix).sum(axis=0)
+        means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+        matrix -= means
+        matrix[missing] = 0.0
+    else:
+        matrix -= matrix.mean(axis=0)
+    return matrix
+
+
+@dataclass
+class CfsCorrelations:
+    """Represents the correlations the CFS merit is computed from.
+
+    As in Weka's CfsSubsetEval for a numeric class, correlations are the
+    absolute Pearson coefficients stored in single precision, a constant
+    feature being fully correlated to the others and uncorrelated to the
+    class, and each feature is weighted by its standard deviation. The
+    feature-class correlations are computed up front and the feature-feature
+    ones one feature row at a time, only for the features the search reaches,
+    from the centered feature matrix or from the fold cross-products.
+
+    Attributes
+    ----------
+        class_corr: np.ndarray
+            The correlation of each feature with the class
+        std_devs: np.ndarray
+            The weight of each feature
+        _centered: np.ndarray
+            The centered feature matrix
+        _norms: np.ndarray
+            The norm of each centered feature
+        _rows: Dict[int, np.ndarray]
+            The computed feature-feature correlation rows
+        _fold: FoldRows
+            The fold statistics the rows are derived from, when there is no
+            centered feature matrix
+    """
+
+    class_corr: np.ndarray = None
+    std_devs: np.ndarray = None
+    _centered: np.ndarray = None
+    _norms: np.ndarray = None
+    _rows: Dict[int, np.ndarray] = field(default_factory=dict)
+    _fold: FoldRows = None
+
+    @classmethod
+    def from_matrix(cls, features: np.ndarray, target: np.ndarray):
+        """Compute the correlations of the feature matrix and the target,
+        leaving out the rows with a missing target"""
+        target = np.asarray(target, dtype=np.float64)
+        keep = ~np.isnan(target)
+        features = _centered(np.asarray(features)[keep])
+        target = _centered(target[keep])[:, 0]
+        norms = np.sqrt(np.einsum("ij,ij->j", features, features))
+        target_norm = np.sqrt(target @ target)
+        norms_product = norms * target_norm
+        class_corr = np.divide(
+            np.abs(target @ features),
+            norms_product,
+            out=np.zeros_like(norms),
+            where=norms_product > 0,
+        )
+        std_devs = np.where(norms > 0, norms / np.sqrt(max(target.size, 1)), 1.0)
+        return cls(
+            class_corr=class_corr.astype(np.float32).astype(np.float64),
+            std_devs=std_devs,
+            _centered=features,
+            _norms=norms,
+        )
+
+    @classmethod
+    def from_fold(cls, fold: FoldRows):
+        """Derive the correlations from the cross-products of the fold training
+        rows, the class being the last column and the only target column"""
+        products = fold.products
+        class_corr = np.abs(products.correlations()[:-1, 0]).astype(np.float32)
+        norms = np.sqrt(products.scatter()[:-1])
+        weights = products.std_devs()[:-1]
+        return cls(
+            class_corr=np.nan_to_num(class_corr, nan=0.0).astype(np.float64),
+            std_devs=np.where(weights > 0, weights, 1.0),
+            _norms=norms,
+            _fold=fold,
+        )
+
+    def __len__(self) -> int:
+        return self.class_corr.size
+
+    def row(self, feature: int) -> np.ndarray:
+        """Return the correlations of a feature with every feature"""
+        if feature not in self._rows:
+            if self._fold is None:
+                products = self._centered[:, feature] @ self._centered
+            else:
+                products = self._fold.centered_products(feature)[:-1]
+            norms_product = self._norms * self._norms[feature]
+            corr = np.divide(
+                np.abs(products),
+                norms_product,
+                out=np.ones_like(self._norms),
+                where=norms_product > 0,
+            )
+            self._rows[feature] = corr.astype(np.float32).astype(np.float64)
+        return self._rows[feature]
+
+
+def _subset_terms(corr: CfsCorrelations, subset: Tuple[int, ...]):
+    """Return the merit numerator and denominator of a subset"""
+    weights = corr.std_devs
+    numerator = sum(weights[i] * corr.class_corr[i] for i in subset)
+    denominator = 0.0
+    for position, i in enumerate(subset):
+        denominator += weights[i] * weights[i]
+        for j in subset[:position]:
+            denominator += 2.0 * weights[i] * weights[j] * corr.row(i)[j]
+    return numerator, denominator
+
+
+def _merits(numerator, denominator) -> np.ndarray:
+    """Return the CFS merits, zero when the denominator is zero"""
+    denominator = np.abs(denominator)
+    merits = np.divide(
+        np.abs(numerator),
+        np.sqrt(denominator),
+        out=np.zeros_like(denominator, dtype=np.float64),
+        where=denominator > 0,
+    )
+    return merits
+
+
+def expansion_merits(corr: CfsCorrelations, subset: Tuple[int, ...]) -> np.ndarray:
+    """Return the merit of the subset plus each single feature"""
+    weights = corr.std_devs
+    numerator, denominator = _subset_terms(corr, subset)
+    cross = np.zeros(len(corr))
+    for i in subset:
+        cross += weights[i] * corr.row(i)
+    return _merits(
+        numerator + weights * corr.class_corr,
+        denominator + weights * weights + 2.0 * weights * cross,
+    )
+
+
+def _add_to_list(open_list: List, subset: Tuple[int, ...], merit: float):
+    """Insert the subset after the ones with a merit at least as high, keeping
+    the list to its maximum size as Weka's BestFirst does"""
+    if len(open_list) == MAX_STALE and merit <= open_list[-1][1]:
+        return
+    position = len(open_list)
+    for index, (_, listed_merit) in enumerate(open_list):
+        if merit > listed_merit:
+            position = index
+            break
+    open_list.insert(position, (subset, merit))
+    del open_list[MAX_STALE:]
+
+
+def best_first(corr: CfsCorrelations) -> Tuple[int, ...]:
+    """Return the subset found by a forward BestFirst search stopping after
+    MAX_STALE expansions without improvement. Evaluated subsets are kept in a
+    lookup table of the same size as Weka's, so the same subset is not added
+    to the open list twice while it is cached"""
+    n_features = len(corr)
+    best_subset, best_merit = (), 0.0
+    open_list = [(best_subset, best_merit)]
+    lookup = {best_subset: best_merit}
+    stale = 0
+    while stale < MAX_STALE and open_list:
+        subset, _ = open_list.pop(0)
+        merits = expansion_merits(corr, subset)
+        members = set(subset)
+        improved = False
+        for feature in range(n_features):
+            if feature in members:
+                continue
+            candidate = tuple(sorted(subset + (feature,)))
+            if candidate in lookup:
+                continue
+            merit = float(merits[feature])
+            # The lookup table holds one entry per attribute, class included
+            if len(lookup) >= n_features + 1:
+                lookup = {}
+            lookup[candidate] = merit
+            if merit - best_merit > MIN_IMPROVEMENT:
+                improved = True
+                stale = 0
+                best_subset, best_merit = candidate, merit
+            _add_to_list(open_list, candidate, merit)
+        if not improved:
+            stale += 1
+    return best_subset
+
+
+def add_locally_predictive(corr: CfsCorrelations, subset) -> List[int]:
+    """Add, from the most to the least correlated with the class, the features
+    not more correlated to a selected feature than to the class"""
+    selected = list(subset)
+    members = set(subset)
+    order = np.argsort(-corr.class_corr, kind="stable")
+    for feature in order.tolist():
+        if feature in members:
+            continue
+        class_corr = corr.class_corr[feature]
+        if all(corr.row(i)[feature] <= class_corr for i in selected):
+            selected.append(feature)
+    return sorted(selected)
+
+
+def search(corr: CfsCorrelations) -> List[int]:
+    """Return the positions of the features selected by CFS, as Weka's
+    CfsSubsetEval with a BestFirst -D 1 -N 5 search does"""
+    return add_locally_predictive(corr, best_first(corr))
+
+
+def cfs(features: np.ndarray, target: np.ndarray) -> List[int]:
+    """Return the positions of the features selected by CFS on the matrix"""
+    return search(CfsCorrelations.from_matrix(features, target))
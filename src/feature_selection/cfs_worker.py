@@ -0,0 +1,195 @@
+"""Long-lived Weka CFS worker keeping one JVM and the loaded datasets"""
+import atexit
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+import numpy as np
+import pandas as pd
+from weka.core import jvm
+from weka.attribute_selection import ASEvaluation, ASSearch, AttributeSelection
+from weka.core.dataset import create_instances_from_matrices
+from weka.filters import Filter
+
+
+def start_jvm():
+    """Start the JVM once per process, stopping it when the process exits.
+    The JVM cannot be started again in a process after it is stopped"""
+    if not jvm.started:
+        jvm.start()
+        atexit.register(jvm.stop)
+
+
+def to_weka_range(positions) -> str:
+    """Return the Weka range string of zero based positions, e.g. 1-3,7"""
+    positions = np.unique(np.asarray(positions, dtype=np.int64)) + 1
+    if positions.size == 0:
+        return ""
+    breaks = np.flatnonzero(np.diff(positions) != 1)
+    starts = np.concatenate(([positions[0]], positions[breaks + 1]))
+    ends = np.concatenate((positions[breaks], [positions[-1]]))
+    return ",".join(
+        str(start) if start == end else f"{start}-{end}"
+        for start, end in zip(starts.tolist(), ends.tolist())
+    )
+
+
+@dataclass
+class CfsSelector:
+    """Represents Weka CFS run in the current process on registered datasets.
+
+    A dataset is copied into Weka instances once, and each selection only
+    sends the ranges of its rows and columns, which Weka filters keep before
+    running the BestFirst search with the CfsSubsetEval evaluator.
+
+    Attributes
+    ----------
+        datasets: Dict[str, Any]
+            The Weka instances of each registered dataset, target last
+        columns: Dict[str, List[str]]
+            The column names of each registered dataset
+    """
+
+    datasets: Dict[str, Any] = field(default_factory=dict)
+    columns: Dict[str, List[str]] = field(default_factory=dict)
+
+    def is_registered(self, name: str) -> bool:
+        """Return whether the dataset is already loaded"""
+        return name in self.datasets
+
+    def register(self, name: str, data: pd.DataFrame):
+        """Load the dataset into Weka, its last column being the target"""
+        start_jvm()
+        self.datasets[name] = create_instances_from_matrices(data.to_numpy())
+        self.columns[name] = data.columns.tolist()
+
+    @staticmethod
+    def _keep(data, classname: str, positions):
+        """Keep only the given rows or columns of the instances"""
+        options = ["-V", "-R", to_weka_range(positions)]
+        keep = Filter(classname=classname, options=options)
+        keep.inputformat(data)
+        return keep.filter(data)
+
+    def select(self, name: str, rows, columns=None) -> List[str]:
+        """Return the features selected by CFS over the given row positions and
+        column positions of the dataset, all the columns by default"""
+        n_cols = len(self.columns[name])
+        columns = list(range(n_cols - 1)) if columns is None else list(columns)
+        columns = [col for col in columns if col != n_cols - 1] + [n_cols - 1]
+        data = self._keep(
+            self.datasets[name], "weka.filters.unsupervised.instance.RemoveRange", rows
+        )
+        data = self._keep(data, "weka.filters.unsupervised.attribute.Remove", columns)
+        data.class_is_last()
+        search = ASSearch(
+            classname="weka.attributeSelection.BestFirst",
+            options=["-D", "1", "-N", "5"],
+        )
+        evaluator = ASEvaluation(
+            classname="weka.attributeSelection.CfsSubsetEval",
+            options=["-P", "1", "-E", "1"],
+        )
+        attsel = AttributeSelection()
+        attsel.search(search)
+        attsel.evaluator(evaluator)
+        attsel.select_attributes(data)
+        # The filters keep the dataset order, the target staying last
+        kept = sorted(set(columns))
+        return [self.columns[name][kept[i - 1]] for i in attsel.selected_attributes]
+
+
+def _serve(requests, responses):
+    """Answer the requests of a CfsWorker until it sends None"""
+    selector = CfsSelector()
+    for method, args in iter(requests.get, None):
+        try:
+            responses.put((True, getattr(selector, method)(*args)))
+        except Exception as error:  # pylint: disable=broad-except
+            # Java exceptions cannot be sent back to the client process
+            responses.put((False, RuntimeError(f"{type(error).__name__}: {error}")))
+
+
+@dataclass
+class CfsWorker:
+    """Represents a CfsSelector running in a worker process.
+
+    The JVM lives in the worker for its whole life, so the client process
+    never starts one, can run CFS any number of times and can still fork
+    processes safely.
+
+    Attributes
+    ----------
+        _process: multiprocessing.Process
+            The worker process
+        _requests: multiprocessing.Queue
+            The queue of method calls sent to the worker
+        _responses: multiprocessing.Queue
+            The queue of results sent back by the worker
+    """
+
+    _process: multiprocessing.Process = None
+    _requests: Any = None
+    _responses: Any = None
+
+    def start(self) -> "CfsWorker":
+        """Start the worker process, if not running"""
+        if self._process is None or not self._process.is_alive():
+            self._requests = multiprocessing.Queue()
+            self._responses = multiprocessing.Queue()
+            self._process = multiprocessing.Process(
+                target=_serve, args=(self._requests, self._responses), daemon=True
+            )
+            self._process.start()
+        return self
+
+    def _call(self, method: str, *args):
+        """Run a CfsSelector method in the worker, returning its result"""
+        self.start()
+        self._requests.put((method, args))
+        success, result = self._responses.get()
+        if not success:
+            raise result
+        return result
+
+    def is_registered(self, name: str) -> bool:
+        """Return whether the dataset is already loaded in the worker"""
+        return self._call("is_registered", name)
+
+    def register(self, name: str, data: pd.DataFrame):
+        """Load the dataset in the worker, its last column being the target"""
+        self._call("register", name, data)
+
+    def select(self, name: str, rows, columns=None) -> List[str]:
+        """Return the features selected by CFS in the worker"""
+        return self._call("select", name, np.asarray(rows), columns)
+
+    def stop(self):
+        """Stop the worker process and its JVM"""
+        if self._process is not None and self._process.is_alive():
+            self._requests.put(None)
+            self._process.join()
+        self._process = None
+
+
+_SELECTOR = None
+
+
+def get_cfs_selector():
+    """Return the CFS selector shared by the process. It runs in a CfsWorker,
+    unless the process is a daemonic pool worker, which cannot have children
+    and so keeps the JVM itself"""
+    global _SELECTOR  # pylint: disable=global-statement
+    if _SELECTOR is None:
+        if multiprocessing.current_process().daemon:
+            _SELECTOR = CfsSelector()
+        else:
+            _SELECTOR = CfsWorker().start()
+            atexit.register(_SELECTOR.stop)
+    return _SELECTOR
+
+
+def reset_cfs_selector():
+    """Forget the selector inherited from the parent by a forked process, so
+    the process starts its own"""
+    global _SELECTOR  # pylint: disable=global-statement
+    _SELECTOR = None
@@ -0,0 +1,222 @@
+"""Fold correlations downdated from the cross-products of the whole dataset"""
+from dataclasses import dataclass, field
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class CrossProducts:
+    """Represents the sums and cross-products of the rows of a matrix.
+
+    Attributes
+    ----------
+        n_rows: int
+            The number of rows summed
+        sums: np.ndarray
+            The sum of each column
+        squares: np.ndarray
+            The sum of squares of each column
+        products: np.ndarray
+            The sum of the products of each column with each target column
+        targets: np.ndarray
+            The positions of the target columns
+    """
+
+    n_rows: int = 0
+    sums: np.ndarray = None
+    squares: np.ndarray = None
+    products: np.ndarray = None
+    targets: np.ndarray = None
+
+    @classmethod
+    def from_matrix(cls, matrix: np.ndarray, targets: np.ndarray) -> "CrossProducts":
+        """Sum the rows of the matrix"""
+        return cls(
+            n_rows=matrix.shape[0],
+            sums=matrix.sum(axis=0),
+            squares=np.einsum("ij,ij->j", matrix, matrix),
+            products=matrix.T @ matrix[:, targets],
+            targets=targets,
+        )
+
+    def __sub__(self, other: "CrossProducts") -> "CrossProducts":
+        return CrossProducts(
+            n_rows=self.n_rows - other.n_rows,
+            sums=self.sums - other.sums,
+            squares=self.squares - other.squares,
+            products=self.products - other.products,
+            targets=self.targets,
+        )
+
+    def scatter(self) -> np.ndarray:
+        """Return the sum of squared deviations of each column"""
+        if self.n_rows == 0:
+            return np.zeros_like(self.sums)
+        scatter = self.squares - self.sums**2 / self.n_rows
+        # Columns constant over the rows only keep rounding errors
+        scatter[scatter <= 1e-10 * self.squares] = 0.0
+        return scatter
+
+    def std_devs(self) -> np.ndarray:
+        """Return the population standard deviation of each column"""
+        return np.sqrt(self.scatter() / max(self.n_rows, 1))
+
+    def correlations(self) -> np.ndarray:
+        """Return the Pearson correlation of each column with each target
+        column, NaN when either of them is constant"""
+        scatter = self.scatter()
+        n_rows = max(self.n_rows, 1)
+        cross = self.products - np.outer(self.sums, self.sums[self.targets]) / n_rows
+        norms = np.sqrt(np.outer(scatter, scatter[self.targets]))
+        return np.divide(cross, norms, out=np.full_like(cross, np.nan), where=norms > 0)
+
+
+@dataclass
+class FoldStatistics:
+    """Represents the statistics engine deriving the correlations of any
+    training set from the cross-products of the whole dataset.
+
+    The cross-products with the target columns are computed in a single pass
+    over the dataset. As a fold training set is the dataset minus its test
+    and buffer rows, its cross-products are the totals minus those of the
+    removed rows, and the training rows are only summed directly when they
+    are fewer than the removed ones. The products of a column with every
+    other column are computed over the whole dataset only when a fold asks
+    for them, and kept for the next folds. Columns are centered on their
+    dataset means first, which does not change the correlations but keeps
+    the subtraction accurate. The matrix must not have missing values.
+
+    Attributes
+    ----------
+        columns: List[str]
+            The column names
+        _matrix: np.ndarray
+            The centered dataset matrix
+        _total: CrossProducts
+            The cross-products of every row
+        _column_products: Dict[int, np.ndarray]
+            The products of a column with every column over every row
+    """
+
+    columns: List[str] = None
+    _matrix: np.ndarray = None
+    _total: CrossProducts = None
+    _column_products: Dict[int, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, targets=None) -> "FoldStatistics":
+        """Compute the cross-products of the dataset columns with the target
+        columns, every column by default. Return None if values are missing"""
+        matrix = data.to_numpy(dtype=np.float64)
+        if np.isnan(matrix).any():
+            return None
+        matrix = matrix - matrix.mean(axis=0)
+        if targets is None:
+            targets = np.arange(matrix.shape[1])
+        targets = np.asarray(targets, dtype=np.int64)
+        return cls(
+            columns=data.columns.tolist(),
+            _matrix=matrix,
+            _total=CrossProducts.from_matrix(matrix, targets),
+        )
+
+    def column_products(self, column: int) -> np.ndarray:
+        """Return the products of the column with every column over every row"""
+        if column not in self._column_products:
+            self._column_products[column] = self._matrix.T @ self._matrix[:, column]
+        return self._column_products[column]
+
+    def fold(self, rows) -> "FoldRows":
+        """Return the statistics of the given training rows"""
+        in_rows = np.zeros(self._matrix.shape[0], dtype=bool)
+        in_rows[rows] = True
+        targets = self._total.targets
+        if in_rows.sum() <= self._matrix.shape[0] / 2:
+            matrix = self._matrix[in_rows]
+            products = CrossProducts.from_matrix(matrix, targets)
+            return FoldRows(products=products, _matrix=matrix)
+        matrix = self._matrix[~in_rows]
+        products = self._total - CrossProducts.from_matrix(matrix, targets)
+        return FoldRows(products=products, _matrix=matrix, _stats=self)
+
+
+@dataclass
+class FoldRows:
+    """Represents the training rows of a fold in the statistics engine.
+
+    Attributes
+    ----------
+        products: CrossProducts
+            The cross-products of the training rows with the target columns
+        _matrix: np.ndarray
+            The training rows, or the removed rows when downdating
+        _stats: FoldStatistics
+            The statistics engine the removed rows are subtracted from, None
+            when the training rows are summed directly
+    """
+
+    products: CrossProducts = None
+    _matrix: np.ndarray = None
+    _stats: FoldStatistics = None
+
+    def centered_products(self, column: int) -> np.ndarray:
+        """Return the products of the column with every column over the
+        training rows, centered on the training means"""
+        products = self._matrix.T @ self._matrix[:, column]
+        if self._stats is not None:
+            products = self._stats.column_products(column) - products
+        sums = self.products.sums
+        return products - sums * sums[column] / max(self.products.n_rows, 1)
+
+
+def fold_correlations(
+    masks: np.ndarray, features: np.ndarray, target: np.ndarray
+) -> np.ndarray:
+    """Return the (n_folds, n_features) Pearson correlations of each feature
+    with the target over the rows of each fold mask. The per fold sums are
+    the products of the fold masks with the feature matrix and its squares,
+    over the rows where both values are present, as pandas corrwith does"""
+    features = np.asarray(features, dtype=np.float64)
+    target = np.asarray(target, dtype=np.float64)
+    present = ~np.isnan(target)
+    weights = masks.astype(np.float64) * present
+    # Centering on the dataset means does not change the correlations
+    target = np.where(present, target - np.nanmean(target), 0.0)
+    features = features - np.nanmean(features, axis=0)
+    missing = np.isnan(features)
+    weighted_target = weights * target
+    if missing.any():
+        observed = (~missing).astype(np.float64)
+        features = np.where(missing, 0.0, features)
+        counts = weights @ observed
+        target_sums = weighted_target @ observed
+        target_squares = (weighted_target * target) @ observed
+    else:
+        counts = weights.sum(axis=1)[:, np.newaxis]
+        target_sums = (weighted_target.sum(axis=1))[:, np.newaxis]
+        target_squares = (weighted_target @ target)[:, np.newaxis]
+    sums = weights @ features
+    squares = weights @ np.square(features)
+    products = weighted_target @ features
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cross = products - sums * target_sums / counts
+        scatter = squares - sums**2 / counts
+        target_scatter = target_squares - target_sums**2 / counts
+        # Columns constant over the fold rows only keep rounding errors
+        scatter[scatter <= 1e-10 * squares] = 0.0
+        target_scatter[target_scatter <= 1e-10 * target_squares] = 0.0
+        norms = np.sqrt(scatter * target_scatter)
+        return np.where((norms > 0) & (counts > 1), cross / norms, np.nan)
+
+
+def top_columns(correlations: np.ndarray, n_top: int) -> List[np.ndarray]:
+    """Return the positions of the n_top highest correlations of each row,
+    ties kept in column order and missing correlations left out, as
+    pandas nlargest does"""
+    top = []
+    for row in correlations:
+        valid = np.flatnonzero(~np.isnan(row))
+        order = np.argsort(-row[valid], kind="stable")[:n_top]
+        top.append(valid[order])
+    return top
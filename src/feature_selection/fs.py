@@ -2,14 +2,28 @@
 import os
 import json
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
-from weka.core import jvm
-from weka.attribute_selection import ASEvaluation, ASSearch, AttributeSelection
-from weka.core.dataset import create_instances_from_matrices
 from src.data import Data
-from src import utils
+from src.dataset import load_dataset
+from src.feature_selection.cfs import CfsCorrelations, cfs, search
+from src.feature_selection.fold_stats import (
+    FoldStatistics,
+    fold_correlations,
+    top_columns,
+)
+from src.feature_selection.cfs_worker import get_cfs_selector
+from src.fold_store import FoldStore
+from src.node_index import NodeIndex
+from src.results import (
+    filter_folds,
+    get_fold_store,
+    get_selected_features,
+    get_stage_cache,
+)
+from src.stage_cache import FOLD_STORE_ARTIFACT, stage_key
 
 
 @dataclass
@@ -19,7 +33,7 @@ class FeatureSelection(Data):
      Attributes
     ----------
         fs_method:str
-            The feature selection method name
+            The feature selection method name: CFS, NumpyCFS, Pearson or All
         scv_method:str
             The spatial cross-validation method name
         index_col: str
@@ -30,6 +44,10 @@ class FeatureSelection(Data):
             The target column name
         root_path : str
             Root path
+        data: pd.Dataframe
+            The spatial dataset, loaded from the dataset cache when empty
+        folds: List[str]
+            The folds to process, every fold when None
     """
 
     fs_method: str = "CFS"
@@ -38,82 +56,168 @@ class FeatureSelection(Data):
     fold_col: str = "INDEX_FOLDS"
     target_col: str = "TARGET"
     cols_remove: List =  field(default_factory=list)
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    folds: List[str] = None
     _data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _nodes: NodeIndex = None
+    _folds: FoldStore = None
+    _cfs_registered: bool = False
+    _stats: FoldStatistics = None
+    _stats_built: bool = False
 
     def _reorganize_cols(self, data) -> pd.DataFrame:
         """Position the target column in the dataset last position"""
         if self.cols_remove:
-            data.drop(columns=self.cols_remove, inplace=True)
+            data = data.drop(columns=self.cols_remove)
         cols = [c for c in data.columns if c != self.target_col]
         
         return data[cols + [self.target_col]]
 
-    def _cor_fs(self, data) -> List:
-        """Runs correlation based feature selections"""
-        cor = data.drop(columns=[self.target_col, self.fold_col]).corrwith(
-            data[self.target_col]
-        )
-        features = cor.nlargest(100)
-        return features.index.values.tolist()
-
     def _all_fs(self, data) -> List:
         """Select all data"""
         data.drop(columns=[self.target_col, self.fold_col], inplace=True)
         return data.columns.values.tolist()
 
-    def _weka_cfs(self, data) -> List:
-        """Runs the CFS method from WEKA"""
-        data_weka = create_instances_from_matrices(data.to_numpy())
-        data_weka.class_is_last()
-        search = ASSearch(
-            classname="weka.attributeSelection.BestFirst",
-            options=["-D", "1", "-N", "5"],
+    def _weka_cfs(self, rows) -> List:
+        """Runs the CFS method from WEKA on the given rows, in the CFS worker
+        holding the JVM and the dataset"""
+        selector = get_cfs_selector()
+        if not self._cfs_registered:
+            selector.register(self.root_path, self._data)
+            self._cfs_registered = True
+        return selector.select(self.root_path, rows)
+
+    def _numpy_cfs(self, data) -> List:
+        """Runs the NumPy CFS method, selecting as Weka CFS over every column"""
+        features = data.drop(columns=[self.target_col])
+        selected = cfs(
+            features.to_numpy(dtype=np.float64),
+            data[self.target_col].to_numpy(dtype=np.float64),
         )
-        evaluator = ASEvaluation(
-            classname="weka.attributeSelection.CfsSubsetEval",
-            options=["-P", "1", "-E", "1"],
+        return features.columns[selected].tolist()
+
+    def _get_statistics(self) -> Optional[FoldStatistics]:
+        """Return the cross-products of the dataset columns with the target,
+        computed once for every fold, or None when values are missing"""
+        if not self._stats_built:
+            self._stats_built = True
+            target = self._data.columns.get_loc(self.target_col)
+            self._stats = FoldStatistics.from_frame(self._data, targets=[target])
+        return self._stats
+
+    def _batched_cor_fs(self, folds) -> Dict[str, List]:
+        """Runs the correlation based feature selection of every fold at once,
+        from the products of the fold training masks with the feature matrix"""
+        if not folds:
+            return {}
+        features = self._data.drop(columns=[self.target_col, self.fold_col])
+        correlations = fold_correlations(
+            self._folds.masks("train", folds),
+            features.to_numpy(dtype=np.float64),
+            self._data[self.target_col].to_numpy(dtype=np.float64),
         )
-        attsel = AttributeSelection()
-        attsel.search(search)
-        attsel.evaluator(evaluator)
-        attsel.select_attributes(data_weka)
-        index_fs = [i - 1 for i in attsel.selected_attributes]
-        return data.columns.values[index_fs].tolist()
+        return {
+            fold: features.columns[top].tolist()
+            for fold, top in zip(folds, top_columns(correlations, 100))
+        }
 
-    def _save_selected_features(self, features, fold):
-        """Save the list of selected features in a json file"""
+    def _fold_numpy_cfs(self, rows) -> List:
+        """Runs the NumPy CFS method on the given rows, with correlations
+        downdated from the dataset cross-products"""
+        stats = self._get_statistics()
+        if stats is None:
+            return self._numpy_cfs(self._data.take(rows))
+        corr = CfsCorrelations.from_fold(stats.fold(rows))
+        return [stats.columns[feature] for feature in search(corr)]
+
+    @staticmethod
+    def _write_selected_features(features, filepath):
+        """Write the list of selected features in a json file"""
         json_features = {"selected_features": features}
-        with open(
-            os.path.join(self.cur_dir, f"{fold}.json"), "w", encoding="utf-8"
-        ) as file:
+        with open(filepath, "w", encoding="utf-8") as file:
             json.dump(json_features, file, indent=4)
 
+    def _save_selected_features(self, features, fold):
+        """Save the list of selected features in a json file"""
+        if self.results is not None:
+            self.results.selected_features[fold] = features
+        self._persist(
+            self._write_selected_features,
+            features,
+            os.path.join(self.cur_dir, f"{fold}.json"),
+        )
+
+    def _write_fold_features(self, fold_features: Dict[str, List]):
+        """Write the selected features json file of every fold"""
+        for fold, features in fold_features.items():
+            self._write_selected_features(
+                features, os.path.join(self.cur_dir, f"{fold}.json")
+            )
+
+    def _save_fold_features(self, fold_features: Dict[str, List]):
+        """Save the selected features of every fold in one step"""
+        if self.results is not None:
+            self.results.selected_features.update(fold_features)
+        self._persist(self._write_fold_features, fold_features)
+
+    def _load_selected_features(self, fold) -> List:
+        """Load the features selected for the fold in a previous run"""
+        features = get_selected_features(None, self.cur_dir, fold)
+        if self.results is not None:
+            self.results.selected_features[fold] = features
+        return features
+
     def run(self):
-        """Runs the feature selection per fold"""
-        self._data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
-        self._data.set_index(self.index_col, inplace=True)
-        self._data = self._reorganize_cols(self._data)
+        """Runs the feature selection per fold, skipping the folds whose inputs
+        did not change since the last run"""
+        data = load_dataset(self.root_path, self.index_col, self.data)
+        self._data = self._reorganize_cols(data)
+        self._nodes = NodeIndex.from_data(self._data)
 
         self._make_folders(
             ["results", self.scv_method, "features_selected", self.fs_method]
         )
         folds_path = os.path.join(self.root_path, "folds", self.scv_method)
-        folds_name = self._get_folders_in_dir(folds_path)
-      
-        for fold in tqdm(folds_name, desc="Selecting Features"):
-            split_fold_idx = utils.load_json(
-                os.path.join(folds_path, fold, "split_data.json")
-            )
-            training_data = self._data.loc[split_fold_idx["train"]].copy()
+        self._folds = get_fold_store(self.results, folds_path, self._nodes)
+        folds_name = filter_folds(self._folds.get_folds(), self.folds)
+        folds_key = get_stage_cache(self.results, folds_path).get_key(
+            FOLD_STORE_ARTIFACT
+        )
+        cache = get_stage_cache(self.results, self.cur_dir)
+        fold_keys = {
+            fold: stage_key(folds_key, fold, self.fs_method, self.cols_remove)
+            for fold in folds_name
+        }
+        fold_features = {
+            fold: self._load_selected_features(fold)
+            for fold, key in fold_keys.items()
+            if cache.is_cached(fold, key, f"{fold}.json")
+        }
+        pending = [fold for fold in folds_name if fold not in fold_features]
+        if self.fs_method == "Pearson":
+            # Every fold is ranked at once and written in a single step
+            selected = self._batched_cor_fs(pending)
+            fold_features.update(selected)
+            if selected:
+                self._save_fold_features(selected)
+                keys = {}
+                for fold in selected:
+                    keys.update(cache.record(fold, fold_keys[fold]))
+                self._persist(cache.write, keys)
+            pending = []
+        for fold in tqdm(pending, desc="Selecting Features"):
+            training_rows = self._folds.positions(fold, "train")
             if self.fs_method == "CFS":
-                selected_features = self._weka_cfs(training_data)
-            elif self.fs_method == "Pearson":
-                selected_features = self._cor_fs(training_data)
+                selected_features = self._weka_cfs(training_rows)
+            elif self.fs_method == "NumpyCFS":
+                selected_features = self._fold_numpy_cfs(training_rows)
             elif self.fs_method == "All":
-                selected_features = self._all_fs(training_data)
+                selected_features = self._all_fs(self._data.take(training_rows))
             else:
                 continue
+            fold_features[fold] = selected_features
             self._save_selected_features(selected_features, fold)
-
-        if self.fs_method == "CFS":
-            jvm.stop()
+            self._persist(cache.write, cache.record(fold, fold_keys[fold]))
+        return {
+            fold: fold_features[fold] for fold in folds_name if fold in fold_features
+        }
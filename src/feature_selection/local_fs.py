@@ -1,15 +1,72 @@
 """Feature selection process"""
 import os
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
-from weka.core import jvm
-from weka.attribute_selection import ASEvaluation, ASSearch, AttributeSelection
-from weka.core.dataset import create_instances_from_matrices
 from src.data import Data
-from src import utils
+from src.dataset import DATA_FILENAME, load_dataset
+from src.feature_selection.cfs import cfs
+from src.feature_selection.cfs_worker import get_cfs_selector, reset_cfs_selector
+from src.fold_store import FoldStore, load_fold_store
+from src.node_index import NodeIndex
+from src.stage_cache import file_fingerprint, fingerprint
+
+# Folder of the selections of each distinct context training set
+CONTEXTS_FOLDER = "contexts"
+
+_WORKER_FS = None
+
+
+def context_key(data_key, fs_method: str, columns, rows) -> str:
+    """Return the key of a context selection: the dataset, the method, the
+    columns and the context's actual training rows"""
+    inputs = [data_key, fs_method, [str(col) for col in columns]]
+    digest = hashlib.sha1(json.dumps(inputs).encode())
+    digest.update(np.sort(np.asarray(rows, dtype=np.int64)).tobytes())
+    return digest.hexdigest()
+
+
+def load_context_features(method_path: str, key: str) -> Optional[List]:
+    """Return the features selected for a context training set in a previous
+    run, None if there is none"""
+    filepath = os.path.join(method_path, CONTEXTS_FOLDER, f"{key}.json")
+    if not os.path.isfile(filepath):
+        return None
+    with open(filepath, encoding="utf-8") as file:
+        return json.load(file)["selected_features"]
+
+
+def save_context_features(method_path: str, key: str, features: List):
+    """Save the features selected for a context training set"""
+    contexts_path = os.path.join(method_path, CONTEXTS_FOLDER)
+    os.makedirs(contexts_path, exist_ok=True)
+    filepath = os.path.join(contexts_path, f"{key}.json")
+    # Write then rename, so concurrent jobs never read a partial file
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump({"selected_features": features}, file, indent=4)
+    os.replace(tmp_path, filepath)
+
+
+def _init_worker(feature_selection):
+    """Keep the feature selection instance shared by every context run in the
+    worker"""
+    global _WORKER_FS
+    _WORKER_FS = feature_selection
+    _WORKER_FS._cfs_registered = False
+    # A selector forked from the parent is the parent's CfsWorker, whose
+    # process and queues are not this worker's own
+    reset_cfs_selector()
+
+
+def _select_worker_context(key, rows):
+    """Select the features of a context with the worker instance"""
+    return key, _WORKER_FS._select_context(rows)
 
 
 @dataclass
@@ -19,7 +76,8 @@ class FeatureSelection(Data):
      Attributes
     ----------
         fs_method:str
-            The feature selection method name
+            The feature selection method name: CFS, NumpyCFS, Pearson or All,
+            suffixed by _Local to select features per context
         scv_method:str
             The spatial cross-validation method name
         index_col: str
@@ -30,6 +88,11 @@ class FeatureSelection(Data):
             The target column name
         root_path : str
             Root path
+        data: pd.Dataframe
+            The spatial dataset, loaded from the dataset cache when empty
+        n_jobs: int
+            The number of processes selecting the context features in
+            parallel, -1 to use all the cores
     """
 
     fs_method: str = "CFS"
@@ -37,7 +100,12 @@ class FeatureSelection(Data):
     index_col: str = "INDEX"
     fold_col: str = "INDEX_FOLDS"
     target_col: str = "TARGET"
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    n_jobs: int = 1
     _data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _nodes: NodeIndex = None
+    _folds: FoldStore = None
+    _cfs_registered: bool = False
 
     def _target_as_last_col(self, data) -> pd.DataFrame:
         """Position the target column in the dataset last position"""
@@ -57,25 +125,23 @@ class FeatureSelection(Data):
         data.drop(columns=[self.target_col], inplace=True)
         return data.columns.values.tolist()
 
-    def _weka_cfs(self, data) -> List:
-        """Runs the CFS method from WEKA"""
-        data = self._target_as_last_col(data)
-        data_weka = create_instances_from_matrices(data.to_numpy())
-        data_weka.class_is_last()
-        search = ASSearch(
-            classname="weka.attributeSelection.BestFirst",
-            options=["-D", "1", "-N", "5"],
-        )
-        evaluator = ASEvaluation(
-            classname="weka.attributeSelection.CfsSubsetEval",
-            options=["-P", "1", "-E", "1"],
+    def _weka_cfs(self, rows) -> List:
+        """Runs the CFS method from WEKA on the given rows, in the CFS worker
+        holding the JVM and the dataset"""
+        selector = get_cfs_selector()
+        if not self._cfs_registered:
+            selector.register(self.root_path, self._target_as_last_col(self._data))
+            self._cfs_registered = True
+        return selector.select(self.root_path, rows)
+
+    def _numpy_cfs(self, data) -> List:
+        """Runs the NumPy CFS method, selecting as Weka CFS over every column"""
+        features = data.drop(columns=[self.target_col])
+        selected = cfs(
+            features.to_numpy(dtype=np.float64),
+            data[self.target_col].to_numpy(dtype=np.float64),
         )
-        attsel = AttributeSelection()
-        attsel.search(search)
-        attsel.evaluator(evaluator)
-        attsel.select_attributes(data_weka)
-        index_fs = [i - 1 for i in attsel.selected_attributes]
-        return data.columns.values[index_fs].tolist()
+        return features.columns[selected].tolist()
 
     def _save_selected_features(self, features, fold):
         """Save the list of selected features in a json file"""
@@ -85,67 +151,131 @@ class FeatureSelection(Data):
         ) as file:
             json.dump(json_features, file, indent=4)
 
+    def _select_context(self, rows) -> Optional[List]:
+        """Select the features of a context from its training rows"""
+        if "NumpyCFS" in self.fs_method:
+            return self._numpy_cfs(self._data.take(rows))
+        if "CFS" in self.fs_method:
+            return self._weka_cfs(rows)
+        if "Pearson" in self.fs_method:
+            return self._cor_fs(self._data.take(rows))
+        if "All" in self.fs_method:
+            return self._all_fs(self._data.take(rows))
+        return None
+
+    def _get_data_key(self):
+        """Return the fingerprint of the dataset the contexts are taken from"""
+        if self.data is None or self.data.empty:
+            return file_fingerprint(os.path.join(self.root_path, DATA_FILENAME))
+        return fingerprint(self._data)
+
+    def _get_fold_contexts(self, folds_name) -> Dict[str, Dict]:
+        """Return the training rows of each context of each fold, along with
+        the key of the context training set"""
+        data_key = self._get_data_key()
+        node_contexts = self._data[self.fold_col].to_numpy()
+        fold_contexts = {}
+        for fold in folds_name:
+            training_rows = pd.Series(self._folds.positions(fold, "train"))
+            fold_contexts[fold] = {
+                context_id: (
+                    context_key(
+                        data_key, self.fs_method, self._data.columns, context_rows
+                    ),
+                    context_rows.to_numpy(),
+                )
+                for context_id, context_rows in training_rows.groupby(
+                    node_contexts[training_rows]
+                )
+            }
+        return fold_contexts
+
+    def _get_n_jobs(self, n_contexts) -> int:
+        """Return the number of processes to select the context features"""
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        return max(1, min(n_jobs or 1, n_contexts))
+
+    def _select_contexts(self, context_rows: Dict[str, np.ndarray]) -> Dict:
+        """Select the features of each distinct context training set. When
+        n_jobs is not 1, contexts run in a process pool, each worker holding a
+        copy of the instance with the read-only data"""
+        n_jobs = self._get_n_jobs(len(context_rows))
+        if n_jobs == 1:
+            return {
+                key: self._select_context(rows)
+                for key, rows in tqdm(context_rows.items(), desc="Selecting Features")
+            }
+        selections = {}
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            futures = [
+                executor.submit(_select_worker_context, key, rows)
+                for key, rows in context_rows.items()
+            ]
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Selecting Features"
+            ):
+                key, features = future.result()
+                selections[key] = features
+        return selections
+
+    def _run_local(self, folds_name):
+        """Runs the feature selection per context of each fold. A context is
+        selected once per distinct training set, as most outer folds share the
+        same context rows, and selections of previous runs are reused"""
+        method_path = self.cur_dir
+        fold_contexts = self._get_fold_contexts(folds_name)
+        selections, pending = {}, {}
+        for contexts in fold_contexts.values():
+            for key, rows in contexts.values():
+                if key in selections or key in pending:
+                    continue
+                features = load_context_features(method_path, key)
+                if features is None:
+                    pending[key] = rows
+                else:
+                    selections[key] = features
+        for key, features in self._select_contexts(pending).items():
+            if features is not None:
+                save_context_features(method_path, key, features)
+            selections[key] = features
+        for fold, contexts in fold_contexts.items():
+            self._mkdir(fold)
+            for context_id, (key, _) in contexts.items():
+                if selections[key] is not None:
+                    self._save_selected_features(selections[key], context_id)
+            self.cur_dir = method_path
+
     def run(self):
         """Runs the feature selection per fold"""
-        self._data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
-        reorganized_cols = [
-            col for col in self._data.columns if col not in [self.target_col]
-        ]
+        data = load_dataset(self.root_path, self.index_col, self.data)
+        reorganized_cols = [col for col in data.columns if col not in [self.target_col]]
         reorganized_cols.append(self.target_col)
-        self._data = self._data[reorganized_cols]
-        try:
-            self._data.drop(columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], inplace=True)
-        except KeyError:
-            pass
-        self._data.set_index(self.index_col, inplace=True)
-
-        if self.fs_method == "CFS":
-            self.logger_info("Starting JVM to execute Weka CFS.")
-            self.logger_warning("Some warnings may appear.")
-            jvm.start()
+        self._data = data[reorganized_cols].drop(
+            columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], errors="ignore"
+        )
+        self._nodes = NodeIndex.from_data(self._data)
+
         self._make_folders(
             ["results", self.scv_method, "features_selected", self.fs_method]
         )
         folds_path = os.path.join(self.root_path, "folds", self.scv_method)
-        folds_name = self._get_folders_in_dir(folds_path)
+        self._folds = load_fold_store(folds_path, self._nodes)
+        folds_name = self._folds.get_folds()
         if "Local" not in self.fs_method:
             for fold in tqdm(folds_name, desc="Selecting Features"):
-                split_fold_idx = utils.load_json(
-                    os.path.join(folds_path, fold, "split_data.json")
-                )
-                training_data = self._data.loc[split_fold_idx["train"]].copy()
+                training_rows = self._folds.positions(fold, "train")
                 if self.fs_method == "CFS":
-                    selected_features = self._weka_cfs(training_data)
+                    selected_features = self._weka_cfs(training_rows)
+                elif self.fs_method == "NumpyCFS":
+                    selected_features = self._numpy_cfs(self._data.take(training_rows))
                 elif self.fs_method == "Pearson":
-                    selected_features = self._cor_fs(training_data)
+                    selected_features = self._cor_fs(self._data.take(training_rows))
                 elif self.fs_method == "All":
-                    selected_features = self._all_fs(training_data)
+                    selected_features = self._all_fs(self._data.take(training_rows))
                 else:
                     continue
                 self._save_selected_features(selected_features, fold)
         else:
-            for fold in folds_name:
-                split_fold_idx = utils.load_json(
-                    os.path.join(folds_path, fold, "split_data.json")
-                )
-                training_data = self._data.loc[split_fold_idx["train"]].copy()
-                parent_dir = self.cur_dir
-                self._mkdir(fold)
-                for context_id, context_data in tqdm(
-                    training_data.groupby(self.fold_col), desc="Selecting Features"
-                ):
-                    context_data.drop([self.fold_col], axis=1)
-                    print(context_id)
-                    if "CFS" in self.fs_method:
-                        selected_features = self._weka_cfs(context_data)
-                    elif "Pearson" in self.fs_method:
-                        selected_features = self._cor_fs(context_data)
-                    elif "All" in self.fs_method:
-                        selected_features = self._all_fs(context_data)
-                    else:
-                        continue
-                    self._save_selected_features(selected_features, context_id)
-                self.cur_dir = parent_dir
-
-        if self.fs_method == "CFS":
-            jvm.stop()
+            self._run_local(folds_name)
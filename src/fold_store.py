@@ -0,0 +1,204 @@
+"""Columnar store of the spatial folds partitions"""
+import os
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from src.node_index import NodeIndex
+
+FOLD_STORE_FILENAME = "split_data.npz"
+SPLIT_JSON_FILENAME = "split_data.json"
+FOLD_BY_IDX_FILENAME = "fold_by_idx.csv"
+# The partition code of a node is its position in this list
+PARTITIONS = ["train", "test", "removing_buffer", "discarded"]
+DISCARDED = PARTITIONS.index("discarded")
+
+
+@dataclass
+class FoldStore:
+    """Represents the partitions of every fold of a spatial cross-validation.
+
+    A single (n_folds, n_nodes) int8 matrix holds the partition code of each
+    node in each fold, so a fold's train or test set is an integer index array
+    obtained with a vectorized comparison. The node folds are kept too, so the
+    fold index relation table of any fold can be derived.
+
+    Attributes
+    ----------
+        folds: np.ndarray
+            The fold name of each row
+        labels: pd.Index
+            The index label of each node column
+        codes: np.ndarray
+            The (n_folds, n_nodes) partition codes
+        node_folds: np.ndarray
+            The fold column value of each node
+    """
+
+    folds: np.ndarray = None
+    labels: pd.Index = field(default_factory=pd.Index)
+    codes: np.ndarray = None
+    node_folds: np.ndarray = None
+
+    @classmethod
+    def from_splits(
+        cls, labels, node_folds, fold_splits: Dict[str, Dict[str, np.ndarray]]
+    ) -> "FoldStore":
+        """Build the store from the partition positions of each fold"""
+        codes = np.full((len(fold_splits), len(labels)), DISCARDED, dtype=np.int8)
+        for row, split_positions in enumerate(fold_splits.values()):
+            for code, partition in enumerate(PARTITIONS):
+                codes[row, split_positions.get(partition, [])] = code
+        folds = np.array([str(fold) for fold in fold_splits], dtype=str)
+        return cls(
+            folds=folds,
+            labels=pd.Index(labels),
+            codes=codes,
+            node_folds=np.asarray(node_folds),
+        )
+
+    @classmethod
+    def from_json(cls, folds_path: str) -> "FoldStore":
+        """Build the store from the split_data.json and fold_by_idx.csv files of
+        each fold folder, as written by the former fold layout"""
+        fold_splits, labels, node_folds = {}, None, {}
+        for fold in sorted(os.listdir(folds_path)):
+            fold_path = os.path.join(folds_path, fold)
+            if not os.path.isfile(os.path.join(fold_path, SPLIT_JSON_FILENAME)):
+                continue
+            with open(
+                os.path.join(fold_path, SPLIT_JSON_FILENAME), encoding="utf-8"
+            ) as file:
+                split_data = json.load(file)
+            if labels is None:
+                labels = pd.Index(
+                    [
+                        label
+                        for partition in PARTITIONS
+                        for label in split_data[partition]
+                    ]
+                ).unique()
+            fold_splits[fold] = {
+                partition: labels.get_indexer(split_data[partition])
+                for partition in PARTITIONS
+            }
+            fold_idx_path = os.path.join(fold_path, FOLD_BY_IDX_FILENAME)
+            if os.path.isfile(fold_idx_path):
+                fold_idx = pd.read_csv(fold_idx_path, index_col=0).iloc[:, 0]
+                node_folds.update(fold_idx.to_dict())
+        if labels is None:
+            raise FileNotFoundError(f"No fold partitions found in {folds_path}")
+        node_folds = pd.Series(node_folds).reindex(labels).to_numpy()
+        return cls.from_splits(labels, node_folds, fold_splits)
+
+    @classmethod
+    def load(cls, folds_path: str) -> "FoldStore":
+        """Load the store of a spatial cross-validation folds folder, falling back
+        to the per fold json files when there is no store"""
+        filepath = os.path.join(folds_path, FOLD_STORE_FILENAME)
+        if not os.path.isfile(filepath):
+            return cls.from_json(folds_path)
+        with np.load(filepath, allow_pickle=True) as store:
+            return cls(
+                folds=store["folds"],
+                labels=pd.Index(store["labels"]),
+                codes=store["codes"],
+                node_folds=store["node_folds"],
+            )
+
+    def save(self, folds_path: str):
+        """Save the store as a compressed npz file in the folds folder"""
+        np.savez_compressed(
+            os.path.join(folds_path, FOLD_STORE_FILENAME),
+            folds=self.folds,
+            labels=self.labels.to_numpy(),
+            codes=self.codes,
+            node_folds=self.node_folds,
+        )
+
+    def align(self, node_index: NodeIndex) -> "FoldStore":
+        """Return the store with its node columns in the node index order. Nodes
+        missing from the store are discarded in every fold"""
+        if self.labels.equals(node_index.labels):
+            return self
+        positions = node_index.positions(self.labels)
+        codes = np.full((len(self.folds), len(node_index)), DISCARDED, dtype=np.int8)
+        codes[:, positions] = self.codes
+        node_folds = pd.Series(self.node_folds, index=positions)
+        node_folds = node_folds.reindex(np.arange(len(node_index))).to_numpy()
+        return FoldStore(
+            folds=self.folds,
+            labels=node_index.labels,
+            codes=codes,
+            node_folds=node_folds,
+        )
+
+    def get_folds(self) -> List[str]:
+        """Return the fold names"""
+        return self.folds.tolist()
+
+    def positions(self, fold, partition: str) -> np.ndarray:
+        """Return the node positions of a partition of the fold"""
+        row = np.flatnonzero(self.folds == str(fold))
+        if len(row) == 0:
+            raise KeyError(f"Fold not found in the fold store: {fold}")
+        return np.flatnonzero(self.codes[row[0]] == PARTITIONS.index(partition))
+
+    def masks(self, partition: str, folds=None) -> np.ndarray:
+        """Return the (n_folds, n_nodes) membership of the nodes in a partition
+        of the given folds, every fold by default"""
+        codes = self.codes
+        if folds is not None:
+            rows = pd.Index(self.folds).get_indexer([str(fold) for fold in folds])
+            if (rows < 0).any():
+                raise KeyError(f"Folds not found in the fold store: {folds}")
+            codes = codes[rows]
+        return codes == PARTITIONS.index(partition)
+
+    def sizes(self, partition: str) -> np.ndarray:
+        """Return the number of nodes in a partition of every fold"""
+        return np.count_nonzero(self.codes == PARTITIONS.index(partition), axis=1)
+
+    def count_node_folds(self, partition: str) -> np.ndarray:
+        """Return the number of distinct node folds in a partition of every fold"""
+        node_folds, uniques = pd.factorize(self.node_folds)
+        rows, cols = np.nonzero(self.codes == PARTITIONS.index(partition))
+        valid = node_folds[cols] >= 0
+        keys = rows[valid] * len(uniques) + node_folds[cols[valid]]
+        return np.bincount(
+            np.unique(keys) // max(len(uniques), 1), minlength=len(self.folds)
+        )
+
+    def get_labels(self, fold, partition: str) -> List:
+        """Return the index labels of a partition of the fold"""
+        return self.labels[self.positions(fold, partition)].tolist()
+
+    def get_split(self, fold) -> Dict[str, List]:
+        """Return the partitions labels of the fold as in split_data.json"""
+        return {partition: self.get_labels(fold, partition) for partition in PARTITIONS}
+
+    def get_fold_by_idx(self, fold, index_col: str = None) -> pd.Series:
+        """Return the fold index relation table of the fold training set"""
+        train = self.positions(fold, "train")
+        return pd.Series(
+            self.node_folds[train],
+            index=pd.Index(self.labels[train], name=index_col),
+        )
+
+    def export_json(self, folds_path: str, fold_col: str, index_col: str = None):
+        """Write the split_data.json and fold_by_idx.csv files of every fold"""
+        for fold in self.get_folds():
+            fold_path = os.path.join(folds_path, fold)
+            os.makedirs(fold_path, exist_ok=True)
+            with open(
+                os.path.join(fold_path, SPLIT_JSON_FILENAME), "w", encoding="utf-8"
+            ) as file:
+                json.dump(self.get_split(fold), file, indent=4)
+            fold_by_idx = self.get_fold_by_idx(fold, index_col).rename(fold_col)
+            fold_by_idx.to_csv(os.path.join(fold_path, FOLD_BY_IDX_FILENAME))
+
+
+def load_fold_store(folds_path: str, node_index: NodeIndex) -> FoldStore:
+    """Load the fold store of a folds folder aligned to the dataset node index"""
+    return FoldStore.load(folds_path).align(node_index)
@@ -0,0 +1,195 @@
+"""Sparse representation of the spatial adjacency graph"""
+import os
+import hashlib
+from dataclasses import dataclass, field
+from typing import Iterator, List
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from src.node_index import NodeIndex
+
+ADJ_MATRIX_FILENAME = "queen_matrix.csv"
+
+
+@dataclass
+class SpatialGraph:
+    """Represents the spatial adjacency graph as a scipy CSR matrix.
+
+    Each spatial object is a node identified by an integer position, and
+    ``nodes`` maps every position back to its index label. Neighbor queries
+    only touch the CSR rows of the queried nodes, so they cost O(degree)
+    instead of scanning a dense n x n table.
+
+    Attributes
+    ----------
+        matrix: sparse.csr_matrix
+            The binary adjacency matrix in CSR format
+        nodes: pd.Index
+            The index label of each node position
+    """
+
+    matrix: sparse.csr_matrix = None
+    nodes: pd.Index = field(default_factory=pd.Index)
+
+    @property
+    def n_nodes(self) -> int:
+        """Return the number of nodes in the graph"""
+        return len(self.nodes)
+
+    @staticmethod
+    def _cast_labels(labels, index_dtype) -> pd.Index:
+        """Cast the labels to the dataset index type"""
+        labels = pd.Index(labels)
+        if index_dtype is not None:
+            labels = labels.astype(index_dtype)
+        return labels
+
+    @classmethod
+    def _from_edges(cls, rows, cols, nodes) -> "SpatialGraph":
+        """Build the graph from (row, col) edge positions"""
+        valid = cols >= 0
+        rows, cols = rows[valid], cols[valid]
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int8), (rows, cols)),
+            shape=(len(nodes), len(nodes)),
+        )
+        matrix.sum_duplicates()
+        return cls(matrix=matrix, nodes=nodes)
+
+    @classmethod
+    def from_dataframe(cls, adj_matrix: pd.DataFrame, index_dtype=None):
+        """Build the graph from a dense adjacency matrix dataframe"""
+        nodes = cls._cast_labels(adj_matrix.index, index_dtype)
+        columns = cls._cast_labels(adj_matrix.columns, nodes.dtype)
+        col_pos = nodes.get_indexer(columns)
+        rows, cols = np.nonzero(adj_matrix.to_numpy() > 0)
+        return cls._from_edges(rows, col_pos[cols], nodes)
+
+    @classmethod
+    def from_csv(cls, filepath: str, index_dtype=None, chunksize: int = 1000):
+        """Build the graph from an adjacency matrix csv file, reading it in
+        chunks of rows so the dense matrix is never held in memory"""
+        rows, cols, labels = [], [], []
+        columns = None
+        for chunk in pd.read_csv(
+            filepath, index_col=0, chunksize=chunksize, low_memory=False
+        ):
+            chunk_rows, chunk_cols = np.nonzero(chunk.to_numpy() > 0)
+            rows.append(chunk_rows + len(labels))
+            cols.append(chunk_cols)
+            labels.extend(chunk.index)
+            columns = chunk.columns
+        nodes = cls._cast_labels(labels, index_dtype)
+        col_pos = nodes.get_indexer(cls._cast_labels(columns, nodes.dtype))
+        rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+        return cls._from_edges(rows, col_pos[cols], nodes)
+
+    def align(self, node_index: NodeIndex) -> "SpatialGraph":
+        """Return the graph with its nodes reordered to share the node index
+        positions. Nodes only present in the adjacency matrix are appended after
+        the dataset nodes, so a position is a dataset node iff it is lower than
+        the node index length"""
+        own_nodes = self._cast_labels(self.nodes, node_index.labels.dtype)
+        extra = own_nodes[~own_nodes.isin(node_index.labels)]
+        nodes = node_index.labels.append(extra)
+        new_positions = nodes.get_indexer(own_nodes)
+        edges = self.matrix.tocoo()
+        return self._from_edges(
+            new_positions[edges.row], new_positions[edges.col], nodes
+        )
+
+    def positions(self, labels) -> np.ndarray:
+        """Return the node positions of the given index labels"""
+        positions = self.nodes.get_indexer(labels)
+        if (positions < 0).any():
+            missing = pd.Index(labels)[positions < 0].tolist()
+            raise KeyError(f"Nodes not found in the adjacency matrix: {missing}")
+        return positions
+
+    def labels(self, positions) -> List:
+        """Return the index labels of the given node positions"""
+        return self.nodes[positions].tolist()
+
+    def neighbors(self, positions, mask: np.ndarray = None) -> np.ndarray:
+        """Return the 1-degree neighborhood positions from the sub-graph formed
+        by positions. If mask is given, only the nodes flagged in it are returned"""
+        positions = np.asarray(positions, dtype=np.int64)
+        candidates = np.unique(self.matrix[positions].indices)
+        candidates = candidates[~np.isin(candidates, positions)]
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        return candidates
+
+    def bfs_levels(self, sources, mask: np.ndarray = None) -> np.ndarray:
+        """Return the hop level of every node from a frontier-based multi-source
+        BFS rooted at the sources positions, in O(V+E). Unreached nodes get -1.
+        If mask is given, the traversal only walks through the nodes flagged in it"""
+        levels = np.full(self.n_nodes, -1, dtype=np.int32)
+        frontier = np.unique(np.asarray(sources, dtype=np.int64))
+        levels[frontier] = 0
+        level = 0
+        while len(frontier) > 0:
+            level += 1
+            neighbors = self.matrix[frontier].indices
+            neighbors = neighbors[levels[neighbors] < 0]
+            if mask is not None:
+                neighbors = neighbors[mask[neighbors]]
+            frontier = np.unique(neighbors)
+            levels[frontier] = level
+        return levels
+
+    @staticmethod
+    def _remove_entries(matrix, *others) -> sparse.csr_matrix:
+        """Return the binary matrix without the entries flagged in the others"""
+        for other in others:
+            matrix = matrix - matrix.multiply(other)
+        matrix.eliminate_zeros()
+        return matrix.tocsr()
+
+    def lag_rings(self, sources) -> Iterator[sparse.csr_matrix]:
+        """Yield, for lag 1, 2, ..., the (n_sources, n_nodes) sparse matrix that
+        flags the nodes exactly lag hops away from each source. The ring of lag
+        k+1 is the set reached from the ring of lag k minus the rings k and k-1,
+        which holds since the adjacency graph is undirected"""
+        sources = np.asarray(sources, dtype=np.int64)
+        adjacency = self.matrix.astype(np.int32)
+        ones = np.ones(len(sources), dtype=np.int32)
+        previous = sparse.csr_matrix(
+            (ones, (np.arange(len(sources)), sources)),
+            shape=(len(sources), self.n_nodes),
+        )
+        ring = self._remove_entries(adjacency[sources], previous)
+        while True:
+            yield ring
+            reached = ring @ adjacency
+            reached.data[:] = 1
+            previous, ring = ring, self._remove_entries(reached, ring, previous)
+
+    def fingerprint(self) -> str:
+        """Return a hash of the nodes and edges, used to key the graph caches"""
+        digest = hashlib.sha1()
+        digest.update(pd.util.hash_array(np.asarray(self.nodes)).tobytes())
+        digest.update(np.asarray(self.matrix.indptr, dtype=np.int64).tobytes())
+        digest.update(np.asarray(self.matrix.indices, dtype=np.int64).tobytes())
+        return digest.hexdigest()
+
+    def get_neighbors(self, indexes) -> List:
+        """Return the 1-degree neighborhood labels from a sub-graph formed by indexes"""
+        return self.labels(self.neighbors(self.positions(indexes)))
+
+
+def load_graph(adj_matrix, root_path: str, node_index: NodeIndex) -> SpatialGraph:
+    """Return the spatial graph for the adjacency matrix aligned to the dataset
+    node index. When no matrix is given it is built straight from the
+    queen_matrix.csv file in root_path"""
+    index_dtype = node_index.labels.dtype
+    if isinstance(adj_matrix, SpatialGraph):
+        graph = adj_matrix
+    elif adj_matrix is None or adj_matrix.empty:
+        graph = SpatialGraph.from_csv(
+            os.path.join(root_path, ADJ_MATRIX_FILENAME), index_dtype
+        )
+    else:
+        graph = SpatialGraph.from_dataframe(adj_matrix, index_dtype)
+    return graph.align(node_index)
@@ -0,0 +1,92 @@
+"""Hop distances from each spatial fold to every node of the graph"""
+import os
+import hashlib
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from src.graph import SpatialGraph
+
+HOP_CACHE_FOLDER = "cache"
+
+
+@dataclass
+class HopDistances:
+    """Represents the hop distance of every graph node to each fold.
+
+    Row i of distances holds the BFS hop level of every node position from the
+    nodes of folds[i], so the k-degree ring of a fold is a vectorized comparison
+    over a single row. Nodes unreachable from the fold get -1.
+
+    Attributes
+    ----------
+        folds: np.ndarray
+            The fold name of each row
+        distances: np.ndarray
+            The (n_folds, n_nodes) hop distances
+    """
+
+    folds: np.ndarray = None
+    distances: np.ndarray = None
+
+    @classmethod
+    def compute(cls, graph: SpatialGraph, node_folds: np.ndarray) -> "HopDistances":
+        """Run one multi-source BFS per fold, node_folds holding the fold of each
+        dataset node position"""
+        node_folds = np.asarray(node_folds)
+        folds = np.unique(node_folds)
+        distances = np.empty((len(folds), graph.n_nodes), dtype=np.int16)
+        for row, fold in enumerate(folds):
+            levels = graph.bfs_levels(np.flatnonzero(node_folds == fold))
+            # Levels are kept in int16 unless a graph is deeper than it holds
+            if levels.size and levels.max() > np.iinfo(distances.dtype).max:
+                distances = distances.astype(np.int32)
+            distances[row] = levels
+        return cls(folds=folds, distances=distances)
+
+    @classmethod
+    def load(cls, filepath: str) -> "HopDistances":
+        """Load the hop distances from a npz file"""
+        with np.load(filepath) as cache:
+            return cls(folds=cache["folds"], distances=cache["distances"])
+
+    def save(self, filepath: str):
+        """Save the hop distances as a compressed npz file"""
+        np.savez_compressed(filepath, folds=self.folds, distances=self.distances)
+
+    def levels(self, fold) -> np.ndarray:
+        """Return the hop distance of every node to the fold"""
+        row = np.flatnonzero(self.folds == np.asarray(fold, dtype=self.folds.dtype))
+        if len(row) == 0:
+            raise KeyError(f"Fold not found in the hop distances: {fold}")
+        return self.distances[row[0]]
+
+    def ring(self, fold, degree: int) -> np.ndarray:
+        """Return the node positions exactly degree hops away from the fold"""
+        return np.flatnonzero(self.levels(fold) == degree)
+
+    def within(self, fold, degree: int) -> np.ndarray:
+        """Return the node positions from 1 up to degree hops away from the fold"""
+        levels = self.levels(fold)
+        return np.flatnonzero((levels > 0) & (levels <= degree))
+
+
+def load_hop_distances(
+    graph: SpatialGraph, node_folds: np.ndarray, root_path: str
+) -> HopDistances:
+    """Return the fold hop distances of the graph. They are cached in the root
+    path keyed by the graph and fold assignment hashes, so only the first run
+    over a dataset pays the BFS cost"""
+    folds_hash = hashlib.sha1(pd.util.hash_array(np.asarray(node_folds)).tobytes())
+    filename = f"hop_distances_{graph.fingerprint()[:16]}"
+    filename += f"_{folds_hash.hexdigest()[:16]}.npz"
+    cache_dir = os.path.join(root_path, HOP_CACHE_FOLDER)
+    filepath = os.path.join(cache_dir, filename)
+    if os.path.isfile(filepath):
+        return HopDistances.load(filepath)
+    hops = HopDistances.compute(graph, node_folds)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write then rename, so concurrent runs never read a partial file
+    tmp_path = filepath.replace(".npz", f".{os.getpid()}.tmp.npz")
+    hops.save(tmp_path)
+    os.replace(tmp_path, filepath)
+    return hops
@@ -0,0 +1,111 @@
+"""Bounded pool of pre-warmed worker processes running experiment jobs"""
+import os
+import logging
+import importlib
+import traceback
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+from tqdm import tqdm
+
+
+@dataclass
+class Job:
+    """Represents a job run by a worker process.
+
+    Attributes
+    ----------
+        function: Callable
+            The module level function run by the job
+        args: Tuple
+            The positional arguments of the function
+        kwargs: Dict
+            The keyword arguments of the function
+        name: str
+            The job name shown when it fails
+    """
+
+    function: Callable = None
+    args: Tuple = ()
+    kwargs: Dict = field(default_factory=dict)
+    name: str = None
+
+
+def _warm_worker(modules: List[str]):
+    """Import the heavy libraries once per worker, before its first job"""
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _run_job(job: Job) -> int:
+    """Run a job, returning its exit code as a subprocess would"""
+    try:
+        job.function(*job.args, **job.kwargs)
+    except SystemExit as error:
+        if error.code is None or isinstance(error.code, int):
+            return error.code or 0
+        return 1
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+@dataclass
+class JobRunner:
+    """Represents a queue of jobs run by a bounded pool of worker processes.
+
+    Unlike one shell subprocess per job, at most n_jobs workers run at once,
+    and each worker imports the libraries a single time and then takes jobs
+    from the queue until it is empty.
+
+    Attributes
+    ----------
+        n_jobs: int
+            The number of worker processes, -1 to use all the cores
+        modules: List[str]
+            The modules imported by each worker when it starts
+        max_jobs_per_worker: int
+            The number of jobs after which a worker is replaced, None to keep
+            the workers for the whole run
+        jobs: List[Job]
+            The jobs waiting to run
+    """
+
+    n_jobs: int = -1
+    modules: List[str] = field(default_factory=list)
+    max_jobs_per_worker: int = None
+    jobs: List[Job] = field(default_factory=list)
+
+    def submit(self, function: Callable, *args, name: str = None, **kwargs):
+        """Queue a call of the function"""
+        name = name or getattr(function, "__name__", str(function))
+        self.jobs.append(Job(function=function, args=args, kwargs=kwargs, name=name))
+
+    def _get_n_jobs(self, n_tasks: int) -> int:
+        """Return the number of worker processes"""
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        return max(1, min(n_jobs or 1, n_tasks))
+
+    def run(self) -> List[int]:
+        """Run the queued jobs, returning their exit codes in submission order"""
+        jobs, self.jobs = self.jobs, []
+        if not jobs:
+            return []
+        with multiprocessing.Pool(
+            self._get_n_jobs(len(jobs)),
+            initializer=_warm_worker,
+            initargs=(self.modules,),
+            maxtasksperchild=self.max_jobs_per_worker,
+        ) as pool:
+            exit_codes = list(
+                tqdm(
+                    pool.imap(_run_job, jobs, chunksize=1),
+                    total=len(jobs),
+                    desc="Running jobs",
+                )
+            )
+        for job, exit_code in zip(jobs, exit_codes):
+            if exit_code != 0:
+                logging.warning("Job %s exited with code %s", job.name, exit_code)
+        return exit_codes
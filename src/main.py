@@ -1,9 +1,11 @@
 """Main script"""
 import os
 from pathlib import Path
-import pandas as pd
 from src import utils
+from src.dataset import load_dataset
+from src.graph import SpatialGraph, ADJ_MATRIX_FILENAME
 from src.pipeline import Pipeline
+from src.weights import SparseWeights, W_MATRIX_FILENAME
 from src.visualization.performance import VizMetrics
 from src.visualization.dependence import VizDependence
 
@@ -26,21 +28,16 @@ def main():
     # Load enviromental variables
     env_var = utils.load_env_variables(project_dir)
     # Load data
-    path = os.path.join(env_var["root_path"], "data.csv")
-    data = pd.read_csv(path, index_col="INDEX", low_memory=False)
-    try:
-        data.drop(columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], inplace=True)
-    except KeyError:
-        pass
-    # Load adjacency matrix
-    adj_matrix = pd.read_csv(
-        os.path.join(env_var["root_path"], "queen_matrix.csv"), low_memory=False
+    # The pipeline leaves the coordinates out of the spatial cross-validation only
+    data = load_dataset(env_var["root_path"], "INDEX")
+    # Load adjacency matrix as a sparse graph
+    adj_matrix = SpatialGraph.from_csv(
+        os.path.join(env_var["root_path"], ADJ_MATRIX_FILENAME), data.index.dtype
     )
-    w_matrix = pd.read_csv(
-        os.path.join(env_var["root_path"], "normd_matrix.csv"), low_memory=False
+    # Load weights matrix keeping only its non-zero entries
+    w_matrix = SparseWeights.from_csv(
+        os.path.join(env_var["root_path"], W_MATRIX_FILENAME), data.index.dtype
     )
-    adj_matrix.set_index(adj_matrix.columns[0], inplace=True)
-    w_matrix.set_index(w_matrix.columns[0], inplace=True)
     # Instanciate pipeline
     pipeline = Pipeline(
         root_path=env_var["root_path"],
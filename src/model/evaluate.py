@@ -1,12 +1,18 @@
 """Predict data process"""
 import os
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, List, Union
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
-from sklearn.metrics import mean_squared_error
 from src.data import Data
-import src.utils as utils
+from src.fold_store import FoldStore
+from src.results import (
+    get_fold_store,
+    get_ml_methods,
+    get_selected_features,
+    get_stage_cache,
+)
+from src.stage_cache import METRICS_ARTIFACT, combine_keys
 
 PRED_COL = "PREDICTIONS"
 GROUND_TRUTH_COL = "GROUND_TRUTH"
@@ -18,8 +24,9 @@ class Evaluate(Data):
 
      Attributes
     ----------
-        ml_method:str
-            The machine learning method name
+        ml_method: Union[str, List[str]]
+            The machine learning method name, or a list of methods evaluated
+            one after the other
         fs_method:str
             The feature selection method name
         scv_method:str
@@ -30,115 +37,114 @@ class Evaluate(Data):
             Root path
     """
 
-    ml_method: str = "LGBM"
+    ml_method: Union[str, List[str]] = "LGBM"
     fs_method: str = "CFS"
     scv_method: str = "gbscv"
     index_col: str = "INDEX"
     predictions: pd.DataFrame = field(default_factory=pd.DataFrame)
-    train: pd.DataFrame = field(default_factory=pd.DataFrame)
-    test: pd.DataFrame = field(default_factory=pd.DataFrame)
-    fold_idx: pd.DataFrame = field(default_factory=pd.DataFrame)
     selected_features: Dict = field(default_factory=dict)
     metrics: Dict = field(default_factory=dict)
+    _folds: FoldStore = None
 
     def _init_fields(self):
         self.metrics = {}
 
-    def _read_predictions(self, data_path):
-        """Read the prediction data"""
-        self.predictions = pd.read_csv(data_path, index_col=self.index_col)
-
-    def _read_train(self, json_path, data):
-        """Read the train data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self.train = data.loc[split_fold_idx["train"]].copy()
-
-    def _read_test(self, json_path, data):
-        """Read the test data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self.test = data.loc[split_fold_idx["test"]].copy()
+    def _read_fold_predictions(self, pred_path, fold, ml_method) -> pd.DataFrame:
+        """Read the predictions of the fold, from the stage results when in memory"""
+        predictions = (
+            {} if self.results is None else self.results.predictions.get(ml_method, {})
+        )
+        if fold in predictions:
+            return predictions[fold][[GROUND_TRUTH_COL, PRED_COL]]
+        return pd.read_csv(
+            os.path.join(pred_path, f"{fold}.csv"),
+            usecols=[GROUND_TRUTH_COL, PRED_COL],
+        )
 
-    def _read_fold_idx_table(self, data_path):
-        """Read the fold_by_idx data"""
-        self.fold_idx = pd.read_csv(
-            os.path.join(data_path, "fold_by_idx.csv"), index_col=self.index_col
+    def _read_predictions(self, pred_path, folds: List[str], ml_method):
+        """Read the predictions of every fold in a single frame indexed by fold"""
+        self.predictions = pd.concat(
+            [self._read_fold_predictions(pred_path, fold, ml_method) for fold in folds],
+            keys=folds,
+            names=["FOLD"],
         )
 
-    def _read_fs(self, data_path):
-        """Read selected features json file"""
-        self.selected_features = utils.load_json(data_path)
-
-    @staticmethod
-    def _init_metrics_dict():
-        return {
-            "FOLD": [],
-            "TRAIN_N_FOLDS": [],
-            "TRAIN_SIZE": [],
-            "TEST_SIZE": [],
-            "N_FEATURES": [],
-            "RMSE": [],
+    def _read_fs(self, fs_path, folds: List[str]):
+        """Read the features selected for every fold"""
+        self.selected_features = {
+            fold: get_selected_features(self.results, fs_path, fold) for fold in folds
         }
 
-    def _initialize_data(self, folds_path, pred_path, fs_path, fold):
-        """Load all data"""
-        data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
-        data.set_index(self.index_col, inplace=True)
-        self._read_predictions(os.path.join(pred_path, f"{fold}.csv"))
-        self._read_train(os.path.join(folds_path, fold), data)
-        self._read_test(os.path.join(folds_path, fold), data)
-        self._read_fold_idx_table(os.path.join(folds_path, fold))
-        self._read_fs(os.path.join(fs_path, f"{fold}.json"))
-
-    def _get_fold_name(self, fold):
-        self.metrics["FOLD"].append(fold)
-
-    def _get_train_n_folds(self):
-        fold_col = self.fold_idx.columns[0]
-        self.metrics["TRAIN_N_FOLDS"].append(self.fold_idx[fold_col].nunique())
-
-    def _get_train_size(self):
-        self.metrics["TRAIN_SIZE"].append(self.train.shape[0])
-
-    def _get_test_size(self):
-        self.metrics["TEST_SIZE"].append(self.test.shape[0])
+    def _get_n_features(self, folds: List[str]) -> List[int]:
+        return [len(self.selected_features[fold]) for fold in folds]
+
+    def _get_rmse(self, folds: List[str]) -> np.ndarray:
+        """Return the mean squared error of each fold, as the former
+        mean_squared_error(squared=True) call"""
+        errors = self.predictions[GROUND_TRUTH_COL] - self.predictions[PRED_COL]
+        squared_errors = errors.pow(2).groupby(level="FOLD", sort=False).mean()
+        return squared_errors.reindex(folds).to_numpy()
+
+    def _calculatemetrics(self, folds: List[str]):
+        """Calculate the metrics of every fold. Sizes and number of training
+        folds come straight from the fold store partitions"""
+        self.metrics = {
+            "FOLD": folds,
+            "TRAIN_N_FOLDS": self._folds.count_node_folds("train"),
+            "TRAIN_SIZE": self._folds.sizes("train"),
+            "TEST_SIZE": self._folds.sizes("test"),
+            "N_FEATURES": self._get_n_features(folds),
+            "RMSE": self._get_rmse(folds),
+        }
 
-    def _get_n_features(self):
-        self.metrics["N_FEATURES"].append(
-            len(self.selected_features["selected_features"])
+    def _savemetrics(self, ml_method) -> pd.DataFrame:
+        metrics = pd.DataFrame(self.metrics)
+        if self.results is not None:
+            self.results.metrics[ml_method] = metrics
+        self._persist(
+            metrics.to_csv, os.path.join(self.cur_dir, "metrics.csv"), index=False
         )
+        return metrics
 
-    def _get_rmse(self):
-        y_true = self.predictions[GROUND_TRUTH_COL]
-        y_pred = self.predictions[PRED_COL]
-        rmse = mean_squared_error(y_true, y_pred, squared=True)
-        self.metrics["RMSE"].append(rmse)
-
-    def _calculatemetrics(self, fold):
-        self._get_fold_name(fold)
-        self._get_train_n_folds()
-        self._get_train_size()
-        self._get_test_size()
-        self._get_n_features()
-        self._get_rmse()
-
-    def _savemetrics(self):
-        metrics = pd.DataFrame(self.metrics)
-        metrics.to_csv(os.path.join(self.cur_dir, "metrics.csv"), index=False)
+    def _load_metrics(self, ml_method) -> pd.DataFrame:
+        """Load the metrics computed in a previous run"""
+        metrics = pd.read_csv(
+            os.path.join(self.cur_dir, "metrics.csv"), dtype={"FOLD": str}
+        )
+        if self.results is not None:
+            self.results.metrics[ml_method] = metrics
+        return metrics
 
-    def run(self):
-        """Runs the predicting process per fold"""
+    def _evaluate(self, ml_method) -> pd.DataFrame:
+        """Runs the evaluation of every fold predictions of the ML method at
+        once, unless no prediction changed since the last run"""
         self._make_folders(
-            ["results", self.scv_method, "evaluations", self.fs_method, self.ml_method,]
+            ["results", self.scv_method, "evaluations", self.fs_method, ml_method]
         )
         folds_path = os.path.join(self.root_path, "folds", self.scv_method)
         results_path = os.path.join(self.root_path, "results", self.scv_method)
         fs_path = os.path.join(results_path, "features_selected", self.fs_method)
-        pred_path = os.path.join(
-            results_path, "predictions", self.fs_method, self.ml_method
-        )
-        folds_name = self._get_folders_in_dir(folds_path)
-        self.metrics = self._init_metrics_dict()
-        for fold in tqdm(folds_name, desc="Evaluating predictions"):
-            self._initialize_data(folds_path, pred_path, fs_path, fold)
-            self._calculatemetrics(fold)
-            self._savemetrics()
+        pred_path = os.path.join(results_path, "predictions", self.fs_method, ml_method)
+        self._folds = get_fold_store(self.results, folds_path)
+        folds_name = self._folds.get_folds()
+        pred_cache = get_stage_cache(self.results, pred_path)
+        key = combine_keys(pred_cache.get_key(fold) for fold in folds_name)
+        cache = get_stage_cache(self.results, self.cur_dir)
+        if cache.is_cached(METRICS_ARTIFACT, key, "metrics.csv"):
+            return self._load_metrics(ml_method)
+        self._read_predictions(pred_path, folds_name, ml_method)
+        self._read_fs(fs_path, folds_name)
+        self._calculatemetrics(folds_name)
+        metrics = self._savemetrics(ml_method)
+        self._persist(cache.write, cache.record(METRICS_ARTIFACT, key))
+        return metrics
+
+    def run(self):
+        """Runs the evaluation of each ML method"""
+        metrics = {
+            ml_method: self._evaluate(ml_method)
+            for ml_method in get_ml_methods(self.ml_method)
+        }
+        if isinstance(self.ml_method, str):
+            return metrics[self.ml_method]
+        return metrics
@@ -11,6 +11,9 @@ import pandas as pd
 import numpy as np
 from tqdm import tqdm
 from src.data import Data
+from src.dataset import load_dataset
+from src.fold_store import FoldStore, load_fold_store
+from src.node_index import NodeIndex
 import src.utils as utils
 
 PRED_COL = "PREDICTIONS"
@@ -35,6 +38,8 @@ class Predict(Data):
             The target column name
         root_path : str
             Root path
+        data: pd.Dataframe
+            The spatial dataset, loaded from the dataset cache when empty
     """
 
     ml_method: str = "LGBM"
@@ -42,19 +47,20 @@ class Predict(Data):
     scv_method: str = "gbscv"
     index_col: str = "INDEX"
     target_col: str = "TARGET"
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
     test_data: pd.DataFrame = field(default_factory=pd.DataFrame)
     train_data: pd.DataFrame = field(default_factory=pd.DataFrame)
     predictions: List = field(default_factory=list)
+    _nodes: NodeIndex = None
+    _folds: FoldStore = None
 
-    def _read_test_data(self, json_path, data):
-        """Read the training data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self.test_data = data.loc[split_fold_idx["test"]].copy()
+    def _read_test_data(self, fold, data):
+        """Read the test data"""
+        self.test_data = data.take(self._folds.positions(fold, "test"))
 
-    def _read_train_data(self, json_path, data):
+    def _read_train_data(self, fold, data):
         """Read the training data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self.train_data = data.loc[split_fold_idx["train"]].copy()
+        self.train_data = data.take(self._folds.positions(fold, "train"))
 
     def _selected_features_filtering(self, json_path):
         """Filter only the features selected"""
@@ -102,28 +108,31 @@ class Predict(Data):
         pca.fit(data)
         return pca.transform(data).flatten()
 
-    def _calculate_similarity_matrix(self, pca_test, pca_train) -> np.ndarray:
-        """Calculate the similarity matrix between test set and a given training
-        fold set based on a given attribute"""
-        return np.subtract.outer(pca_test, pca_train) ** 2
-
     @staticmethod
-    def _calculate_gamma(similarity, weights) -> np.float64:
-        """Calculate gamma or the semivariogram"""
-        similarity = np.multiply(similarity, weights.to_numpy())
-        gamma_dist = np.sum(similarity, axis=1)
-        sum_diff = gamma_dist.sum()
-        # sum_dist = similarity.size
-        sum_dist = weights.to_numpy().sum()
+    def _calculate_gamma(pca_test, pca_train, weights) -> np.float64:
+        """Calculate gamma or the weighted semivariogram between the test set and
+        a given training fold set. The weighted sum of squared differences is
+        expanded into row and column weight sums, so no test x train difference
+        matrix is built"""
+        weights = np.asarray(weights)
+        # Centering on the test mean avoids cancellation on the expanded sum
+        center = pca_test.mean()
+        pca_test, pca_train = pca_test - center, pca_train - center
+        sum_diff = (
+            weights.sum(axis=1) @ pca_test**2
+            + weights.sum(axis=0) @ pca_train**2
+            - 2 * pca_test @ weights @ pca_train
+        )
+        sum_dist = weights.sum()
         return sum_diff / (2 * sum_dist)
 
     def run(self):
         """Runs the predicting process per fold"""
-        data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
+        data = load_dataset(self.root_path, self.index_col, self.data)
         geoweights = pd.read_csv(
             os.path.join(self.root_path, "normd_matrix.csv"), index_col="[GEO]_ID_CITY"
         )
-        data.set_index(self.index_col, inplace=True)
+        self._nodes = NodeIndex.from_data(data)
         self._make_folders(
             ["results", self.scv_method, "predictions", self.fs_method, self.ml_method,]
         )
@@ -133,11 +142,12 @@ class Predict(Data):
         ml_path = os.path.join(
             results_path, "trained_models", self.fs_method, self.ml_method
         )
-        folds_name = self._get_folders_in_dir(folds_path)
+        self._folds = load_fold_store(folds_path, self._nodes)
+        folds_name = self._folds.get_folds()
         folds_name.remove("53")
         for fold in tqdm(folds_name, desc="Predicting test set"):
-            self._read_test_data(os.path.join(folds_path, fold), data)
-            self._read_train_data(os.path.join(folds_path, fold), data)
+            self._read_test_data(fold, data)
+            self._read_train_data(fold, data)
             original_test = self.test_data
             original_train = self.train_data
             if "Local" in self.fs_method:
@@ -176,8 +186,7 @@ class Predict(Data):
                     # test_var[context.split(".")[0]] = np.var(pca_test)
                     # geo_weights_test = geoweights.loc[self.test_data.index, self.train_data.index.astype('str')]
                     # geo_dist[context.split(".")[0]] = geo_weights_test.to_numpy().mean()
-                    # similarity = self._calculate_similarity_matrix(pca_test, pca_train)
-                    # gamma = self._calculate_gamma(similarity, geo_weights_test)
+                    # gamma = self._calculate_gamma(pca_test, pca_train, geo_weights_test)
                     # context_gamma[context.split(".")[0]] = gamma
                     model = self.load_model(
                         os.path.join(ml_path, fold, f"{context.split('.')[0]}.pkl")
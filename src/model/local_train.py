@@ -15,6 +15,9 @@ from sklearn.svm import SVR
 import pandas as pd
 from tqdm import tqdm
 from src.data import Data
+from src.dataset import load_dataset
+from src.fold_store import FoldStore, load_fold_store
+from src.node_index import NodeIndex
 import src.utils as utils
 
 MAP_MODELS = {
@@ -49,6 +52,8 @@ class Train(Data):
             The target column name
         root_path : str
             Root path
+        data: pd.Dataframe
+            The spatial dataset, loaded from the dataset cache when empty
     """
 
     ml_method: str = "LGBM"
@@ -56,12 +61,14 @@ class Train(Data):
     scv_method: str = "gbscv"
     index_col: str = "INDEX"
     target_col: str = "TARGET"
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
     train_data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _nodes: NodeIndex = None
+    _folds: FoldStore = None
 
-    def _read_train_data(self, json_path, data):
+    def _read_train_data(self, fold, data):
         """Read the training data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self.train_data = data.loc[split_fold_idx["train"]].copy()
+        self.train_data = data.take(self._folds.positions(fold, "train"))
 
     def _selected_features_filtering(self, json_path):
         """Filter only the features selected"""
@@ -129,8 +136,8 @@ class Train(Data):
 
     def run(self):
         """Runs the training process per fold"""
-        data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
-        data.set_index(self.index_col, inplace=True)
+        data = load_dataset(self.root_path, self.index_col, self.data)
+        self._nodes = NodeIndex.from_data(data)
 
         self._make_folders(
             [
@@ -149,11 +156,12 @@ class Train(Data):
             "features_selected",
             self.fs_method,
         )
-        folds_name = self._get_folders_in_dir(folds_path)
+        self._folds = load_fold_store(folds_path, self._nodes)
+        folds_name = self._folds.get_folds()
 
         for fold in tqdm(folds_name, desc="Training model"):
             params = {}
-            self._read_train_data(os.path.join(folds_path, fold), data)
+            self._read_train_data(fold, data)
             original_train = self.train_data
             if "Local" in self.fs_method:
                 context_list = self._get_files_in_dir(os.path.join(fs_path, fold))
@@ -2,12 +2,23 @@
 import os
 import re
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Union
 import joblib
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from src.data import Data
-import src.utils as utils
+from src.dataset import load_dataset
+from src.fold_store import FoldStore
+from src.node_index import NodeIndex
+from src.results import (
+    filter_folds,
+    get_fold_store,
+    get_ml_methods,
+    get_selected_features,
+    get_stage_cache,
+)
+from src.stage_cache import stage_key
 
 PRED_COL = "PREDICTIONS"
 GROUND_TRUTH_COL = "GROUND_TRUTH"
@@ -19,8 +30,9 @@ class Predict(Data):
 
      Attributes
     ----------
-        ml_method:str
-            The machine learning method name
+        ml_method: Union[str, List[str]]
+            The machine learning method name, or a list of methods predicting
+            over the same fold test matrices
         fs_method:str
             The feature selection method name
         scv_method:str
@@ -31,26 +43,32 @@ class Predict(Data):
             The target column name
         root_path : str
             Root path
+        data: pd.Dataframe
+            The spatial dataset, loaded from the dataset cache when empty
+        folds: List[str]
+            The folds to process, every fold when None
     """
 
-    ml_method: str = "LGBM"
+    ml_method: Union[str, List[str]] = "LGBM"
     fs_method: str = "CFS"
     scv_method: str = "gbscv"
     index_col: str = "INDEX"
     target_col: str = "TARGET"
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    folds: List[str] = None
     test_data: pd.DataFrame = field(default_factory=pd.DataFrame)
     predictions: List = field(default_factory=list)
+    _nodes: NodeIndex = None
+    _folds: FoldStore = None
 
-    def _read_test_data(self, json_path, data):
-        """Read the training data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self.test_data = data.loc[split_fold_idx["test"]].copy()
+    def _read_test_data(self, fold, data):
+        """Read the test data"""
+        self.test_data = data.take(self._folds.positions(fold, "test"))
 
-    def _selected_features_filtering(self, json_path):
+    def _selected_features_filtering(self, fs_path, fold):
         """Filter only the features selected"""
-        selected_features = utils.load_json(json_path)
-        selected_features["selected_features"].append(self.target_col)
-        self.test_data = self.test_data[selected_features["selected_features"]]
+        selected_features = get_selected_features(self.results, fs_path, fold)
+        self.test_data = self.test_data[selected_features + [self.target_col]]
 
     @staticmethod
     def load_model(filepath):
@@ -58,47 +76,113 @@ class Predict(Data):
         # return pickle.load(open(filepath, "rb"))
         return joblib.load(filepath)
 
+    def _read_model(self, ml_path, fold, ml_method):
+        """Read the model trained on the fold"""
+        models = {} if self.results is None else self.results.models.get(ml_method, {})
+        if fold in models:
+            return models[fold]
+        return self.load_model(os.path.join(ml_path, f"{fold}.pkl"))
+
     def _clean_train_data_col(self):
         clean_cols = [re.sub(r"\W+", "", col) for col in self.test_data.columns]
         self.test_data.columns = clean_cols
 
     def _split_data(self):
-        """Split the data into explanatory and target features"""
+        """Split the data into explanatory and target features. The explanatory
+        features are copied once into a contiguous float matrix, which every
+        model then reads without converting it again"""
         y_test = self.test_data[self.target_col]
         x_test = self.test_data.drop(columns=[self.target_col])
+        matrix = np.ascontiguousarray(x_test.to_numpy(dtype=np.float64))
+        x_test = pd.DataFrame(matrix, index=x_test.index, columns=x_test.columns)
         return x_test, y_test
 
-    def _predict(self, model):
+    def _predict(self, model, x_test):
         """make prediction"""
-        self._clean_train_data_col()
-        x_test, _ = self._split_data()
         self.predictions = model.predict(x_test)
         return self.predictions
 
-    def save_prediction(self, fold):
+    def save_prediction(self, fold, y_test, ml_method, pred_path):
         """Save the model's prediction"""
-        self.test_data[PRED_COL] = self.predictions
-        self.test_data[GROUND_TRUTH_COL] = self.test_data[self.target_col]
-        pred_to_save = self.test_data[[PRED_COL, GROUND_TRUTH_COL]]
-        pred_to_save.to_csv(os.path.join(self.cur_dir, f"{fold}.csv"))
+        pred_to_save = pd.DataFrame(
+            {PRED_COL: self.predictions, GROUND_TRUTH_COL: y_test}, index=y_test.index
+        )
+        if self.results is not None:
+            self.results.predictions.setdefault(ml_method, {})[fold] = pred_to_save
+        self._persist(pred_to_save.to_csv, os.path.join(pred_path, f"{fold}.csv"))
+        return pred_to_save
 
-    def run(self):
-        """Runs the predicting process per fold"""
-        data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
-        data.set_index(self.index_col, inplace=True)
-        self._make_folders(
-            ["results", self.scv_method, "predictions", self.fs_method, self.ml_method,]
+    def _load_prediction(self, fold, ml_method, pred_path) -> pd.DataFrame:
+        """Load the predictions of the fold made in a previous run"""
+        pred_to_save = pd.read_csv(
+            os.path.join(pred_path, f"{fold}.csv"), index_col=self.index_col
         )
+        if self.results is not None:
+            self.results.predictions.setdefault(ml_method, {})[fold] = pred_to_save
+        return pred_to_save
+
+    def _make_ml_folders(self, ml_methods) -> Dict[str, str]:
+        """Make the output folder of each ML method"""
+        pred_paths = {}
+        for ml_method in ml_methods:
+            self._make_folders(
+                ["results", self.scv_method, "predictions", self.fs_method, ml_method]
+            )
+            pred_paths[ml_method] = self.cur_dir
+        return pred_paths
+
+    def run(self):
+        """Runs the predicting process per fold, skipping the folds whose model
+        did not change since the last run. Several ML methods predict over a
+        single test matrix per fold, each one saved to its own folder"""
+        data = load_dataset(self.root_path, self.index_col, self.data)
+        self._nodes = NodeIndex.from_data(data)
+        ml_methods = get_ml_methods(self.ml_method)
+        pred_paths = self._make_ml_folders(ml_methods)
         folds_path = os.path.join(self.root_path, "folds", self.scv_method)
         results_path = os.path.join(self.root_path, "results", self.scv_method)
         fs_path = os.path.join(results_path, "features_selected", self.fs_method)
-        ml_path = os.path.join(
-            results_path, "trained_models", self.fs_method, self.ml_method
-        )
-        folds_name = self._get_folders_in_dir(folds_path)
+        ml_paths = {
+            ml_method: os.path.join(
+                results_path, "trained_models", self.fs_method, ml_method
+            )
+            for ml_method in ml_methods
+        }
+        self._folds = get_fold_store(self.results, folds_path, self._nodes)
+        folds_name = filter_folds(self._folds.get_folds(), self.folds)
+        ml_caches = {
+            ml_method: get_stage_cache(self.results, ml_path)
+            for ml_method, ml_path in ml_paths.items()
+        }
+        caches = {
+            ml_method: get_stage_cache(self.results, pred_path)
+            for ml_method, pred_path in pred_paths.items()
+        }
+        predictions = {ml_method: {} for ml_method in ml_methods}
         for fold in tqdm(folds_name, desc="Predicting test set"):
-            self._read_test_data(os.path.join(folds_path, fold), data)
-            self._selected_features_filtering(os.path.join(fs_path, f"{fold}.json"))
-            model = self.load_model(os.path.join(ml_path, f"{fold}.pkl"))
-            self._predict(model)
-            self.save_prediction(fold)
+            pending = {}
+            for ml_method in ml_methods:
+                key = stage_key(ml_caches[ml_method].get_key(fold))
+                if caches[ml_method].is_cached(fold, key, f"{fold}.csv"):
+                    predictions[ml_method][fold] = self._load_prediction(
+                        fold, ml_method, pred_paths[ml_method]
+                    )
+                    continue
+                pending[ml_method] = key
+            if not pending:
+                continue
+            self._read_test_data(fold, data)
+            self._selected_features_filtering(fs_path, fold)
+            self._clean_train_data_col()
+            x_test, y_test = self._split_data()
+            for ml_method, key in pending.items():
+                model = self._read_model(ml_paths[ml_method], fold, ml_method)
+                self._predict(model, x_test)
+                predictions[ml_method][fold] = self.save_prediction(
+                    fold, y_test, ml_method, pred_paths[ml_method]
+                )
+                cache = caches[ml_method]
+                self._persist(cache.write, cache.record(fold, key))
+        if isinstance(self.ml_method, str):
+            return predictions[self.ml_method]
+        return predictions
@@ -2,9 +2,13 @@
 import os
 import re
 import math
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Union
 import joblib
 import lightgbm
+import numpy as np
+from threadpoolctl import threadpool_limits
 from sklearn.tree import DecisionTreeRegressor
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.neighbors import KNeighborsRegressor
@@ -14,7 +18,17 @@ from sklearn.svm import SVR
 import pandas as pd
 from tqdm import tqdm
 from src.data import Data
-import src.utils as utils
+from src.dataset import load_dataset
+from src.fold_store import FoldStore
+from src.node_index import NodeIndex
+from src.results import (
+    filter_folds,
+    get_fold_store,
+    get_ml_methods,
+    get_selected_features,
+    get_stage_cache,
+)
+from src.stage_cache import stage_key
 
 MAP_MODELS = {
     "LGBM": lightgbm.LGBMRegressor,
@@ -29,6 +43,24 @@ MAP_MODELS = {
     "ElasticNet": ElasticNet,
 }
 
+_WORKER_TRAIN = None
+
+
+def _init_worker(train):
+    """Keep the training instance shared by every fold fit in the worker"""
+    global _WORKER_TRAIN
+    _WORKER_TRAIN = train
+
+
+def _fit_worker_fold(fold, models, columns, n_threads):
+    """Fit the fold models with the worker training instance, the models and
+    their native libraries using at most n_threads threads"""
+    for model in models.values():
+        if "n_jobs" in model.get_params():
+            model.set_params(n_jobs=n_threads)
+    with threadpool_limits(limits=n_threads):
+        return fold, _WORKER_TRAIN._fit_fold(fold, _WORKER_TRAIN.data, columns, models)
+
 
 @dataclass
 class Train(Data):
@@ -36,8 +68,9 @@ class Train(Data):
 
      Attributes
     ----------
-        ml_method:str
-            The machine learning method name
+        ml_method: Union[str, List[str]]
+            The machine learning method name, or a list of methods fitted over
+            the same fold training matrices
         fs_method:str
             The feature selection method name
         scv_method:str
@@ -48,34 +81,44 @@ class Train(Data):
             The target column name
         root_path : str
             Root path
+        data: pd.Dataframe
+            The spatial dataset, loaded from the dataset cache when empty
+        folds: List[str]
+            The folds to process, every fold when None
+        n_jobs: int
+            The number of cores training the fold models, -1 to use all the
+            cores. They are split between fold processes and model threads
     """
 
-    ml_method: str = "LGBM"
+    ml_method: Union[str, List[str]] = "LGBM"
     fs_method: str = "CFS"
     scv_method: str = "gbscv"
     index_col: str = "INDEX"
     target_col: str = "TARGET"
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    folds: List[str] = None
+    n_jobs: int = 1
     train_data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _nodes: NodeIndex = None
+    _folds: FoldStore = None
 
-    def _read_train_data(self, json_path, data):
+    def _read_train_data(self, fold, data):
         """Read the training data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self.train_data = data.loc[split_fold_idx["train"]].copy()
+        self.train_data = data.take(self._folds.positions(fold, "train"))
 
-    def _selected_features_filtering(self, json_path):
+    def _selected_features_filtering(self, fs_path, fold):
         """Filter only the features selected"""
-        selected_features = utils.load_json(json_path)
-        selected_features["selected_features"].append(self.target_col)
-        self.train_data = self.train_data[selected_features["selected_features"]]
+        selected_features = get_selected_features(self.results, fs_path, fold)
+        self.train_data = self.train_data[selected_features + [self.target_col]]
 
-    def _get_model(self, params):
+    def _get_model(self, ml_method, params):
         """Get the models by name"""
-        if self.ml_method == "KNN":
-            return MAP_MODELS[self.ml_method](
+        if ml_method == "KNN":
+            return MAP_MODELS[ml_method](
                 n_neighbors=math.floor(math.sqrt(self.train_data.shape[0]))
             )
-        if self.ml_method == "MLP":
-            return MAP_MODELS[self.ml_method](
+        if ml_method == "MLP":
+            return MAP_MODELS[ml_method](
                 (math.floor(self.train_data.shape[1] / 2),),
                 random_state=1,
                 max_iter=50000,
@@ -88,58 +131,120 @@ class Train(Data):
                 activation="relu",
                 solver="adam",
             )
-        if self.ml_method == "RF":
-            return MAP_MODELS[self.ml_method](n_estimators=200, random_state=1)
-        if self.ml_method == "DT":
-            return MAP_MODELS[self.ml_method](random_state=1)
-        if self.ml_method == "Lasso":
-            return MAP_MODELS[self.ml_method](alpha=0.001, random_state=1)
-        if self.ml_method == "OLS":
-            return MAP_MODELS[self.ml_method]()
-        if self.ml_method == "Ridge":
-            return MAP_MODELS[self.ml_method](alpha=0.001)
-        if self.ml_method == "ElasticNet":
-            return MAP_MODELS[self.ml_method](alpha=0.001)
-        if self.ml_method == "SVM":
-            return MAP_MODELS[self.ml_method]()
-        return MAP_MODELS[self.ml_method](*params)
+        if ml_method == "RF":
+            return MAP_MODELS[ml_method](n_estimators=200, random_state=1)
+        if ml_method == "DT":
+            return MAP_MODELS[ml_method](random_state=1)
+        if ml_method == "Lasso":
+            return MAP_MODELS[ml_method](alpha=0.001, random_state=1)
+        if ml_method == "OLS":
+            return MAP_MODELS[ml_method]()
+        if ml_method == "Ridge":
+            return MAP_MODELS[ml_method](alpha=0.001)
+        if ml_method == "ElasticNet":
+            return MAP_MODELS[ml_method](alpha=0.001)
+        if ml_method == "SVM":
+            return MAP_MODELS[ml_method]()
+        return MAP_MODELS[ml_method](*params)
 
     def _split_data(self):
-        """Split the data into explanatory and target features"""
+        """Split the data into explanatory and target features. The explanatory
+        features are copied once into a contiguous float matrix, which every
+        model then reads without converting it again"""
         self._clean_train_data_col()
         y_train = self.train_data[self.target_col]
         x_train = self.train_data.drop(columns=[self.target_col])
+        matrix = np.ascontiguousarray(x_train.to_numpy(dtype=np.float64))
+        x_train = pd.DataFrame(matrix, index=x_train.index, columns=x_train.columns)
         return x_train, y_train
 
     def _clean_train_data_col(self):
         clean_cols = [re.sub(r"\W+", "", col) for col in self.train_data.columns]
         self.train_data.columns = clean_cols
 
-    def _fit(self, model):
-        """Fit the model"""
+    def _fit_fold(self, fold, data, columns, models) -> Dict:
+        """Fit every model over the same training matrix of the fold"""
+        self._read_train_data(fold, data)
+        self.train_data = self.train_data[columns]
         x_train, y_train = self._split_data()
-        return model.fit(x_train, y_train)
+        return {
+            ml_method: model.fit(x_train, y_train)
+            for ml_method, model in models.items()
+        }
+
+    @staticmethod
+    def _write_model(model, filepath):
+        """Write the model using joblib"""
+        joblib.dump(model, filepath, compress=9)
 
-    def save_model(self, model, fold):
+    def save_model(self, model, fold, ml_method, ml_path):
         """Save the model using picke"""
-        joblib.dump(
-            model, open(os.path.join(self.cur_dir, f"{fold}.pkl"), "wb"), compress=9
-        )
+        if self.results is not None:
+            self.results.models.setdefault(ml_method, {})[fold] = model
+        self._persist(self._write_model, model, os.path.join(ml_path, f"{fold}.pkl"))
 
-    def run(self):
-        """Runs the training process per fold"""
-        data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
-        data.set_index(self.index_col, inplace=True)
-
-        self._make_folders(
-            [
-                "results",
-                self.scv_method,
-                "trained_models",
-                self.fs_method,
-                self.ml_method,
+    def _load_model(self, fold, ml_method, ml_path):
+        """Load the model trained on the fold in a previous run"""
+        model = joblib.load(os.path.join(ml_path, f"{fold}.pkl"))
+        if self.results is not None:
+            self.results.models.setdefault(ml_method, {})[fold] = model
+        return model
+
+    def _get_n_jobs(self, n_folds):
+        """Return the number of fold processes and of threads per model,
+        splitting the cores so that they are all used without oversubscribing
+        the ones of the multithreaded models"""
+        n_cores = max(1, (os.cpu_count() if self.n_jobs == -1 else self.n_jobs) or 1)
+        n_processes = max(1, min(n_cores, n_folds))
+        return n_processes, max(1, n_cores // n_processes)
+
+    def _fit_folds(self, data, fitting):
+        """Fit the models of the folds, yielding each fold with its models. When
+        n_jobs is not 1, folds are fitted in a process pool, each worker holding
+        a copy of the instance with the read-only data"""
+        if self.n_jobs == 1:
+            for fold, (models, columns) in tqdm(fitting.items(), desc="Training model"):
+                yield fold, self._fit_fold(fold, data, columns, models)
+            return
+        n_processes, n_threads = self._get_n_jobs(len(fitting))
+        worker = replace(self, data=data, results=None, train_data=pd.DataFrame())
+        with ProcessPoolExecutor(
+            max_workers=n_processes, initializer=_init_worker, initargs=(worker,)
+        ) as executor:
+            futures = [
+                executor.submit(_fit_worker_fold, fold, models, columns, n_threads)
+                for fold, (models, columns) in fitting.items()
             ]
-        )
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Training model"
+            ):
+                yield future.result()
+
+    def _make_ml_folders(self, ml_methods) -> Dict[str, str]:
+        """Make the output folder of each ML method"""
+        ml_paths = {}
+        for ml_method in ml_methods:
+            self._make_folders(
+                [
+                    "results",
+                    self.scv_method,
+                    "trained_models",
+                    self.fs_method,
+                    ml_method,
+                ]
+            )
+            ml_paths[ml_method] = self.cur_dir
+        return ml_paths
+
+    def run(self):
+        """Runs the training process per fold, skipping the folds whose inputs
+        and model hyperparameters did not change since the last run. Several ML
+        methods are fitted over a single training matrix per fold, each one
+        saved to its own folder"""
+        data = load_dataset(self.root_path, self.index_col, self.data)
+        self._nodes = NodeIndex.from_data(data)
+        ml_methods = get_ml_methods(self.ml_method)
+        ml_paths = self._make_ml_folders(ml_methods)
         folds_path = os.path.join(self.root_path, "folds", self.scv_method)
         fs_path = os.path.join(
             self.root_path,
@@ -148,12 +253,42 @@ class Train(Data):
             "features_selected",
             self.fs_method,
         )
-        folds_name = self._get_folders_in_dir(folds_path)
-
-        for fold in tqdm(folds_name, desc="Training model"):
+        self._folds = get_fold_store(self.results, folds_path, self._nodes)
+        folds_name = filter_folds(self._folds.get_folds(), self.folds)
+        fs_cache = get_stage_cache(self.results, fs_path)
+        caches = {
+            ml_method: get_stage_cache(self.results, ml_path)
+            for ml_method, ml_path in ml_paths.items()
+        }
+        models = {ml_method: {} for ml_method in ml_methods}
+        fitting, keys = {}, {}
+        for fold in folds_name:
             params = {}
-            self._read_train_data(os.path.join(folds_path, fold), data)
-            self._selected_features_filtering(os.path.join(fs_path, f"{fold}.json"))
-            model = self._get_model(params=params)
-            model = self._fit(model)
-            self.save_model(model, fold)
+            self._read_train_data(fold, data)
+            self._selected_features_filtering(fs_path, fold)
+            fold_models = {}
+            for ml_method in ml_methods:
+                model = self._get_model(ml_method, params=params)
+                key = stage_key(fs_cache.get_key(fold), ml_method, model.get_params())
+                if caches[ml_method].is_cached(fold, key, f"{fold}.pkl"):
+                    models[ml_method][fold] = self._load_model(
+                        fold, ml_method, ml_paths[ml_method]
+                    )
+                    continue
+                fold_models[ml_method] = model
+                keys[(fold, ml_method)] = key
+            if fold_models:
+                fitting[fold] = (fold_models, self.train_data.columns.tolist())
+        for fold, fold_models in self._fit_folds(data, fitting):
+            for ml_method, model in fold_models.items():
+                models[ml_method][fold] = model
+                self.save_model(model, fold, ml_method, ml_paths[ml_method])
+                cache = caches[ml_method]
+                self._persist(cache.write, cache.record(fold, keys[(fold, ml_method)]))
+        models = {
+            ml_method: {fold: models[ml_method][fold] for fold in folds_name}
+            for ml_method in ml_methods
+        }
+        if isinstance(self.ml_method, str):
+            return models[self.ml_method]
+        return models
@@ -0,0 +1,53 @@
+"""Canonical integer positions of the dataset spatial objects"""
+from dataclasses import dataclass, field
+from typing import List
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class NodeIndex:
+    """Represents the node registry of a dataset.
+
+    Maps every INDEX label of the dataset to a compact int32 position, once per
+    dataset. Splits, buffers and neighborhoods are handled as position arrays
+    or boolean masks, and rows are sliced with a NumPy take.
+
+    Attributes
+    ----------
+        labels: pd.Index
+            The dataset index label of each position
+    """
+
+    labels: pd.Index = field(default_factory=pd.Index)
+
+    @classmethod
+    def from_data(cls, data: pd.DataFrame) -> "NodeIndex":
+        """Build the registry from the dataset index"""
+        return cls(labels=data.index)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def positions(self, labels) -> np.ndarray:
+        """Return the int32 positions of the given index labels"""
+        labels = pd.Index(labels).astype(self.labels.dtype)
+        positions = self.labels.get_indexer(labels)
+        if (positions < 0).any():
+            missing = labels[positions < 0].tolist()
+            raise KeyError(f"Index labels not found in the dataset: {missing}")
+        return positions.astype(np.int32)
+
+    def get_labels(self, positions) -> List:
+        """Return the index labels of the given positions"""
+        return self.labels[positions].tolist()
+
+    def mask(self, positions) -> np.ndarray:
+        """Return a boolean mask over the dataset flagging the given positions"""
+        mask = np.zeros(len(self.labels), dtype=bool)
+        mask[positions] = True
+        return mask
+
+    def take(self, data: pd.DataFrame, labels) -> pd.DataFrame:
+        """Return the dataset rows of the given index labels"""
+        return data.take(self.positions(labels))
@@ -5,12 +5,12 @@ from os import mkdir
 from os.path import join
 import os
 import time
-import pandas as pd
 import numpy as np
-from weka.core import jvm
-from weka.attribute_selection import ASEvaluation, ASSearch, AttributeSelection
-from weka.core.dataset import create_instances_from_matrices
-from src import utils
+from src.dataset import load_dataset
+from src.feature_selection.cfs import cfs
+from src.feature_selection.cfs_worker import get_cfs_selector
+from src.fold_store import load_fold_store
+from src.node_index import NodeIndex
 from typing import List
 
 os.system("taskset -p 0xff %d" % os.getpid())
@@ -33,41 +33,13 @@ def _make_folders(root_path, folders: List[str]):
     return root_path
 
 
-def _target_as_last_col(data, target_col) -> pd.DataFrame:
-    """Position the target column in the dataset last position"""
-    cols = [c for c in data.columns if c != target_col]
-    return data[cols + [target_col]]
-
-
-def _weka_cfs(data, target_col):
-    """Runs the CFS method from WEKA"""
-    jvm.start()
-    data = _target_as_last_col(data, target_col)
-    data_weka = create_instances_from_matrices(data.to_numpy())
-    data_weka.class_is_last()
-    search = ASSearch(
-        classname="weka.attributeSelection.BestFirst", options=["-D", "1", "-N", "5"],
-    )
-    evaluator = ASEvaluation(
-        classname="weka.attributeSelection.CfsSubsetEval",
-        options=["-P", "1", "-E", "1"],
-    )
-    attsel = AttributeSelection()
-    attsel.search(search)
-    attsel.evaluator(evaluator)
-    attsel.select_attributes(data_weka)
-    index_fs = [i - 1 for i in attsel.selected_attributes]
-    jvm.stop()
-    return data.columns.values[index_fs].tolist()
-
-
-def read_data(root_path, dataset_name, index_col, target_col, fold_col):
-    """read data"""
-    dataset = pd.read_csv(join(root_path, dataset_name, "data.csv"))
+def read_data(root_path, dataset_name, index_col, target_col, fold_col, max_cols=None):
+    """read data, keeping the first max_cols columns when given"""
+    dataset = load_dataset(join(root_path, dataset_name), index_col).reset_index()
     reorganized_cols = [
         col for col in dataset.columns if col not in [target_col, fold_col]
     ]
-    reorganized_cols = reorganized_cols[:4000]
+    reorganized_cols = reorganized_cols[:max_cols]
     reorganized_cols.append(target_col)
     dataset = dataset[reorganized_cols]
     with contextlib.suppress(KeyError):
@@ -85,21 +57,45 @@ def _save_selected_features(output_path, features, fold):
         json.dump(json_features, file, indent=4)
 
 
-def main(dataset_name, val_method, root_path, fold, index_col, target_col, fold_col):
-    data = read_data(root_path, dataset_name, index_col, target_col, fold_col)
+def _numpy_cfs(data, target_col):
+    """Runs the NumPy CFS method, selecting as Weka CFS over every column"""
+    features = data.drop(columns=[target_col])
+    selected = cfs(
+        features.to_numpy(dtype=np.float64), data[target_col].to_numpy(dtype=np.float64)
+    )
+    return features.columns[selected].tolist()
+
+
+def main(
+    dataset_name,
+    val_method,
+    root_path,
+    fold,
+    index_col,
+    target_col,
+    fold_col,
+    fs_method="CFS",
+):
+    # The Weka CFS data is limited to 4000 columns to fit in the JVM memory
+    max_cols = 4000 if fs_method == "CFS" else None
+    data = read_data(root_path, dataset_name, index_col, target_col, fold_col, max_cols)
     output_path = _make_folders(
         join(root_path, dataset_name),
-        ["results", val_method, "features_selected", "CFS"],
+        ["results", val_method, "features_selected", fs_method],
     )
     folds_path = join(root_path, dataset_name, "folds", val_method)
 
-    split_fold_idx = utils.load_json(join(folds_path, fold, "split_data.json"))
-    training_data = data.loc[split_fold_idx["train"]].copy()
-
-    jvm.start()
-    selected_features = _weka_cfs(training_data, target_col)
+    folds = load_fold_store(folds_path, NodeIndex.from_data(data))
+    training_rows = folds.positions(fold, "train")
+    if fs_method == "NumpyCFS":
+        selected_features = _numpy_cfs(data.take(training_rows), target_col)
+    else:
+        # The selector keeps the JVM and the dataset for the next folds of the worker
+        selector = get_cfs_selector()
+        if not selector.is_registered(dataset_name):
+            selector.register(dataset_name, data)
+        selected_features = selector.select(dataset_name, training_rows)
     _save_selected_features(output_path, selected_features, fold)
-    jvm.stop()
 
 
 if __name__ == "__main__":
@@ -112,4 +108,14 @@ if __name__ == "__main__":
         sys.argv[6],
         sys.argv[7],
     )
-    main(dataset_name, val_method, root_path, fold, index_col, target_col, fold_col)
+    fs_method = sys.argv[8] if len(sys.argv) > 8 else "CFS"
+    main(
+        dataset_name,
+        val_method,
+        root_path,
+        fold,
+        index_col,
+        target_col,
+        fold_col,
+        fs_method,
+    )
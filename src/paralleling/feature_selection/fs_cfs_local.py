@@ -5,13 +5,18 @@ from os import mkdir
 from os.path import join
 import os
 import time
-import pandas as pd
 import numpy as np
 from tqdm import tqdm
-from weka.core import jvm
-from weka.attribute_selection import ASEvaluation, ASSearch, AttributeSelection
-from weka.core.dataset import create_instances_from_matrices
-from src import utils
+from src.dataset import DATA_FILENAME, load_dataset
+from src.feature_selection.cfs_worker import get_cfs_selector
+from src.feature_selection.local_fs import (
+    context_key,
+    load_context_features,
+    save_context_features,
+)
+from src.fold_store import load_fold_store
+from src.node_index import NodeIndex
+from src.stage_cache import file_fingerprint
 from typing import List
 
 os.system("taskset -p 0xff %d" % os.getpid())
@@ -34,37 +39,9 @@ def _make_folders(root_path, folders: List[str]):
     return root_path
 
 
-def _target_as_last_col(data, target_col) -> pd.DataFrame:
-    """Position the target column in the dataset last position"""
-    cols = [c for c in data.columns if c != target_col]
-    return data[cols + [target_col]]
-
-
-def _weka_cfs(data, target_col):
-    """Runs the CFS method from WEKA"""
-    jvm.start()
-    data = _target_as_last_col(data, target_col)
-    data_weka = create_instances_from_matrices(data.to_numpy())
-    data_weka.class_is_last()
-    search = ASSearch(
-        classname="weka.attributeSelection.BestFirst", options=["-D", "1", "-N", "5"],
-    )
-    evaluator = ASEvaluation(
-        classname="weka.attributeSelection.CfsSubsetEval",
-        options=["-P", "1", "-E", "1"],
-    )
-    attsel = AttributeSelection()
-    attsel.search(search)
-    attsel.evaluator(evaluator)
-    attsel.select_attributes(data_weka)
-    index_fs = [i - 1 for i in attsel.selected_attributes]
-    jvm.stop()
-    return data.columns.values[index_fs].tolist()
-
-
 def read_data(root_path, dataset_name, index_col, target_col, fold_col):
     """read data"""
-    dataset = pd.read_csv(join(root_path, dataset_name, "data.csv"))
+    dataset = load_dataset(join(root_path, dataset_name), index_col).reset_index()
     reorganized_cols = [col for col in dataset.columns if col not in [target_col]]
     reorganized_cols = reorganized_cols[:4000]
     reorganized_cols.append(target_col)
@@ -99,15 +76,23 @@ def main(
     )
     folds_path = join(root_path, dataset_name, "folds", val_method)
 
-    split_fold_idx = utils.load_json(join(folds_path, fold, "split_data.json"))
-    training_data = data.loc[split_fold_idx["train"]].copy()
-    context_data = training_data[training_data[fold_col] == int(context_fold)]
-    jvm.start()
-    context_data.drop([fold_col], axis=1)
+    folds = load_fold_store(folds_path, NodeIndex.from_data(data))
+    training_rows = folds.positions(fold, "train")
+    in_context = data[fold_col].to_numpy()[training_rows] == int(context_fold)
+    context_rows = training_rows[in_context]
     out_path = _make_folders(output_path, [fold])
-    selected_features = _weka_cfs(context_data, target_col)
+    # Outer folds sharing the context training rows reuse its selection
+    data_key = file_fingerprint(join(root_path, dataset_name, DATA_FILENAME))
+    key = context_key(data_key, "CFS_Local", data.columns, context_rows)
+    selected_features = load_context_features(output_path, key)
+    if selected_features is None:
+        # The selector keeps the JVM and the dataset for the next jobs of the worker
+        selector = get_cfs_selector()
+        if not selector.is_registered(dataset_name):
+            selector.register(dataset_name, data)
+        selected_features = selector.select(dataset_name, context_rows)
+        save_context_features(output_path, key, selected_features)
     _save_selected_features(out_path, selected_features, context_fold)
-    jvm.stop()
 
 
 if __name__ == "__main__":
@@ -1,396 +1,396 @@
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.0 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.1 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.1 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.1 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.2 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.2 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.2 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.3 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.3 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.3 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.4 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.4 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.4 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.5 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.5 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.5 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.6 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.6 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.6 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.7 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.7 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.7 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.8 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.8 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.8 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.9 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.9 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_0.9 --fold 32 33 35 41 42 43 50 51 53
 echo Brazil_election
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.1 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
 echo 02
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.2 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
 echo 03
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.3 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
 echo 04
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.4 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
 echo 05
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51  53 --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.5 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51  53
 echo 06
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.6 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
 echo 07
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.7 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
 echo 08
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.8 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
 echo 09
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52 --list_contexts -100
-python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53  --list_contexts -100
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_1.0 --fold 11 12 13 14 15 16 17 21
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_1.0 --fold 23 24 25 26 27 28 29 31 52
+python run_subprocess.py --dataset_names Brazil_Election_2018_Sampled_dec0.3_prob0.9 --val_method RegGBSCV_R_Kappa_1.0 --fold 32 33 35 41 42 43 50 51 53
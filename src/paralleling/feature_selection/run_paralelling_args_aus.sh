@@ -1,18 +1,18 @@
 echo Brazil_election
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.1 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.1 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.2 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.2 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.3 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.3 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.4 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.4 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.5 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.5 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.6 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.6 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.7 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.7 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.8 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.8 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
 echo =========================================================================
-python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.9 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10 --list_contexts -100
+python run_subprocess.py --dataset_names Australia_Election_2019_Sampled_dec0.05_prob0.9 --val_method CrossValidation --fold 1 2 3 4 5 6 7 8 9 10
@@ -1,109 +1,54 @@
 echo Brazil_election
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 11 --list_contexts 12 13 14 15 16 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 11 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 11 --list_contexts 32 33 35 41 42 43 50 51 52
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 11 --list_contexts 
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 11
 echo 12
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 12 --list_contexts 11 13 14 15 16 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 12 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 12 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 12
 echo 13
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 13 --list_contexts 12 11 14 15 16 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 13 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 13 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 13
 echo 14
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 14 --list_contexts 12 13 11 15 16 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 14 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 14 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 14
 echo 15
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 15 --list_contexts 12 13 14 11 16 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 15 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 15 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 15
 echo 16
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 16 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 16 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 16 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 16
 echo 17
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 17 --list_contexts 12 13 14 15 16 11 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 17 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 17 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 17
 echo 21
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 21 --list_contexts 12 13 14 15 11 17 16 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 21 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 21 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 21
 echo 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 22 --list_contexts 12 13 14 15 11 17 21 16
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 22 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 22 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 22
 echo 23
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 23 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 23 --list_contexts 16 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 23 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 23
 echo 24
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 24 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 24 --list_contexts 23 16 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 24 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 24
 echo 25
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 25 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 25 --list_contexts 23 24 16 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 25 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 25
 echo 26
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 26 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 26 --list_contexts 23 24 25 16 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 26 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 26
 echo 27
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 27 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 27 --list_contexts 23 24 25 26 16 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 27 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 27
 echo 28
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 28 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 28 --list_contexts 23 24 25 26 27 16 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 28 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 28
 echo 29
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 29 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 29 --list_contexts 23 24 25 26 27 28 16 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 29 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 29
 echo 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 31 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 31 --list_contexts 23 24 25 26 27 28 29 16
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 31 --list_contexts 32 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 31
 echo 32
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 32 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 32 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 32 --list_contexts 16 33 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 32
 echo 33
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 33 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 33 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 33 --list_contexts 32 16 35 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 33
 echo 35
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 35 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 35 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 35 --list_contexts 32 33 16 41 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 35
 echo 41
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 41 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 41 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 41 --list_contexts 32 33 35 16 42 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 41
 echo 42
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 42 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 42 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 42 --list_contexts 32 33 35 41 16 43 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 42
 echo 43
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 43 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 43 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 43 --list_contexts 32 33 35 41 42 16 50 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 43
 echo 50
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 50 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 50 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 50 --list_contexts 32 33 35 41 42 43 16 51 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 50
 echo 51
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 51 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 51 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 51 --list_contexts 32 33 35 41 42 43 50 16 52
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 51
 echo 52
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 52 --list_contexts 12 13 14 15 11 17 21 22
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 52 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 52 --list_contexts 32 33 35 41 42 43 50 51 16
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 52
 echo 53
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 53 --list_contexts 12 13 14 15 11 17 21 22 16
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 53 --list_contexts 23 24 25 26 27 28 29 31
-python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 53 --list_contexts 32 33 35 41 42 43 50 51 52
\ No newline at end of file
+python run_subprocess.py --dataset_names Original --val_method Optimistic --fold 53
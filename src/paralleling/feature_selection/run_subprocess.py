@@ -1,8 +1,18 @@
 import sys
-import subprocess
 import time
-from tqdm import tqdm
 import argparse
+from os.path import join
+from src.dataset import load_dataset
+from src.job_runner import JobRunner
+import fs_cfs
+
+# Imported once by each worker, whatever the process start method
+WORKER_MODULES = [
+    "pandas",
+    "weka.core.jvm",
+    "src.feature_selection.cfs_worker",
+    "fs_cfs",
+]
 
 
 if __name__ == "__main__":
@@ -32,10 +42,10 @@ if __name__ == "__main__":
         default=[],
     )
     CLI.add_argument(
-        "--list_contexts",  # name on the CLI - drop the `--` for positional/required parameters
-        nargs="*",  # 0 or more values expected => creates a list
+        "--n_jobs",
+        nargs=1,
         type=int,
-        default=[],  # default if nothing is provided
+        default=[-1],  # -1 uses every core
     )
 
     index_col = "INDEX"
@@ -49,16 +59,29 @@ if __name__ == "__main__":
     # folds = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     # folds = [11, 12, 13, 14, 15, 16, 17, 21, 22, 23, 24, 25, 26, 27, 28, 29, 31, 32, 33, 35, 41, 42, 43, 50, 51, 52, 53]
     # folds = [11, 12, 13]
-    procs = []
     args = CLI.parse_args()
     print(args.dataset_names)
 
+    # Each worker keeps a single JVM and the dataset for all of its CFS jobs
+    runner = JobRunner(n_jobs=args.n_jobs[0], modules=WORKER_MODULES)
     for dataset_name in args.dataset_names:
+        # Parse the dataset once, before the fold jobs read it concurrently
+        load_dataset(join(root_path, dataset_name), index_col)
+        # The selection does not depend on the context, so run each fold once
         for fold in args.folds:
-            for context in args.list_contexts:
-                if context != int(fold):
-                    cmd = f"python fs_cfs.py {args.val_method[0]} {root_path} {dataset_name} {fold} {index_col} {target_col} {fold_col}"
-                    procs.append(subprocess.Popen(cmd, shell=True))
-    exit_codes = [p.wait() for p in procs]
+            runner.submit(
+                fs_cfs.main,
+                dataset_name,
+                args.val_method[0],
+                root_path,
+                str(fold),
+                index_col,
+                target_col,
+                fold_col,
+                name=f"{dataset_name} {fold}",
+            )
+    exit_codes = runner.run()
     t1_stop = time.process_time()
     print(f"time -- {(t1_start-t1_stop)/60}")
+    # Let the calling script know some of the jobs failed
+    sys.exit(1 if any(exit_codes) else 0)
@@ -12,9 +12,8 @@ from sklearn.metrics import mean_squared_error, mean_absolute_error
 from sklearn.svm import SVR
 
 # from tables import Column
-from weka.core import jvm
-from weka.attribute_selection import ASEvaluation, ASSearch, AttributeSelection
-from weka.core.dataset import create_instances_from_matrices
+from src.dataset import load_dataset
+from src.feature_selection.cfs_worker import get_cfs_selector
 
 
 def _target_as_last_col(data, target_col) -> pd.DataFrame:
@@ -23,26 +22,12 @@ def _target_as_last_col(data, target_col) -> pd.DataFrame:
     return data[cols[:4000] + [target_col]]
 
 
-def _weka_cfs(data, target_col):
-    """Runs the CFS method from WEKA"""
-    jvm.start()
+def _weka_cfs(data, target_col, name):
+    """Runs the CFS method from WEKA in the CFS selector of the process"""
     data = _target_as_last_col(data, target_col)
-    data_weka = create_instances_from_matrices(data.to_numpy())
-    data_weka.class_is_last()
-    search = ASSearch(
-        classname="weka.attributeSelection.BestFirst", options=["-D", "1", "-N", "5"],
-    )
-    evaluator = ASEvaluation(
-        classname="weka.attributeSelection.CfsSubsetEval",
-        options=["-P", "1", "-E", "1"],
-    )
-    attsel = AttributeSelection()
-    attsel.search(search)
-    attsel.evaluator(evaluator)
-    attsel.select_attributes(data_weka)
-    index_fs = [i - 1 for i in attsel.selected_attributes]
-    jvm.stop()
-    return data.columns.values[index_fs].tolist()
+    selector = get_cfs_selector()
+    selector.register(name, data)
+    return selector.select(name, range(data.shape[0]))
 
 
 def all_features(data, target_col):
@@ -65,20 +50,14 @@ def main(
         "SVM",
     ]
 
-    data_path = os.path.join(root_path, data_path, "data.csv")
     data_sampled_path = os.path.join(root_path, data_sampled_path)
-    data = pd.read_csv(data_path, index_col=index_col)
-    try:
-        data.drop(columns=["[GEO]_DIVISIONNM"], inplace=True)
-    except KeyError:
-        pass
-    try:
-        data.drop(columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], inplace=True)
-    except KeyError:
-        pass
-    data_sampled = pd.read_csv(
-        os.path.join(data_sampled_path, "data.csv"), index_col=index_col
+    # Every job shares the original dataset, parsed once into the dataset cache
+    data = load_dataset(os.path.join(root_path, data_path), index_col)
+    data = data.drop(
+        columns=["[GEO]_DIVISIONNM", "[GEO]_LATITUDE", "[GEO]_LONGITUDE"],
+        errors="ignore",
     )
+    data_sampled = load_dataset(data_sampled_path, index_col)
     data_sampled.index = data_sampled.index.astype(data.index.dtype)
     data_sampled.drop(columns=[fold_col], inplace=True)
     try:
@@ -92,7 +71,7 @@ def main(
     out_sample = data.drop(index=data_sampled.index).copy()
     columns_fold = out_sample[fold_col]
     if fs_method == "CFS":
-        features = _weka_cfs(data_sampled, target_col)
+        features = _weka_cfs(data_sampled, target_col, data_sampled_path)
     elif fs_method == "All":
         features = all_features(data_sampled, target_col)
     x = out_sample[features]
@@ -1,11 +1,24 @@
+import os
 import sys
-import subprocess
 import time
-from tqdm import tqdm
+from src.dataset import load_dataset
+from src.job_runner import JobRunner
+import out_sampled_train_pred
+
+# Imported once by each worker, whatever the process start method
+WORKER_MODULES = [
+    "pandas",
+    "lightgbm",
+    "sklearn",
+    "weka.core.jvm",
+    "src.feature_selection.cfs_worker",
+    "out_sampled_train_pred",
+]
 
 
 if __name__ == "__main__":
     t1_start = time.process_time()
+    n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else -1
     original_ds = "Original"
     root_path = "/home/tpinho/IJGIS/Datasets/Australia_Election_2019"
     fs_method = "CFS"
@@ -83,10 +96,24 @@ if __name__ == "__main__":
         "Australia_Election_2019_Sampled_dec0.05_prob0.9",
     ]
 
-    procs = []
-    for dataset_name in tqdm(australia_datasets):
-        cmd = f'python out_sampled_train_pred.py {root_path} "{dataset_name}" {original_ds} {fs_method} {index_col} {fold_col} {target_col}'
-        procs.append(subprocess.call(cmd, shell=True))
-    exit_codes = [p.wait() for p in procs]
+    # Parse the dataset shared by every job once, before the workers start
+    load_dataset(os.path.join(root_path, original_ds), index_col)
+    # Each worker keeps a single JVM for all of its CFS jobs
+    runner = JobRunner(n_jobs=n_jobs, modules=WORKER_MODULES)
+    for dataset_name in australia_datasets:
+        runner.submit(
+            out_sampled_train_pred.main,
+            root_path,
+            dataset_name,
+            original_ds,
+            fs_method,
+            index_col,
+            fold_col,
+            target_col,
+            name=dataset_name,
+        )
+    exit_codes = runner.run()
     t1_stop = time.process_time()
     print(f"time -- {(t1_start-t1_stop)/60}")
+    # Let the calling script know some of the jobs failed
+    sys.exit(1 if any(exit_codes) else 0)
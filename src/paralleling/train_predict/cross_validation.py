@@ -1,10 +1,9 @@
-import contextlib
 import os
 import sys
-import pandas as pd
 import geopandas as gpd
 from weka.core import jvm
 from src import utils
+from src.dataset import load_dataset
 from src.pipeline import Pipeline
 from src.visualization.performance import VizMetrics
 from src.visualization.dependence import VizDependence
@@ -38,11 +37,9 @@ def main(root_path, dataset, fs_method, index_col, index_fold, target_col, ml_me
     utils.initialize_rich_tracerback()
     utils.initialize_logging()
 
-    data_path = os.path.join(root_path, dataset, "data.csv")
-    # Load data
-    data = pd.read_csv(data_path, index_col=index_col, low_memory=False)
-    with contextlib.suppress(KeyError):
-        data.drop(columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], inplace=True)
+    # Load data through the shared dataset cache
+    data = load_dataset(os.path.join(root_path, dataset), index_col)
+    data = data.drop(columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], errors="ignore")
     # Run pipeline
     CrossValidation = Pipeline(
         root_path=os.path.join(root_path, dataset),
@@ -70,6 +67,6 @@ if __name__ == "__main__":
     index_col = sys.argv[4]
     fold_col = sys.argv[5]
     target_col = sys.argv[6]
-    ml_method = sys.argv[7]
+    ml_method = sys.argv[7].split(",")
     print(dataset, fs_method, index_col, fold_col, target_col)
     main(root_path, dataset, fs_method, index_col, fold_col, target_col, ml_method)
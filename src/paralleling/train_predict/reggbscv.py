@@ -1,10 +1,9 @@
-import contextlib
 import os
 import sys
-import pandas as pd
 import geopandas as gpd
 from weka.core import jvm
 from src import utils
+from src.dataset import load_dataset
 from src.pipeline import Pipeline
 from src.visualization.performance import VizMetrics
 from src.visualization.dependence import VizDependence
@@ -40,11 +39,9 @@ def main(
     utils.initialize_rich_tracerback()
     utils.initialize_logging()
 
-    data_path = os.path.join(root_path, dataset, "data.csv")
-    # Load data
-    data = pd.read_csv(data_path, index_col=index_col, low_memory=False)
-    with contextlib.suppress(KeyError):
-        data.drop(columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], inplace=True)
+    # Load data through the shared dataset cache
+    data = load_dataset(os.path.join(root_path, dataset), index_col)
+    data = data.drop(columns=["[GEO]_LATITUDE", "[GEO]_LONGITUDE"], errors="ignore")
     pipeline = Pipeline(
         root_path=os.path.join(root_path, dataset),
         data=data,
@@ -77,7 +74,7 @@ if __name__ == "__main__":
     fold_col = sys.argv[5]
     target_col = sys.argv[6]
     kappa = sys.argv[7]
-    ml_method = sys.argv[8]
+    ml_method = sys.argv[8].split(",")
 
     main(
         root_path, dataset, fs_method, index_col, fold_col, target_col, kappa, ml_method
@@ -1,23 +1,5 @@
 python run_subprocess.py CrossValidation 0.0 LGBM
 python run_subprocess.py TraditionalSCV 0.0 LGBM
 python run_subprocess.py Optimistic 0.0 LGBM
-python run_subprocess.py RegGBSCV 0.0 LGBM
-python run_subprocess.py RegGBSCV 0.1 LGBM
-python run_subprocess.py RegGBSCV 0.2 LGBM
-python run_subprocess.py RegGBSCV 0.3 LGBM
-python run_subprocess.py RegGBSCV 0.4 LGBM
-python run_subprocess.py RegGBSCV 0.5 LGBM
-#python run_subprocess.py RegGBSCV 0.6 LGBM
-#python run_subprocess.py RegGBSCV 0.7 LGBM
-#python run_subprocess.py RegGBSCV 0.8 LGBM
-#python run_subprocess.py RegGBSCV 0.9 LGBM
-#python run_subprocess.py RegGBSCV 1.0 LGBM
-
-
-
-
-
-
-
-
-
+python run_subprocess.py RegGBSCV 0.0,0.1,0.2,0.3,0.4,0.5 LGBM
+#python run_subprocess.py RegGBSCV 0.6,0.7,0.8,0.9,1.0 LGBM
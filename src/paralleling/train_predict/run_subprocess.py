@@ -1,15 +1,26 @@
+import os
 import sys
-import subprocess
 import time
-from tqdm import tqdm
+from src.scheduler import GridScheduler
+
+# Pipeline parameters of each validation method, besides the shared ones
+VAL_PARAMS = {
+    "TraditionalSCV": {},
+    "Optimistic": {},
+    "RegGBSCV": {"type_graph": "Weighted", "run_selection": False, "paper": False},
+    "CrossValidation": {},
+}
 
 
 if __name__ == "__main__":
     t1_start = time.process_time()
 
     val_method = sys.argv[1]
-    kappa = sys.argv[2]
-    ml_method = sys.argv[3]
+    # A comma separated list of kappas, only used by RegGBSCV
+    kappa = sys.argv[2].split(",")
+    # A comma separated list of ML methods is trained over the same folds
+    ml_method = tuple(sys.argv[3].split(","))
+    n_jobs = int(sys.argv[4]) if len(sys.argv) > 4 else -1
     root_path = "/home/tpinho/IJGIS/Datasets/Australia_Election_2019"
     fs_method = "CFS"
     index_col = "INDEX"
@@ -89,20 +100,23 @@ if __name__ == "__main__":
 
     single = ["US_Corn_Yield_2016_Removed_ALABAMA"]
 
-    procs = []
-    for dataset_name in australia_datasets:
-        if val_method == "TraditionalSCV":
-            cmd = f'python traditionalscv.py {root_path} "{dataset_name}" {fs_method} {index_col} {fold_col} {target_col} {ml_method}'
-            procs.append(subprocess.Popen(cmd, shell=True))
-        if val_method == "Optimistic":
-            cmd = f'python optimistic.py {root_path} "{dataset_name}" {fs_method} {index_col} {fold_col} {target_col} {ml_method}'
-            procs.append(subprocess.Popen(cmd, shell=True))
-        if val_method == "RegGBSCV":
-            cmd = f'python reggbscv.py {root_path} "{dataset_name}" {fs_method} {index_col} {fold_col} {target_col} {kappa} {ml_method}'
-            procs.append(subprocess.Popen(cmd, shell=True))
-        if val_method == "CrossValidation":
-            cmd = f'python cross_validation.py {root_path} "{dataset_name}" {fs_method} {index_col} {fold_col} {target_col} {ml_method}'
-            procs.append(subprocess.Popen(cmd, shell=True))
-    exit_codes = [p.wait() for p in procs]
+    # Each dataset fold is trained and predicted as its own task over the
+    # folds and features already on disk
+    val_params = dict(VAL_PARAMS[val_method])
+    if val_method == "RegGBSCV":
+        val_params["kappa"] = kappa
+    scheduler = GridScheduler.from_product(
+        n_jobs=n_jobs,
+        stages=["train", "predict"],
+        root_path=[os.path.join(root_path, dataset) for dataset in australia_datasets],
+        index_col=index_col,
+        fold_col=fold_col,
+        target_col=target_col,
+        scv_method=val_method,
+        fs_method=fs_method,
+        ml_method=ml_method,
+        **val_params,
+    )
+    scheduler.run()
     t1_stop = time.process_time()
     print(f"time -- {(t1_start-t1_stop)/60}")
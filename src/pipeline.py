@@ -1,9 +1,11 @@
 """Pipeline to analyse electoral data"""
 from dataclasses import dataclass, field
 from re import L
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 import inspect
 import pandas as pd
+from src.dataset import GEO_COLS, load_dataset
+from src.results import StageResults
 from src.scv.optimistic import Optimistic
 from src.scv.gbscv import GraphBasedSCV
 from src.scv.reg_gbscv import RegGraphBasedSCV
@@ -43,8 +45,9 @@ class Pipeline:
     root_path : str
         Root path
     data: pd.Dataframe
-        The spatial dataset to generate the folds
-    adj_matrix: pd.Dataframe
+        The spatial dataset shared by every process, loaded once from the
+        dataset cache when empty
+    adj_matrix: pd.Dataframe or SpatialGraph
         The adjacency matrix regarding the spatial objects in the data
     index_col: str
         The dataset´s index column name
@@ -60,10 +63,26 @@ class Pipeline:
         Graph-Based SCV kappa paramenter
     fs_method: str
         The feature selection method
-    ml_method: str
-        The machine learning method
+    ml_method: Union[str, List[str]]
+        The machine learning method, or a list of methods trained, predicting
+        and evaluated over the same fold matrices
     paper: bool
         Whether to run the spatial-cross validation according to the ICMLA21 paper
+    export_json: bool
+        Whether the spatial cross-validation also exports the folds in the
+        former json layout, split_data.json and fold_by_idx.csv
+    folds: List[str]
+        The folds the feature selection, training and prediction process,
+        every fold when None
+    n_jobs: int
+        The number of processes generating the spatial folds and selecting the
+        local features, and the cores training the models, -1 to use all cores
+    in_memory: bool
+        Whether the stages hand their results to the next one in memory
+    persist: bool
+        Whether the in-memory stages also write their artifacts to disk
+    results: StageResults
+        The results of the stages, when handed in memory
     switchers: Dict[str, int]
         Dictionary of switchers to generate the pipeline
     """
@@ -81,10 +100,16 @@ class Pipeline:
     run_selection: Optional[bool] = None
     kappa: Optional[float] = None
     fs_method: str = None
-    ml_method: str = None
+    ml_method: Union[str, List[str]] = None
     paper: bool = False
     fast: bool = False
     type_graph: str = None
+    export_json: bool = False
+    folds: List[str] = None
+    n_jobs: int = 1
+    in_memory: bool = False
+    persist: bool = True
+    results: StageResults = None
     switchers: Dict[str, str] = field(default_factory=dict)
     pipeline: List[str] = field(default_factory=list)
     cols_remove: List[str] = field(default_factory=list)
@@ -122,7 +147,11 @@ class Pipeline:
             "paper": self.paper,
             "fast": self.fast,
             "type_graph": self.type_graph,
-            "cols_remove": self.cols_remove
+            "cols_remove": self.cols_remove,
+            "export_json": self.export_json,
+            "folds": self.folds,
+            "n_jobs": self.n_jobs,
+            "results": self.results,
         }
         if params["scv_method"] == "RegGBSCV":
             if params["run_selection"]:
@@ -141,13 +170,26 @@ class Pipeline:
         """Return the initialization fucntion"""
         return PIPELINE_MAP[process]
 
-    def _init_class(self, process):
-        """Initialize a generic class"""
+    def _get_process_class(self, process):
+        """Return the class of a pipeline process"""
         if process == "scv":
-            data_class = self._get_init_function("scv")[self.scv_method]
-        else:
-            data_class = self._get_init_function(process)
+            return self._get_init_function("scv")[self.scv_method]
+        return self._get_init_function(process)
+
+    def get_process_parameters(self, process) -> Dict:
+        """Return the parameters a pipeline process is initialized with"""
+        return self._generate_parameters(self._get_process_class(process)())
+
+    def _init_class(self, process):
+        """Initialize a generic class. The spatial cross-validation gets the
+        dataset without the coordinate columns, while the other stages get the
+        whole dataset, as they would reading data.csv"""
+        data_class = self._get_process_class(process)
         parameters = self._generate_parameters(data_class())
+        if process == "scv" and isinstance(parameters.get("data"), pd.DataFrame):
+            parameters["data"] = parameters["data"].drop(
+                columns=GEO_COLS, errors="ignore"
+            )
         return data_class(**parameters)
 
     def _init_evaluate(self, process):
@@ -177,8 +219,22 @@ class Pipeline:
         for process in pipeline_order:
             self.pipeline.append(self.map_pipeline_process(process))
 
-    def run(self):
+    def _load_data(self):
+        """Load the dataset once, so every process shares the same frame"""
+        self.data = load_dataset(self.root_path, self.index_col, self.data)
+
+    def _init_results(self):
+        """Initialize the stage results when they are handed in memory"""
+        if self.in_memory:
+            self.results = StageResults(persist=self.persist)
+
+    def run(self) -> StageResults:
         """Run pipeline"""
+        self._load_data()
+        self._init_results()
         self.generate_pipeline()
         for process in self.pipeline:
             process.run()
+        if self.results is not None:
+            self.results.wait()
+        return self.results
@@ -0,0 +1,120 @@
+"""In-memory results handed between the pipeline stages"""
+import os
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Union
+import pandas as pd
+from src.fold_store import FoldStore
+from src.node_index import NodeIndex
+from src.stage_cache import StageCache
+
+
+@dataclass
+class StageResults:
+    """Represents the results of the pipeline stages kept in memory.
+
+    Each stage fills its own result and the next stage reads it straight from
+    here instead of from the files written by the previous one. Writing the
+    artifacts to disk is optional, and done in a background thread so it does
+    not hold back the stages.
+
+    Attributes
+    ----------
+        folds: FoldStore
+            The partitions of every spatial fold
+        selected_features: Dict[str, List[str]]
+            The features selected for each fold
+        models: Dict[str, Dict[str, Any]]
+            The model trained on each fold, per ML method
+        predictions: Dict[str, Dict[str, pd.DataFrame]]
+            The predictions and ground truth of each fold test set, per ML
+            method
+        metrics: Dict[str, pd.DataFrame]
+            The evaluation metrics of every fold, per ML method
+        persist: bool
+            Whether to also write the artifacts to disk
+        caches: Dict[str, StageCache]
+            The artifact keys of each stage folder, shared so a stage sees the
+            keys of the previous one before they are written
+    """
+
+    folds: FoldStore = None
+    selected_features: Dict[str, List[str]] = field(default_factory=dict)
+    models: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    predictions: Dict[str, Dict[str, pd.DataFrame]] = field(default_factory=dict)
+    metrics: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    persist: bool = True
+    caches: Dict[str, StageCache] = field(default_factory=dict)
+    _executor: ThreadPoolExecutor = None
+    _pending: List[Future] = field(default_factory=list)
+
+    def __getstate__(self):
+        # Fold workers receive the results with their stage, but never write
+        state = self.__dict__.copy()
+        state["_executor"], state["_pending"] = None, []
+        return state
+
+    def write(self, function, *args, **kwargs):
+        """Run the writing function in the background, unless not persisting"""
+        if not self.persist:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending.append(self._executor.submit(function, *args, **kwargs))
+
+    def wait(self):
+        """Wait for the pending writes, raising their errors"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def get_ml_methods(ml_method: Union[str, List[str]]) -> List[str]:
+    """Return the ML methods of a stage given one method or a list of them"""
+    if isinstance(ml_method, str):
+        return [ml_method]
+    return list(ml_method)
+
+
+def filter_folds(fold_names: List[str], folds: List[str] = None) -> List[str]:
+    """Return the fold names among the given folds, every fold when None"""
+    if folds is None:
+        return list(fold_names)
+    folds = {str(fold) for fold in folds}
+    return [fold for fold in fold_names if str(fold) in folds]
+
+
+def get_fold_store(
+    results: StageResults, folds_path: str, node_index: NodeIndex = None
+) -> FoldStore:
+    """Return the fold store, taken from the stage results when in memory or
+    loaded from the folds folder otherwise. It is aligned to the dataset node
+    index when one is given"""
+    if results is None or results.folds is None:
+        store = FoldStore.load(folds_path)
+    else:
+        store = results.folds
+    return store if node_index is None else store.align(node_index)
+
+
+def get_selected_features(results: StageResults, fs_path: str, fold) -> List[str]:
+    """Return the features selected for the fold, taken from the stage results
+    when in memory or read from its json file otherwise"""
+    if results is not None and fold in results.selected_features:
+        return results.selected_features[fold]
+    with open(os.path.join(fs_path, f"{fold}.json"), encoding="utf-8") as file:
+        return json.load(file)["selected_features"]
+
+
+def get_stage_cache(results: StageResults, path: str) -> StageCache:
+    """Return the artifact keys of a stage folder, shared through the stage
+    results when in memory"""
+    if results is None:
+        return StageCache.load(path)
+    if path not in results.caches:
+        results.caches[path] = StageCache.load(path)
+    return results.caches[path]
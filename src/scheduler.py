@@ -0,0 +1,247 @@
+"""Scheduler of experiment grids as a DAG of pipeline stage and fold tasks"""
+import os
+import itertools
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from src.fold_store import FoldStore
+from src.pipeline import Pipeline
+from src.stage_cache import fingerprint
+
+STAGES = ["scv", "fs", "train", "predict", "evaluate"]
+# Stages run as one task per fold
+FOLD_STAGES = ["fs", "train", "predict"]
+# Parameters that do not identify the output of a stage
+UNKEYED_PARAMS = ["data", "adj_matrix", "w_matrix", "meshblocks", "results", "folds"]
+
+
+def _run_task(stage: str, params: Dict, fold: str = None):
+    """Run a single pipeline stage of an experiment in a worker process, on a
+    single fold when given"""
+    switchers = {process: process == stage for process in STAGES}
+    folds = None if fold is None else [fold]
+    Pipeline(switchers=switchers, **params, folds=folds).run()
+
+
+@dataclass
+class Task:
+    """Represents a pipeline stage run shared by one or more experiments.
+
+    Attributes
+    ----------
+        stage: str
+            The pipeline stage name
+        params: Dict
+            The pipeline parameters of the first experiment requiring the task
+        parent: Tuple
+            The key of the task whose output this one reads, if any
+    """
+
+    stage: str = None
+    params: Dict = field(default_factory=dict)
+    parent: Tuple = None
+
+
+@dataclass
+class GridScheduler:
+    """Represents the scheduler of an experiment grid.
+
+    Each experiment of the grid is expanded into its scv, fs, train, predict
+    and evaluate stages. A stage is identified by its output folder, so the
+    folds and features shared by several ML methods are computed once. Once
+    the folds of a spatial cross-validation exist, its fs, train and predict
+    stages are split into one task per fold, and the evaluation waits for
+    the predictions of every fold. Every task only depends on its upstream
+    task, and ready tasks run concurrently in a process pool, so the grid
+    takes as long as its critical path given enough workers. Stages
+    unchanged since a previous run are skipped by the stage cache, whose keys
+    are written per fold so the fold tasks of a stage never overwrite each
+    other.
+
+    Stages left out of the stages list are not run, their outputs being read
+    from disk, e.g. only training and predicting over existing folds and
+    features. The stages hand their results through disk, as each task runs
+    in its own process, so in-memory grids are rejected.
+
+    Attributes
+    ----------
+        grid: List[Dict]
+            The pipeline parameters of each experiment
+        n_jobs: int
+            The number of tasks running in parallel, -1 to use all the cores
+        stages: List[str]
+            The stages to run
+    """
+
+    grid: List[Dict] = field(default_factory=list)
+    n_jobs: int = 1
+    stages: List[str] = field(default_factory=lambda: list(STAGES))
+    _tasks: Dict[Tuple, Task] = field(default_factory=dict)
+
+    @classmethod
+    def from_product(
+        cls, n_jobs: int = 1, stages: List[str] = None, **param_grid
+    ) -> "GridScheduler":
+        """Build the grid from the cartesian product of the parameter lists.
+        Parameters given as a single value are shared by every experiment, and
+        a tuple of ML methods is a single value, trained over the same folds"""
+        names = list(param_grid)
+        values = [
+            value if isinstance(value, list) else [value]
+            for value in param_grid.values()
+        ]
+        grid = [dict(zip(names, combo)) for combo in itertools.product(*values)]
+        return cls(grid=grid, n_jobs=n_jobs, stages=stages or list(STAGES))
+
+    @staticmethod
+    def _get_task_keys(params: Dict) -> List[Tuple]:
+        """Return the key of each stage of an experiment: the dataset root path
+        and its output folder, as built by the stages"""
+        scv_method = Pipeline(**params).get_process_parameters("fs")["scv_method"]
+        root_path = params.get("root_path")
+        fs_method, ml_method = params.get("fs_method"), params.get("ml_method")
+        if not isinstance(ml_method, str) and ml_method is not None:
+            # The methods trained over the same fold matrices share the tasks
+            ml_method = tuple(ml_method)
+        results = (root_path, scv_method)
+        return [
+            ("scv", root_path, "folds", scv_method),
+            ("fs",) + results + ("features_selected", fs_method),
+            ("train",) + results + ("trained_models", fs_method, ml_method),
+            ("predict",) + results + ("predictions", fs_method, ml_method),
+            ("evaluate",) + results + ("evaluations", fs_method, ml_method),
+        ]
+
+    @staticmethod
+    def _get_stage_signature(stage: str, params: Dict):
+        """Return the fingerprint of the parameters the stage is built with"""
+        stage_params = Pipeline(**params).get_process_parameters(stage)
+        return fingerprint(
+            {
+                name: value
+                for name, value in stage_params.items()
+                if name not in UNKEYED_PARAMS
+            }
+        )
+
+    @staticmethod
+    def _check_params(params: Dict):
+        """Reject the parameters the stages cannot honour across processes"""
+        if params.get("in_memory") or params.get("persist") is False:
+            raise ValueError(
+                "Scheduled grids hand the stage results through disk: "
+                "in_memory and persist=False are not supported"
+            )
+        if params.get("folds") is not None:
+            raise ValueError("Scheduled grids split the stages per fold themselves")
+
+    def _add_task(self, key: Tuple, params: Dict, parent: Tuple):
+        """Add the stage task, unless an equal one already exists"""
+        stage = key[0]
+        if key not in self._tasks:
+            self._tasks[key] = Task(stage=stage, params=params, parent=parent)
+            return
+        signature = self._get_stage_signature(stage, params)
+        if signature != self._get_stage_signature(stage, self._tasks[key].params):
+            raise ValueError(
+                f"Experiments write different {stage} outputs to the same folder: "
+                f"{key}"
+            )
+
+    def _build_tasks(self) -> Dict[Tuple, Task]:
+        """Expand the grid into its deduplicated stage tasks"""
+        self._tasks = {}
+        for params in self.grid:
+            self._check_params(params)
+            parent = None
+            for key in self._get_task_keys(params):
+                self._add_task(key, params, parent)
+                parent = key
+        return self._tasks
+
+    def _get_n_jobs(self) -> int:
+        """Return the number of worker processes"""
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        return max(1, n_jobs or 1)
+
+    @staticmethod
+    def _get_folds(scv_key: Tuple) -> List[str]:
+        """Return the folds written by a spatial cross-validation task"""
+        _, root_path, folder, scv_method = scv_key
+        return FoldStore.load(os.path.join(root_path, folder, scv_method)).get_folds()
+
+    def _expand(self, scv_key: Tuple, children: Dict) -> Dict[Tuple, List[Tuple]]:
+        """Return the parent nodes of every node downstream of a spatial
+        cross-validation. A node is a stage task key and a fold, None for the
+        stages run over every fold at once"""
+        folds = self._get_folds(scv_key)
+        parents = {}
+        stack = list(children[scv_key])
+        while stack:
+            key = stack.pop()
+            task = self._tasks[key]
+            parent_is_fold = self._tasks[task.parent].stage in FOLD_STAGES
+            if task.stage in FOLD_STAGES:
+                for fold in folds:
+                    parent_fold = fold if parent_is_fold else None
+                    parents[(key, fold)] = [(task.parent, parent_fold)]
+            else:
+                parents[(key, None)] = [(task.parent, fold) for fold in folds]
+            stack.extend(children[key])
+        return parents
+
+    def run(self):
+        """Run every task once its upstream tasks finished"""
+        tasks = self._build_tasks()
+        children = defaultdict(list)
+        for key, task in tasks.items():
+            children[task.parent].append(key)
+        waiting = {(key, None): 0 for key in children[None]}
+        dependents = defaultdict(list)
+        ready = [node for node, count in waiting.items() if count == 0]
+
+        def finish(node):
+            key, _ = node
+            if tasks[key].stage == "scv":
+                for child, parents in self._expand(key, children).items():
+                    waiting[child] = len(parents)
+                    for parent in parents:
+                        dependents[parent].append(child)
+            for child in dependents.pop(node, []):
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    ready.append(child)
+
+        def is_skipped(node):
+            return tasks[node[0]].stage not in self.stages
+
+        n_jobs = self._get_n_jobs()
+        if n_jobs == 1:
+            while ready:
+                node = ready.pop(0)
+                if not is_skipped(node):
+                    key, fold = node
+                    _run_task(tasks[key].stage, tasks[key].params, fold)
+                finish(node)
+            return
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            running = {}
+            while ready or running:
+                while ready:
+                    node = ready.pop(0)
+                    if is_skipped(node):
+                        finish(node)
+                        continue
+                    key, fold = node
+                    future = executor.submit(
+                        _run_task, tasks[key].stage, tasks[key].params, fold
+                    )
+                    running[future] = node
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    future.result()
+                    finish(node)
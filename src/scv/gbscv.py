@@ -1,12 +1,13 @@
 """Generate graph-based cross-validation spatial folds"""
-import os
 import time
-from typing import Dict, List
+from typing import Dict, Tuple
 from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
 from sklearn.decomposition import PCA
-from tqdm import tqdm
+from src.graph import SpatialGraph, load_graph
+from src.hop_distance import HopDistances, load_hop_distances
+from src.fold_store import FoldStore
 from src.scv.scv import SpatialCV
 
 
@@ -27,7 +28,8 @@ class GraphBasedSCV(SpatialCV):
         target_col: str
             The targer attribute column name
         adj_matrix: pd.Dataframe
-            The adjacency matrix regarding the spatial objects in the data
+            The adjacency matrix regarding the spatial objects in the data. If
+            empty, the graph is read from the queen_matrix.csv in the root path
         paper: bool
             Whether to run experiments according to ICMLA21 paper
         root_path : str
@@ -41,10 +43,21 @@ class GraphBasedSCV(SpatialCV):
     paper: bool = False
     sill_target: Dict = field(default_factory=dict)
     sill_reduced: Dict = field(default_factory=dict)
+    _graph: SpatialGraph = None
+    _hops: HopDistances = None
+    _fold_levels: np.ndarray = None
+    _folds: np.ndarray = None
+    _test_idx: np.ndarray = None
+    _train_mask: np.ndarray = None
+    _hop_levels: np.ndarray = None
 
     def _init_fields(self):
         self.sill_target = {}
         self.sill_reduced = {}
+        self._init_node_index()
+        self._graph = load_graph(self.adj_matrix, self.root_path, self._nodes)
+        self._folds = self.data[self.fold_col].to_numpy()
+        self._hops = load_hop_distances(self._graph, self._folds, self.root_path)
 
     def _calculate_train_pca(self) -> np.array:
         """Return the PCA first component transformation on the traind data"""
@@ -88,94 +101,106 @@ class GraphBasedSCV(SpatialCV):
                 fold_name, fold_data, global_target_var
             )
 
-    def _convert_adj_matrix_index_types(self) -> pd.DataFrame:
-        """Convert adjacenty matrixy index and columns types to the same as in the data"""
-        self.adj_matrix.index = self.adj_matrix.index.astype(self.data.index.dtype)
-        self.adj_matrix.columns = self.adj_matrix.columns.astype(self.data.index.dtype)
+    def _get_nodes_mask(self, positions) -> np.ndarray:
+        """Return a boolean mask over the graph nodes flagging the given positions"""
+        mask = np.zeros(self._graph.n_nodes, dtype=bool)
+        mask[positions] = True
+        return mask
 
-    @staticmethod
-    def _get_neighbors(indexes, adj_matrix) -> List:
-        """Return the 1-degree neighborhood from a given sub-graph formed by indexes"""
-        area_matrix = adj_matrix.loc[indexes]
-        neighbors = area_matrix.sum(axis=0) > 0
-        neighbors = neighbors[neighbors].index
-        neighbors = [n for n in neighbors if n not in indexes]
-        return neighbors
+    def _set_fold_positions(self):
+        """Set the test positions and the training mask of the current fold"""
+        self._test_idx = self._nodes.positions(self.test_data.index)
+        self._train_mask = self._get_nodes_mask(
+            self._nodes.positions(self.train_data.index)
+        )
+
+    def _get_neighbors(self, positions, mask=None) -> np.ndarray:
+        """Return the 1-degree neighborhood from a given sub-graph formed by positions.
+        If mask is given, the neighborhood is restricted to the nodes flagged in it"""
+        return self._graph.neighbors(positions, mask)
 
     def _calculate_longest_path(self) -> int:
-        """Calculate the longest_path from a BFS tree taking the test set as root"""
-        path_indexes = self.test_data.index.values.tolist()
-        local_data_idx = (
-            self.test_data.index.values.tolist() + self.train_data.index.values.tolist()
-        )
-        matrix = self.adj_matrix.loc[local_data_idx, local_data_idx]
-        neighbors = self._get_neighbors(path_indexes, matrix)
-        size_tree = 0
-        while len(neighbors) > 0:
-            size_tree += 1
-            neighbors = self._get_neighbors(path_indexes, matrix)
-            path_indexes = path_indexes + neighbors
-        return size_tree
-
-    def _calculate_similarity_matrix(self, fold_data, attribute) -> np.ndarray:
-        """Calculate the similarity matrix between test set and a given training
-        fold set based on a given attribute"""
-        test_values = self.test_data[attribute].to_numpy()
-        fold_values = fold_data[attribute].to_numpy()
-        return np.subtract.outer(test_values, fold_values) ** 2
+        """Calculate the longest_path from a BFS tree taking the test set as root.
+        The hop level of each node in the local graph is kept for the fold"""
+        local_mask = self._train_mask.copy()
+        local_mask[self._test_idx] = True
+        self._hop_levels = self._graph.bfs_levels(self._test_idx, local_mask)
+        depth = self._hop_levels.max()
+        # The tree size also counts the last, empty, level reached by the search
+        return int(depth) + 1 if depth > 0 else 0
+
+    def _update_frontier(self, neighbors, added, growing_mask) -> np.ndarray:
+        """Return the neighborhood of the growing graph after adding the given
+        positions, expanding only the new nodes instead of the whole graph"""
+        new_neighbors = self._get_neighbors(added)
+        frontier = np.union1d(neighbors, new_neighbors)
+        return frontier[~growing_mask[frontier]]
+
+    @staticmethod
+    def _calculate_moments(values, center) -> Tuple[np.float64, np.float64]:
+        """Return the mean and the mean of squares of the centered values"""
+        centered = values - center
+        return centered.mean(), np.mean(centered**2)
 
     @staticmethod
-    def _calculate_gamma(similarity) -> np.float64:
-        """Calculate gamma or the semivariogram"""
-        gamma_dist = np.sum(similarity, axis=1)
-        sum_diff = gamma_dist.sum()
-        sum_dist = similarity.size
-        return sum_diff / (2 * sum_dist)
+    def _calculate_gamma(test_moments, fold_moments) -> np.float64:
+        """Calculate gamma or the semivariogram, the half mean squared difference
+        over every test x fold pair, from the moments of both sets"""
+        test_mean, test_sq = test_moments
+        fold_mean, fold_sq = fold_moments
+        return (test_sq + fold_sq - 2 * test_mean * fold_mean) / 2
 
     def _calculate_gamma_by_fold(self, neighbors, attribute) -> Dict:
         """Calculate the semivariogram by folds"""
         context_gamma = {}
-        neighbors = [n for n in neighbors if n in self.train_data.index]
-        neighbors_data = self.train_data.loc[neighbors]
-        for fold, fold_data in neighbors_data.groupby(by=self.fold_col):
-            similarity = self._calculate_similarity_matrix(fold_data, attribute)
-            gamma = self._calculate_gamma(similarity)
+        neighbors = neighbors[self._train_mask[neighbors]]
+        neighbors_folds = self._folds[neighbors]
+        values = self.data[attribute].to_numpy()
+        # Centering on the test mean avoids cancellation on the moments formula
+        center = values[self._test_idx].mean()
+        test_moments = self._calculate_moments(values[self._test_idx], center)
+        for fold in np.unique(neighbors_folds):
+            fold_neighbors = neighbors[neighbors_folds == fold]
+            fold_moments = self._calculate_moments(values[fold_neighbors], center)
+            gamma = self._calculate_gamma(test_moments, fold_moments)
             context_gamma[fold] = {
                 "gamma": gamma,
-                "neighbors": fold_data.index.values.tolist(),
+                "neighbors": fold_neighbors,
             }
         return context_gamma
 
     def _get_n_fold_neighbohood(self) -> int:
         """Get ne number of folds neighbors from the test set"""
-        neighbors_idx = self._get_neighbors(self.test_data.index, self.adj_matrix)
-        neighbors_idx = [n for n in neighbors_idx if n in self.data.index]
-        return len(self.data.loc[neighbors_idx].groupby(self.fold_col))
+        neighbors = np.flatnonzero(self._fold_levels[: len(self._nodes)] == 1)
+        return len(np.unique(self._folds[neighbors]))
 
     @staticmethod
     def _calculate_exponent(size_tree, count_n) -> np.float64:
         """Caclulate the decay exponent"""
         return np.log(1 * size_tree - count_n) / np.log(1 * size_tree)
 
-    def _calculate_buffer(self, attribute, sill, kappa) -> List:
+    def _calculate_buffer(self, attribute, sill, kappa) -> np.ndarray:
         """Calculate a buffer region"""
         # Initialize variables
         count_n = 0  # n-degree neighborhood counter
         growing = 1  # indicate wether the buffer still growing
-        buffer = []  # containg the index of instaces buffered
+        buffer = np.array([], dtype=np.int64)  # containg the positions buffered
         folds_in_buffer = []  # list of folds presented in the buffer
+        # Get the test positions and training mask of the fold
+        self._set_fold_positions()
         # Get the size of the BFS tree with the test set as  root
         size_tree = self._calculate_longest_path()
         # Get the number of fold neighbors the test set has
         n_fold_neighbors = self._get_n_fold_neighbohood()
+        # The growing graph is the test set + the positions buffered
+        growing_mask = self._get_nodes_mask(self._test_idx)
+        # Get the neighbor
+        neighbors = self._get_neighbors(self._test_idx)
         # Start creating the buffer
         while growing:
             # Set growing to 0
             growing = 0
-            # Get the instance indexes from te test set + the indexes buffer
-            growing_graph_idx = self.test_data.index.values.tolist() + buffer
-            # Get the neighbor
-            neighbors = self._get_neighbors(growing_graph_idx, self.adj_matrix)
+            added = []
             # Calculate the semivariogram for each fold in the neighborhood
             context_gamma = self._calculate_gamma_by_fold(neighbors, attribute)
             # Check for each fold in the neighborhood the semivariogram to decide
@@ -188,55 +213,62 @@ class GraphBasedSCV(SpatialCV):
                 if gamma <= sill_value and n_contexts <= n_fold_neighbors * kappa:
                     folds_in_buffer.append(context_key)
                     growing = 1
-                    buffer += context_gamma[context_key]["neighbors"]
+                    added.append(context["neighbors"])
             count_n += 1
+            if growing:
+                added = np.concatenate(added)
+                buffer = np.concatenate([buffer, added])
+                growing_mask[added] = True
+                neighbors = self._update_frontier(neighbors, added, growing_mask)
         return buffer
 
-    def run(self):
+    def _run_fold(self, fold_name, test_data):
+        """Generate a single graph-based fold"""
+        # Cread fold folder
+        self._enter_fold_dir(fold_name)
+        # Initialize x , y and reduce
+        self._split_data_test_train(test_data)
+        self._fold_levels = self._hops.levels(fold_name)
+        # Calculate local sill
+        self._initiate_buffers_sills()
+        # Calculate selection buffer
+        if self.run_selection:
+            selection_buffer = self._calculate_buffer(
+                X_1DIM_COL, self.sill_reduced, kappa=self.kappa
+            )
+            self.train_data = self.data.take(np.unique(selection_buffer))
+        # The train data is used to calcualte the buffer. Thus, the size tree,
+        # and the gamma calculation will be influenced by the selection buffer.
+        # Calculate removing buffer
+        removing_buffer = self._calculate_buffer(
+            self.target_col, self.sill_target, kappa=self.kappa
+        )
+        removing_buffer = self._nodes.get_labels(np.unique(removing_buffer))
+        self.train_data.drop(index=removing_buffer, inplace=True)
+        # Save buffered data indexes
+        self._save_buffered_indexes(removing_buffer)
+        # Clean data
+        self._clean_data(cols_drop=[X_1DIM_COL, self.fold_col])
+        # Save data
+        if self.export_json:
+            self._save_data()
+
+    def run(self) -> FoldStore:
         """Generate graph-based spatial folds"""
         # Create folder folds
         start_time = time.time()
         name_folds = SRBUFFER if self.run_selection else RBUFFER
-        self._init_fields()
         self._make_folders(["folds", name_folds])
+        fold_store = self._get_cached_fold_store()
+        if fold_store is not None:
+            return fold_store
+        self._init_fields()
+        # Shallow copy, so the reduced column is not added to the shared dataset
+        self.data = self.data.copy(deep=False)
         self.data[X_1DIM_COL] = self._calculate_train_pca()
-        for fold_name, test_data in tqdm(
-            self.data.groupby(by=self.fold_col), desc="Creating folds"
-        ):
-            # Cread fold folder
-            self._mkdir(str(fold_name))
-            # Initialize x , y and reduce
-            self._split_data_test_train(test_data)
-            # Calculate local sill
-            self._initiate_buffers_sills()
-            # Ensure indexes and columns compatibility
-            self._convert_adj_matrix_index_types()
-            # Calculate selection buffer
-            if self.run_selection:
-                selection_buffer = self._calculate_buffer(
-                    X_1DIM_COL, self.sill_reduced, kappa=self.kappa
-                )
-                selection_buffer = list(set(selection_buffer))
-                self.train_data = self.train_data.loc[selection_buffer]
-            # The train data is used to calcualte the buffer. Thus, the size tree,
-            # and the gamma calculation will be influenced by the selection buffer.
-            # Calculate removing buffer
-            removing_buffer = self._calculate_buffer(
-                self.target_col, self.sill_target, kappa=self.kappa
-            )
-            removing_buffer = list(set(removing_buffer))
-            self.train_data.drop(index=removing_buffer, inplace=True)
-            # Save buffered data indexes
-            self._save_buffered_indexes(removing_buffer)
-            # Save fold index relation table
-            self._save_fold_by_index_training()
-            # Clean data
-            self._clean_data(cols_drop=[X_1DIM_COL, self.fold_col])
-            # Save data
-            self._save_data()
-            # Update cur dir
-            self.cur_dir = os.path.join(self._get_root_path(), "folds", name_folds)
+        fold_store = self._run_folds()
         # Save execution time
         end_time = time.time()
         self._save_time(end_time, start_time)
         print(f"Execution time: {end_time-start_time} seconds")
+        return fold_store
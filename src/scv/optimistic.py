@@ -1,8 +1,7 @@
 """Generate optmistic spatial folds"""
-import os
 import time
 from dataclasses import dataclass
-from tqdm import tqdm
+from src.fold_store import FoldStore
 from src.scv.scv import SpatialCV
 
 OPTIMISTIC = "Optimistic"
@@ -23,31 +22,35 @@ class Optimistic(SpatialCV):
             Root path
     """
 
-    def run(self) -> None:
+    def _get_folds(self):
+        """Return the fold name and test set of each fold, but the null fold"""
+        return [(name, test) for name, test in super()._get_folds() if name != -1]
+
+    def _run_fold(self, fold_name, test_data):
+        """Generate a single optimistic fold"""
+        # Cread fold folder
+        self._enter_fold_dir(fold_name)
+        # Initialize x , y and reduce
+        self._split_data_test_train(test_data)
+        # Save buffered data indexes
+        self._save_buffered_indexes(removing_buffer=[])
+        # Clean data
+        self._clean_data(cols_drop=[self.fold_col])
+        # Save data
+        # self._save_data()
+
+    def run(self) -> FoldStore:
         """Generate merged data"""
         # Create folder folds
         start_time = time.time()
         name_folds = OPTIMISTIC
         self._make_folders(["folds", name_folds])
-        for fold_name, test_data in tqdm(
-            self.data.groupby(by=self.fold_col), desc="Creating folds"
-        ):
-            if fold_name != -1:  # Null fold
-                # Cread fold folder
-                self._mkdir(str(fold_name))
-                # Initialize x , y and reduce
-                self._split_data_test_train(test_data)
-                # Save buffered data indexes
-                self._save_buffered_indexes(removing_buffer=[])
-                # Save fold index relation table
-                self._save_fold_by_index_training()
-                # Clean data
-                self._clean_data(cols_drop=[self.fold_col])
-                # Save data
-                # self._save_data()
-                # Update cur dir
-                self.cur_dir = os.path.join(self._get_root_path(), "folds", name_folds)
+        fold_store = self._get_cached_fold_store()
+        if fold_store is not None:
+            return fold_store
+        fold_store = self._run_folds()
         # Save execution time
         end_time = time.time()
         self._save_time(end_time, start_time)
         print(f"Execution time: {end_time-start_time} seconds")
+        return fold_store
@@ -1,13 +1,15 @@
 """Generate graph-based cross-validation spatial folds"""
-import os
 import time
 from typing import Dict, List
 from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
 from sklearn.decomposition import PCA
-from tqdm import tqdm
+from src.graph import SpatialGraph, load_graph
+from src.hop_distance import HopDistances, load_hop_distances
+from src.fold_store import FoldStore
 from src.scv.scv import SpatialCV
+from src.weights import Weights, load_weights
 
 
 X_1DIM_COL = "X_1DIM"
@@ -25,9 +27,15 @@ class RegGraphBasedSCV(SpatialCV):
         target_col: str
             The targer attribute column name
         adj_matrix: pd.Dataframe
-            The adjacency matrix regarding the spatial objects in the data
+            The adjacency matrix regarding the spatial objects in the data. If
+            empty, the graph is read from the queen_matrix.csv in the root path
         paper: bool
             Whether to run experiments according to ICMLA21 paper
+        type_graph: str
+            Sparse to weight every pair of nodes as one, or Weighted to use w_matrix
+        w_matrix: pd.Dataframe or Weights
+            The weights between the spatial objects. If empty, the weights are read
+            from the normd_matrix.csv in the root path
         root_path : str
             Root path
     """
@@ -42,13 +50,22 @@ class RegGraphBasedSCV(SpatialCV):
     sill_reduced: Dict = field(default_factory=dict)
     sill_max_reduced: Dict = field(default_factory=dict)
     w_matrix: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _graph: SpatialGraph = None
+    _hops: HopDistances = None
+    _weights: Weights = None
+    _folds: np.ndarray = None
+    _test_idx: np.ndarray = None
+    _train_mask: np.ndarray = None
+    _hop_levels: np.ndarray = None
 
     def _init_fields(self):
-        if self.type_graph == "Sparse":
-            self.w_matrix = pd.DataFrame(
-                index=self.adj_matrix.index, columns=self.adj_matrix.columns
-            )
-            self.w_matrix.fillna(1, inplace=True)
+        self._init_node_index()
+        self._graph = load_graph(self.adj_matrix, self.root_path, self._nodes)
+        self._folds = self.data[self.fold_col].to_numpy()
+        self._hops = load_hop_distances(self._graph, self._folds, self.root_path)
+        self._weights = load_weights(
+            self.type_graph, self.w_matrix, self.root_path, self._graph
+        )
         self.sill_target = {}
         self.sill_reduced = {}
         self.sill_max_reduced = {}
@@ -97,97 +114,125 @@ class RegGraphBasedSCV(SpatialCV):
                 fold_name, fold_data, global_target_var
             )
 
-    def _convert_adj_matrix_index_types(self) -> pd.DataFrame:
-        """Convert adjacenty matrixy index and columns types to the same as in the data"""
-        self.adj_matrix.index = self.adj_matrix.index.astype(self.data.index.dtype)
-        self.adj_matrix.columns = self.adj_matrix.columns.astype(self.data.index.dtype)
-        self.w_matrix.index = self.w_matrix.index.astype(self.data.index.dtype)
-        self.w_matrix.columns = self.w_matrix.columns.astype(self.data.index.dtype)
+    def _get_nodes_mask(self, positions) -> np.ndarray:
+        """Return a boolean mask over the graph nodes flagging the given positions"""
+        mask = np.zeros(self._graph.n_nodes, dtype=bool)
+        mask[positions] = True
+        return mask
 
-    @staticmethod
-    def _get_neighbors(indexes, adj_matrix) -> List:
-        """Return the 1-degree neighborhood from a given sub-graph formed by indexes"""
-        area_matrix = adj_matrix.loc[indexes]
-        neighbors = area_matrix.sum(axis=0) > 0
-        neighbors = neighbors[neighbors].index
-        neighbors = [n for n in neighbors if n not in indexes]
-        return neighbors
+    def _set_fold_positions(self):
+        """Set the test positions and the training mask of the current fold"""
+        self._test_idx = self._nodes.positions(self.test_data.index)
+        self._train_mask = self._get_nodes_mask(
+            self._nodes.positions(self.train_data.index)
+        )
+
+    def _get_neighbors(self, positions, mask=None) -> np.ndarray:
+        """Return the 1-degree neighborhood from a given sub-graph formed by positions.
+        If mask is given, the neighborhood is restricted to the nodes flagged in it"""
+        return self._graph.neighbors(positions, mask)
 
     def _calculate_longest_path(self) -> int:
         """Calculate the longest_path from a BFS tree taking the test set as root"""
-        path_indexes = self.test_data.index.values.tolist()
-        local_data_idx = (
-            self.test_data.index.values.tolist() + self.train_data.index.values.tolist()
-        )
-        matrix = self.adj_matrix.loc[local_data_idx, local_data_idx]
-        neighbors = self._get_neighbors(path_indexes, matrix)
-        size_tree = 0
-        while len(neighbors) > 0:
-            size_tree += 1
-            neighbors = self._get_neighbors(path_indexes, matrix)
-            path_indexes = path_indexes + neighbors
-        return size_tree
-
-    def _calculate_similarity_matrix(self, fold_data, attribute) -> np.ndarray:
-        """Calculate the similarity matrix between test set and a given training
-        fold set based on a given attribute"""
+        local_mask = self._train_mask.copy()
+        local_mask[self._test_idx] = True
+        depth = self._graph.bfs_levels(self._test_idx, local_mask).max()
+        # The tree size also counts the last, empty, level reached by the search
+        return int(depth) + 1 if depth > 0 else 0
+
+    def _calculate_hop_levels(self, fold_name):
+        """Set the hop level of every node from the test set of the fold.
+        Both the selection and the removing propagation reuse these levels"""
+        self._hop_levels = self._hops.levels(fold_name)
+
+    def _get_hop_layers(self) -> List[np.ndarray]:
+        """Return the node positions of each hop level, from the 1-degree on"""
+        reached = np.flatnonzero(self._hop_levels > 0)
+        levels = self._hop_levels[reached]
+        reached = reached[np.argsort(levels, kind="stable")]
+        bounds = np.flatnonzero(np.diff(np.sort(levels))) + 1
+        return np.split(reached, bounds) if len(reached) > 0 else []
+
+    def _calculate_similarity_matrix(self, node_values, attribute) -> np.ndarray:
+        """Calculate the similarity matrix between test set and the given training
+        nodes based on a given attribute, one column per node"""
         test_values = self.test_data[attribute].to_numpy()
-        node_values = fold_data[attribute]
-        return (test_values - node_values) ** 2
+        return np.subtract.outer(test_values, node_values) ** 2
 
     @staticmethod
-    def _calculate_gamma(similarity, geo_weights, kappa) -> np.float64:
-        """Calculate gamma or the semivariogram"""
+    def _calculate_gamma(similarity, geo_weights, kappa) -> np.ndarray:
+        """Calculate gamma or the semivariogram of each similarity column"""
         gamma_dist = similarity - (kappa * (1 - geo_weights) * similarity)
-        sum_diff = np.sum(gamma_dist)
+        sum_diff = np.nansum(gamma_dist, axis=0)
         sum_dist = len((similarity))
         return sum_diff / (2 * sum_dist)
 
-    def _get_neighbors_weights(self, index):
+    def _get_neighbors_weights(self, positions) -> np.ndarray:
         """Return the matrix weights test set x neighbors"""
-        return self.w_matrix.loc[self.test_data.index, index]
+        return self._weights.block(self._test_idx, positions)
 
-    def _calculate_gamma_by_node(self, neighbors, attribute, kappa) -> Dict:
-        """Calculate the semivariogram by folds"""
+    def _calculate_gamma_by_node(self, neighbors, attributes, kappa) -> Dict:
+        """Calculate the semivariogram of each node in the neighborhood at once,
+        for each attribute, sharing the weights lookup"""
+        neighbors = neighbors[self._train_mask[neighbors]]
+        geo_weights = self._get_neighbors_weights(neighbors)
         nodes_gamma = {}
-        neighbors = [n for n in neighbors if n in self.train_data.index]
-        neighbors_data = self.train_data.loc[neighbors]
-        for index, node_data in neighbors_data.iterrows():
-            similarity = self._calculate_similarity_matrix(node_data, attribute)
-            geo_weights = self._get_neighbors_weights(index)
+        for attribute in attributes:
+            values = self.data[attribute].to_numpy()
+            similarity = self._calculate_similarity_matrix(values[neighbors], attribute)
             gamma = self._calculate_gamma(similarity, geo_weights, kappa)
-            nodes_gamma[index] = gamma
+            nodes_gamma[attribute] = dict(zip(neighbors.tolist(), gamma))
         return nodes_gamma
 
     def _get_n_fold_neighbohood(self) -> int:
         """Get ne number of folds neighbors from the test set"""
-        neighbors_idx = self._get_neighbors(self.test_data.index, self.adj_matrix)
-        neighbors_idx = [n for n in neighbors_idx if n in self.data.index]
-        return len(self.data.loc[neighbors_idx].groupby(self.fold_col))
+        neighbors = np.flatnonzero(self._hop_levels[: len(self._nodes)] == 1)
+        return len(np.unique(self._folds[neighbors]))
 
     @staticmethod
     def _calculate_exponent(size_tree, count_n) -> np.float64:
         """Caclulate the decay exponent"""
         return np.log(1 * size_tree - count_n) / np.log(1 * size_tree)
 
-    def _propagate_variance(self, attribute, kappa) -> List:
-        """Calculate propagate variance"""
+    def _get_propagation_depth(self, hop_layers) -> int:
+        """Return the number of hop layers propagated before the buffer reaches
+        the training set size"""
+        n_buffered = 0  # number of nodes buffered
+        depth = 0
+        for h_neighbors in hop_layers:
+            if n_buffered >= self.train_data.shape[0]:
+                break
+            n_buffered += len(h_neighbors)
+            depth += 1
+        return depth
+
+    def _propagate_variance(self, attributes: List[str], kappa) -> Dict:
+        """Calculate propagate variance of each attribute in a single traversal"""
         # Initialize variables
-        buffer = []  # containg the index of instaces buffered
-        nodes_gamma = {}
-        # Start creating the buffer
-        while len(buffer) < self.train_data.shape[0]:
-            # Get the instance indexes from te test set + the indexes buffer
-            growing_graph_idx = self.test_data.index.values.tolist() + buffer
-            # Get the neighbor
-            h_neighbors = self._get_neighbors(growing_graph_idx, self.adj_matrix)
-            # Calculate the semivariogram for each fold in the neighborhood
-            nodes_gamma.update(
-                self._calculate_gamma_by_node(h_neighbors, attribute, kappa)
-            )
-            buffer += h_neighbors
+        nodes_gamma = {attribute: {} for attribute in attributes}
+        # Get the test positions and training mask of the fold
+        self._set_fold_positions()
+        # Each hop layer is the neighborhood of the test set + the previous layers
+        hop_layers = self._get_hop_layers()
+        depth = self._get_propagation_depth(hop_layers)
+        for h_neighbors in hop_layers[:depth]:
+            # Calculate the semivariogram for each node in the neighborhood
+            layer_gamma = self._calculate_gamma_by_node(h_neighbors, attributes, kappa)
+            for attribute in attributes:
+                nodes_gamma[attribute].update(layer_gamma[attribute])
         return nodes_gamma
 
+    def _restrict_propagation(self, nodes_propagated) -> Dict:
+        """Restrict the propagated nodes to the ones reached from the current
+        training set, as if the variance was propagated again on it"""
+        self._set_fold_positions()
+        depth = self._get_propagation_depth(self._get_hop_layers())
+        return {
+            node: gamma
+            for node, gamma in nodes_propagated.items()
+            if self._train_mask[node] and self._hop_levels[node] <= depth
+        }
+
     def _calculate_selection_buffer(self, nodes_propagated, attribute):
         """Calculate buffer nodes"""
         buffered_nodes = []
@@ -214,57 +259,62 @@ class RegGraphBasedSCV(SpatialCV):
         # return [node for node in buffered_nodes_target if node in buffered_nodes_reduced]
         return buffered_nodes_target
 
-    def run(self):
+    def _get_folds(self):
+        """Return the fold name and test set of each fold, but the null fold"""
+        return [(name, test) for name, test in super()._get_folds() if name != -1]
+
+    def _run_fold(self, fold_name, test_data):
+        """Generate a single regularization graph-based fold"""
+        # Cread fold folder
+        self._enter_fold_dir(fold_name)
+        # Initialize x , y and reduce
+        self._split_data_test_train(test_data)
+        self._calculate_hop_levels(fold_name)
+        # Calculate local sill
+        self._initiate_buffers_sills()
+        # Propagate the variance of the reduced and target attributes
+        nodes_prop = self._propagate_variance([X_1DIM_COL, self.target_col], self.kappa)
+        nodes_prop_reduced = nodes_prop[X_1DIM_COL]
+        nodes_prop_target = nodes_prop[self.target_col]
+        # Calculate selection buffer
+        selection_buffer = self._calculate_selection_buffer(
+            nodes_prop_reduced, X_1DIM_COL
+        )
+        if self.run_selection:
+            self.train_data = self.data.take(selection_buffer)
+            # The train data is used to calcualte the buffer. Thus, the
+            # gamma calculation will be influenced by the selection buffer.
+            nodes_prop_target = self._restrict_propagation(nodes_prop_target)
+        # Calculate removing buffer
+        removing_buffer = self._calculate_removing_buffer(
+            nodes_prop_target, nodes_prop_reduced, self.target_col
+        )
+        # removing_buffer = [node for node in removing_buffer if node in selection_buffer]
+        # removing_buffer = selection_buffer
+        removing_buffer = self._nodes.get_labels(removing_buffer)
+        self.train_data.drop(index=removing_buffer, inplace=True)
+        # Save buffered data indexes
+        self._save_buffered_indexes(removing_buffer)
+        # Clean data
+        self._clean_data(cols_drop=[X_1DIM_COL, self.fold_col])
+        # Save data
+        # self._save_data()
+
+    def run(self) -> FoldStore:
         """Generate graph-based spatial folds"""
         # Create folder folds
         start_time = time.time()
-        self._init_fields()
         self._make_folders(["folds", self.scv_method])
+        fold_store = self._get_cached_fold_store()
+        if fold_store is not None:
+            return fold_store
+        self._init_fields()
+        # Shallow copy, so the reduced column is not added to the shared dataset
+        self.data = self.data.copy(deep=False)
         self.data[X_1DIM_COL] = self._calculate_train_pca()
-        for fold_name, test_data in tqdm(
-            self.data.groupby(by=self.fold_col), desc="Creating folds"
-        ):
-            if fold_name != -1:
-                # Cread fold folder
-                self._mkdir(str(fold_name))
-                # Initialize x , y and reduce
-                self._split_data_test_train(test_data)
-                # Calculate local sill
-                self._initiate_buffers_sills()
-                # Ensure indexes and columns compatibility
-                self._convert_adj_matrix_index_types()
-                # Calculate selection buffer
-                nodes_prop_reduced = self._propagate_variance(X_1DIM_COL, self.kappa)
-                selection_buffer = self._calculate_selection_buffer(
-                    nodes_prop_reduced, X_1DIM_COL
-                )
-                if self.run_selection:
-                    self.train_data = self.train_data.loc[selection_buffer]
-                # The train data is used to calcualte the buffer. Thus, the size tree,
-                # and the gamma calculation will be influenced by the selection buffer.
-                # Calculate removing buffer
-                nodes_prop_target = self._propagate_variance(
-                    self.target_col, self.kappa
-                )
-                removing_buffer = self._calculate_removing_buffer(
-                    nodes_prop_target, nodes_prop_reduced, self.target_col
-                )
-                # removing_buffer = [node for node in removing_buffer if node in selection_buffer]
-                # removing_buffer = selection_buffer
-                self.train_data.drop(index=removing_buffer, inplace=True)
-                # Save buffered data indexes
-                self._save_buffered_indexes(removing_buffer)
-                # Save fold index relation table
-                self._save_fold_by_index_training()
-                # Clean data
-                self._clean_data(cols_drop=[X_1DIM_COL, self.fold_col])
-                # Save data
-                # self._save_data()
-                # Update cur dir
-                self.cur_dir = os.path.join(
-                    self._get_root_path(), "folds", self.scv_method
-                )
+        fold_store = self._run_folds()
         # Save execution time
         end_time = time.time()
         self._save_time(end_time, start_time)
         print(f"Execution time: {end_time-start_time} seconds")
+        return fold_store
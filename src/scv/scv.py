@@ -1,11 +1,38 @@
 """Generate spatial folds"""
 from abc import ABC, abstractmethod
 import os
-import json
-from dataclasses import dataclass, field
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Tuple
+import numpy as np
 import pandas as pd
+from tqdm import tqdm
 from src.data import Data
+from src.fold_store import FOLD_STORE_FILENAME, FoldStore
+from src.graph import ADJ_MATRIX_FILENAME
+from src.node_index import NodeIndex
+from src.results import get_stage_cache
+from src.stage_cache import FOLD_STORE_ARTIFACT, file_fingerprint, stage_key
+from src.weights import W_MATRIX_FILENAME
+
+# Fields that do not change the generated folds
+UNKEYED_FIELDS = ["root_path", "cur_dir", "logger_name", "results", "n_jobs"]
+UNKEYED_FIELDS += ["export_json", "train_data", "test_data"]
+
+_WORKER_SCV = None
+
+
+def _init_worker(scv):
+    """Keep the spatial cv instance shared by every fold run in the worker"""
+    global _WORKER_SCV
+    _WORKER_SCV = scv
+
+
+def _run_worker_fold(fold_name, test_data):
+    """Run a single fold with the worker spatial cv instance, returning the
+    partitions of the fold"""
+    _WORKER_SCV._run_fold(fold_name, test_data)
+    return fold_name, _WORKER_SCV._fold_split
 
 
 @dataclass
@@ -18,6 +45,12 @@ class SpatialCV(Data, ABC):
             The spatial dataset to generate the folds
         fold_col: str
             The fold column name
+        n_jobs: int
+            The number of processes generating folds in parallel, -1 to use
+            all the cores
+        export_json: bool
+            Whether to also export the split_data.json and fold_by_idx.csv files
+            of each fold, besides the fold store
     """
 
     scv_method: str = "No_Buffer"
@@ -25,29 +58,45 @@ class SpatialCV(Data, ABC):
     fold_col: str = "FOLD_INDEX"
     train_data: pd.DataFrame = field(default_factory=pd.DataFrame)
     test_data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    n_jobs: int = 1
+    export_json: bool = False
+    _nodes: NodeIndex = None
+    _folds_dir: str = None
+    _fold_split: Dict = None
+    _stage_key: str = None
 
-    def _get_index_train(self, index_test) -> List:
-        """Return the train set indexes based on the test set indexes"""
-        return [idx for idx in self.data.index if idx not in index_test]
+    def _init_node_index(self):
+        """Map the dataset index labels to their integer positions"""
+        self._nodes = NodeIndex.from_data(self.data)
+
+    def _get_index_train(self, test_positions) -> np.ndarray:
+        """Return the train set positions based on the test set positions"""
+        return np.flatnonzero(~self._nodes.mask(test_positions))
 
     def _split_data_test_train(self, test_data) -> pd.DataFrame:
         """Split the data into train and test set, based on a given teste set"""
-        index_test = test_data.index
-        index_train = self._get_index_train(index_test)
-        self.test_data = self.data.loc[index_test].copy()
-        self.train_data = self.data.loc[index_train].copy()
+        test_positions = self._nodes.positions(test_data.index)
+        train_positions = self._get_index_train(test_positions)
+        self.test_data = self.data.take(test_positions)
+        self.train_data = self.data.take(train_positions)
+
+    def _get_split_positions(self, removing_buffer) -> Dict[str, np.ndarray]:
+        """Return the positions of the train, test, removing buffer and discarded
+        partitions of the fold. Discarded are the nodes in none of the others"""
+        split_positions = {
+            "train": self._nodes.positions(self.train_data.index),
+            "test": self._nodes.positions(self.test_data.index),
+            "removing_buffer": self._nodes.positions(removing_buffer),
+        }
+        kept = self._nodes.mask(np.concatenate(list(split_positions.values())))
+        split_positions["discarded"] = np.flatnonzero(~kept)
+        return split_positions
 
     def _clean_data(self, cols_drop: List):
         """Clean the dataset to present only attributes of interest"""
         self.train_data.drop(columns=cols_drop, inplace=True)
         self.test_data.drop(columns=cols_drop, inplace=True)
 
-    def _save_fold_by_index_training(self):
-        """Save the fold index relation table"""
-        self.train_data[self.fold_col].to_csv(
-            os.path.join(self.cur_dir, "fold_by_idx.csv")
-        )
-
     def _save_data(self):
         """Save the train and test set using feather"""
         self.train_data.reset_index(inplace=True)
@@ -56,22 +105,59 @@ class SpatialCV(Data, ABC):
         self.test_data.to_feather(os.path.join(self.cur_dir, "test.ftr"))
 
     def _save_buffered_indexes(self, removing_buffer):
-        """Save the indexes of the buffers"""
-        train_test_idx = (
-            self.train_data.index.values.tolist() + self.test_data.index.values.tolist()
-        )
-        discarded_idx = [
-            _ for _ in self.data.index if _ not in train_test_idx + removing_buffer
-        ]
-        split_data = {
-            "train": self.train_data.index.values.tolist(),
-            "test": self.test_data.index.values.tolist(),
-            "removing_buffer": removing_buffer,
-            "discarded": discarded_idx,
+        """Keep the partitions of the fold to be saved in the fold store"""
+        self._fold_split = self._get_split_positions(removing_buffer)
+
+    def _get_stage_key(self) -> str:
+        """Return the hash of the folds inputs: the method, its parameters, the
+        dataset and the adjacency and weights matrices, read from the root path
+        when not given"""
+        params = {
+            attr.name: getattr(self, attr.name)
+            for attr in fields(self)
+            if not attr.name.startswith("_") and attr.name not in UNKEYED_FIELDS
         }
-        path_to_save = os.path.join(self.cur_dir, "split_data.json")
-        with open(path_to_save, "w", encoding="utf-8") as file:
-            json.dump(split_data, file, indent=4)
+        matrices = [
+            file_fingerprint(os.path.join(self.root_path, filename))
+            for filename in [ADJ_MATRIX_FILENAME, W_MATRIX_FILENAME]
+        ]
+        return stage_key(type(self).__name__, params, matrices)
+
+    def _get_cached_fold_store(self) -> FoldStore:
+        """Return the fold store of a previous run with the same inputs from the
+        current folds directory, None if there is none"""
+        self._stage_key = self._get_stage_key()
+        cache = get_stage_cache(self.results, self.cur_dir)
+        if not cache.is_cached(
+            FOLD_STORE_ARTIFACT, self._stage_key, FOLD_STORE_FILENAME
+        ):
+            return None
+        self.logger_info("Folds inputs unchanged, loading the cached fold store.")
+        store = FoldStore.load(self.cur_dir)
+        if self.export_json:
+            self._persist(
+                store.export_json, self.cur_dir, self.fold_col, self.data.index.name
+            )
+        if self.results is not None:
+            self.results.folds = store
+        return store
+
+    def _save_fold_store(self, fold_splits) -> FoldStore:
+        """Save the partitions of every fold as a single fold store. The former
+        split_data.json and fold_by_idx.csv files are exported on request"""
+        store = FoldStore.from_splits(
+            self.data.index, self.data[self.fold_col].to_numpy(), fold_splits
+        )
+        self._persist(store.save, self._folds_dir)
+        if self.export_json:
+            self._persist(
+                store.export_json, self._folds_dir, self.fold_col, self.data.index.name
+            )
+        if self.results is not None:
+            self.results.folds = store
+        cache = get_stage_cache(self.results, self._folds_dir)
+        self._persist(cache.write, cache.record(FOLD_STORE_ARTIFACT, self._stage_key))
+        return store
 
     def _save_time(self, end, start):
         time = end - start
@@ -80,6 +166,56 @@ class SpatialCV(Data, ABC):
             msg = f"Execution time \n seconds: {time} \n minutes: {time/60} \n hours: {time/3600}"
             file.write(msg)
 
+    def _get_folds(self) -> List[Tuple]:
+        """Return the fold name and test set of each fold"""
+        return list(self.data.groupby(by=self.fold_col))
+
+    def _enter_fold_dir(self, fold_name):
+        """Set the current directory to the fold folder, creating it if needed"""
+        self.cur_dir = self._folds_dir
+        self._mkdir(str(fold_name))
+
+    def _get_n_jobs(self, n_folds) -> int:
+        """Return the number of processes to run the folds"""
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        return max(1, min(n_jobs or 1, n_folds))
+
+    def _run_folds(self) -> FoldStore:
+        """Run every fold from the current folds directory. When n_jobs is not 1,
+        folds run in a process pool, each worker holding a copy of the instance
+        with the read-only data and graph, and writing its own fold folder"""
+        self._folds_dir = self.cur_dir
+        if self._nodes is None:
+            self._init_node_index()
+        folds = self._get_folds()
+        n_jobs = self._get_n_jobs(len(folds))
+        fold_splits = {}
+        if n_jobs == 1:
+            for fold_name, test_data in tqdm(folds, desc="Creating folds"):
+                self._run_fold(fold_name, test_data)
+                fold_splits[fold_name] = self._fold_split
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_init_worker, initargs=(self,)
+            ) as executor:
+                futures = [
+                    executor.submit(_run_worker_fold, fold_name, test_data)
+                    for fold_name, test_data in folds
+                ]
+                for future in tqdm(
+                    as_completed(futures), total=len(futures), desc="Creating folds"
+                ):
+                    fold_name, fold_split = future.result()
+                    fold_splits[fold_name] = fold_split
+            # Keep the folds order regardless of the completion order
+            fold_splits = {name: fold_splits[name] for name, _ in folds}
+        self.cur_dir = self._folds_dir
+        return self._save_fold_store(fold_splits)
+
+    @abstractmethod
+    def _run_fold(self, fold_name, test_data):
+        """Generate a single fold, saving its artifacts in the fold folder"""
+
     @abstractmethod
-    def run(self):
-        """Generate graph-based spatial folds"""
+    def run(self) -> FoldStore:
+        """Generate graph-based spatial folds, returning their fold store"""
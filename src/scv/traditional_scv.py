@@ -1,12 +1,11 @@
 """Generate traditional spatial folds"""
-import os
 import time
 from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
-from tqdm import tqdm
 import geostatspy.geostats as geostats
 from scipy.spatial.distance import cdist
+from src.fold_store import FoldStore
 from src.scv.scv import SpatialCV
 
 ULTRACONSERVATIVE = "TraditionalSCV"
@@ -38,6 +37,7 @@ class TraditionalSCV(SpatialCV):
     meshblocks: pd.DataFrame = field(default_factory=pd.DataFrame)
     index_meshblocks: str = None
     sill_target: np.float64 = None
+    _buffer_size: float = None
 
     def _calculate_sill(self):
         # Calculates sill, variance of the target variable
@@ -101,37 +101,37 @@ class TraditionalSCV(SpatialCV):
         )
         self.data = self.data.join(self.meshblocks[["x", "y"]])
 
-    def run(self) -> None:
+    def _run_fold(self, fold_name, test_data):
+        """Generate a single traditional spatial fold"""
+        # Cread fold folder
+        self._enter_fold_dir(fold_name)
+        # Initialize x , y and reduce
+        self._split_data_test_train(test_data)
+        # Calculate removing buffer
+        removing_buffer = self._calculate_buffer(self._buffer_size)
+        self.train_data.drop(index=removing_buffer, inplace=True)
+        # Save buffered data indexes
+        self._save_buffered_indexes(removing_buffer)
+        # Clean data
+        self._clean_data(cols_drop=[self.fold_col, "x", "y"])
+        # Save data
+        # self._save_data()
+
+    def run(self) -> FoldStore:
         """Generate ultra-conservartive spatial folds"""
         # Create folder folds
         start_time = time.time()
         name_folds = ULTRACONSERVATIVE
         self._make_folders(["folds", name_folds])
+        fold_store = self._get_cached_fold_store()
+        if fold_store is not None:
+            return fold_store
         self._generate_x_y()
         self._calculate_sill()
-        buffer_size = self._calculate_buffer_size()
-
-        for fold_name, test_data in tqdm(
-            self.data.groupby(by=self.fold_col), desc="Creating folds"
-        ):
-            # Cread fold folder
-            self._mkdir(str(fold_name))
-            # Initialize x , y and reduce
-            self._split_data_test_train(test_data)
-            # Calculate removing buffer
-            removing_buffer = self._calculate_buffer(buffer_size)
-            self.train_data.drop(index=removing_buffer, inplace=True)
-            # Save buffered data indexes
-            self._save_buffered_indexes(removing_buffer)
-            # Save fold index relation table
-            self._save_fold_by_index_training()
-            # Clean data
-            self._clean_data(cols_drop=[self.fold_col, "x", "y"])
-            # Save data
-            # self._save_data()
-            # Update cur dir
-            self.cur_dir = os.path.join(self._get_root_path(), "folds", name_folds)
+        self._buffer_size = self._calculate_buffer_size()
+        fold_store = self._run_folds()
         # Save execution time
         end_time = time.time()
         self._save_time(end_time, start_time)
         print(f"Execution time: {end_time-start_time} seconds")
+        return fold_store
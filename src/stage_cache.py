@@ -0,0 +1,146 @@
+"""Content-addressed cache of the pipeline stages artifacts"""
+import os
+import json
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+
+STAGE_CACHE_FILENAME = "stage_cache.json"
+STAGE_CACHE_FOLDER = "stage_cache"
+KEY_EXTENSION = ".key"
+FOLD_STORE_ARTIFACT = "fold_store"
+METRICS_ARTIFACT = "metrics"
+
+
+def file_fingerprint(filepath: str) -> Optional[list]:
+    """Return the size and modification time of a file, None if missing"""
+    if not os.path.isfile(filepath):
+        return None
+    stat = os.stat(filepath)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def fingerprint(value):
+    """Return a json serializable fingerprint of a stage input. Dataframes are
+    hashed by content and graphs or weights by their own fingerprint"""
+    if hasattr(value, "fingerprint"):
+        return value.fingerprint()
+    if isinstance(value, pd.DataFrame):
+        if value.empty:
+            return None
+        digest = hashlib.sha1(pd.util.hash_pandas_object(value).to_numpy().tobytes())
+        digest.update(json.dumps([str(col) for col in value.columns]).encode())
+        digest.update(json.dumps([str(dtype) for dtype in value.dtypes]).encode())
+        return digest.hexdigest()
+    if isinstance(value, dict):
+        return {str(key): fingerprint(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [fingerprint(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+def stage_key(parent_key: Optional[str], *inputs) -> Optional[str]:
+    """Return the hash of a stage artifact inputs, chained to the key of the
+    artifact it is built from. Without a parent key there is no key, so the
+    artifact is always rebuilt"""
+    if parent_key is None:
+        return None
+    payload = json.dumps([parent_key, fingerprint(list(inputs))], sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def combine_keys(keys) -> Optional[str]:
+    """Return the hash of several artifact keys, None if any of them is None"""
+    keys = list(keys)
+    if not keys or any(key is None for key in keys):
+        return None
+    return hashlib.sha1(json.dumps(keys).encode()).hexdigest()
+
+
+@dataclass
+class StageCache:
+    """Represents the input keys of the artifacts of a stage folder.
+
+    An artifact is only rebuilt when its inputs key differs from the key it was
+    written with, so reruns skip the folds whose inputs did not change. Each
+    key is kept in its own file of the stage_cache folder next to the
+    artifacts, replaced atomically, so tasks writing different folds of the
+    same stage at once never overwrite each other's keys. Keys of the former
+    stage_cache.json manifest are still read, the key files taking precedence.
+
+    Attributes
+    ----------
+        path: str
+            The stage folder
+        keys: Dict[str, str]
+            The inputs key of each artifact
+    """
+
+    path: str = None
+    keys: Dict[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def _read_json(filepath: str):
+        """Return the content of a json file, None if missing or unreadable"""
+        try:
+            with open(filepath, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def load(cls, path: str) -> "StageCache":
+        """Load the keys of a stage folder, if any. An unreadable file counts as
+        no key, so its artifacts are rebuilt"""
+        keys = cls._read_json(os.path.join(path, STAGE_CACHE_FILENAME))
+        keys = keys if isinstance(keys, dict) else {}
+        keys_dir = os.path.join(path, STAGE_CACHE_FOLDER)
+        if os.path.isdir(keys_dir):
+            for filename in os.listdir(keys_dir):
+                if not filename.endswith(KEY_EXTENSION):
+                    continue
+                artifact = filename[: -len(KEY_EXTENSION)]
+                key = cls._read_json(os.path.join(keys_dir, filename))
+                if isinstance(key, str):
+                    keys[artifact] = key
+                else:
+                    keys.pop(artifact, None)
+        return cls(path=path, keys=keys)
+
+    def get_key(self, artifact) -> Optional[str]:
+        """Return the inputs key the artifact was written with"""
+        return self.keys.get(str(artifact))
+
+    def is_cached(self, artifact, key: Optional[str], filename: str) -> bool:
+        """Return whether the artifact file exists and was written with the key"""
+        if key is None or self.get_key(artifact) != key:
+            return False
+        return os.path.isfile(os.path.join(self.path, filename))
+
+    def record(self, artifact, key: Optional[str]) -> Dict[str, Optional[str]]:
+        """Record the inputs key of a new artifact, returning the key to be
+        written"""
+        if key is None:
+            self.keys.pop(str(artifact), None)
+        else:
+            self.keys[str(artifact)] = key
+        return {str(artifact): key}
+
+    def write(self, keys: Dict[str, Optional[str]]):
+        """Write the key file of each artifact in the stage folder. A None key
+        is written as well, so it overrides a former manifest key"""
+        keys_dir = os.path.join(self.path, STAGE_CACHE_FOLDER)
+        os.makedirs(keys_dir, exist_ok=True)
+        for artifact, key in keys.items():
+            filepath = os.path.join(keys_dir, f"{artifact}{KEY_EXTENSION}")
+            # Write then rename, so an interrupted write never leaves a partial file
+            tmp_path = f"{filepath}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(key, file)
+            os.replace(tmp_path, filepath)
@@ -13,7 +13,10 @@ from matplotlib import pyplot
 import matplotlib.pylab as plt
 from tqdm import tqdm
 from src.data import Data
-from src import utils
+from src.graph import SpatialGraph, load_graph
+from src.dataset import load_dataset
+from src.fold_store import FoldStore, load_fold_store
+from src.node_index import NodeIndex
 
 
 @dataclass
@@ -28,6 +31,8 @@ class VizDependence(Data):
         Root path
     index_col : str
         The data index column name
+    data: pd.Dataframe
+        The spatial dataset, loaded from the dataset cache when empty
     """
 
     cv_methods: List = field(default_factory=list)
@@ -36,6 +41,7 @@ class VizDependence(Data):
     target_col: str = None
     prob: float = None
     fold_list: List = field(default_factory=list)
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
     adj_matrix: pd.DataFrame = field(default_factory=pd.DataFrame)
     paper: bool = False
     _train: pd.DataFrame = field(default_factory=pd.DataFrame)
@@ -46,6 +52,9 @@ class VizDependence(Data):
     _boundary: pd.DataFrame = field(default_factory=pd.DataFrame)
     _dependence: pd.DataFrame = field(default_factory=pd.DataFrame)
     _tosee: Dict = field(default_factory=dict)
+    _nodes: NodeIndex = None
+    _folds: FoldStore = None
+    _graph: SpatialGraph = None
 
     def _init_methods_path(self):
         """Initialize spatial cv folder paths"""
@@ -53,10 +62,9 @@ class VizDependence(Data):
             os.path.join(self.root_path, "folds", method) for method in self.cv_methods
         ]
 
-    def _read_train_data(self, json_path, data):
+    def _read_train_data(self, fold, data):
         """Read the training data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self._train = data.loc[split_fold_idx["train"]].copy()
+        self._train = data.take(self._folds.positions(fold, "train"))
 
     # def _read_train_data(self, folds_path, fold, paper):
     #    """Read train data"""
@@ -65,10 +73,9 @@ class VizDependence(Data):
     #        cols = [c for c in self._train.columns if "CENSUS" in c] + [self.target_col]
     #        self._train = self._train[cols]
 
-    def _read_test_data(self, json_path, data):
-        """Read the training data"""
-        split_fold_idx = utils.load_json(os.path.join(json_path, "split_data.json"))
-        self._test = data.loc[split_fold_idx["test"]].copy()
+    def _read_test_data(self, fold, data):
+        """Read the test data"""
+        self._test = data.take(self._folds.positions(fold, "test"))
 
     # def _read_test_data(self, folds_path, fold, paper):
     #    """Read test data"""
@@ -84,23 +91,21 @@ class VizDependence(Data):
         data.set_index(self.index_col, inplace=True)
         return data
 
-    def _read_split_data(self, folds_path, fold):
-        """Read split data json file"""
-        json_path = os.path.join(folds_path, fold, "split_data.json")
-        self._split_data = utils.load_json(json_path)
+    def _read_split_data(self, fold):
+        """Read the partitions of the fold"""
+        self._split_data = self._folds.get_split(fold)
 
-    def _read_fold_idx_table(self, folds_path, fold):
-        """Read the fold_by_idx data"""
-        self._fold_idx = pd.read_csv(
-            os.path.join(folds_path, fold, "fold_by_idx.csv"), index_col=self.index_col
-        )
+    def _read_fold_idx_table(self, fold):
+        """Read the fold index relation table of the fold"""
+        fold_idx = self._folds.get_fold_by_idx(fold, self.index_col)
+        self._fold_idx = fold_idx.rename(self.fold_col).to_frame()
 
-    def _initialize_data(self, folds_path, fold, data):
+    def _initialize_data(self, fold, data):
         """Load the data"""
-        self._read_train_data(os.path.join(folds_path, fold), data)
-        self._read_test_data(os.path.join(folds_path, fold), data)
-        self._read_split_data(folds_path, fold)
-        self._read_fold_idx_table(folds_path, fold)
+        self._read_train_data(fold, data)
+        self._read_test_data(fold, data)
+        self._read_split_data(fold)
+        self._read_fold_idx_table(fold)
 
     def _initialize_dependence_df(self):
         """Initialize dependence dataframe"""
@@ -109,28 +114,20 @@ class VizDependence(Data):
         self._dependence.set_index("FOLDS", inplace=True)
         self._dependence.fillna(0, inplace=True)
 
-    def _convert_adj_matrix_index_types(self):
-        """Convert adjacenty matrixy index and columns types to the same as in the data"""
-        self.adj_matrix.index = self.adj_matrix.index.astype(self._train.index.dtype)
-        self.adj_matrix.columns = self.adj_matrix.columns.astype(
-            self._train.index.dtype
-        )
-
-    @staticmethod
-    def _get_neighbors(indexes, adj_matrix):
-        """Return the 1-degree neighborhood from a given sub-graph formed by indexes"""
-        area_matrix = adj_matrix.loc[indexes]
-        neighbors = area_matrix.sum(axis=0) > 0
-        neighbors = neighbors[neighbors].index
-        neighbors = [n for n in neighbors if n not in indexes]
-        return neighbors
+    def _init_graph(self, data):
+        """Build the node index and the sparse adjacency graph aligned to it"""
+        self._nodes = NodeIndex.from_data(data)
+        self._graph = load_graph(self.adj_matrix, self.root_path, self._nodes)
 
     def _get_boundary(self):
         """Returns spatial objects in the boundary of removing + test data"""
         indexes = self._split_data["removing_buffer"] + self._split_data["test"]
-        neighbors = self._get_neighbors(indexes, self.adj_matrix)
-        neighbors = [n for n in neighbors if n not in self._split_data["discarded"]]
-        neighbors = [n for n in neighbors if n in self._fold_idx.index]
+        neighbors = self._graph.neighbors(self._nodes.positions(indexes))
+        neighbors = neighbors[neighbors < len(self._nodes)]
+        discarded = self._nodes.positions(self._split_data["discarded"])
+        discarded = self._nodes.mask(discarded)
+        neighbors = self._nodes.labels[neighbors[~discarded[neighbors]]]
+        neighbors = neighbors[neighbors.isin(self._fold_idx.index)]
         self._boundary = self._fold_idx.loc[neighbors].copy()
 
     def _get_n_nearest_folds(self, n_folds):
@@ -325,19 +322,19 @@ class VizDependence(Data):
 
     def run(self):
         """Runs de visualization process"""
-        data = pd.read_csv(os.path.join(self.root_path, "data.csv"))
-        data.set_index(self.index_col, inplace=True)
+        data = load_dataset(self.root_path, self.index_col, self.data)
         self._init_methods_path()
+        self._init_graph(data)
         self._make_folders(["comparison"])
         self._initialize_dependence_df()
         for method_path, method in tqdm(
             zip(self._cv_methods_path, self.cv_methods), total=len(self.cv_methods)
         ):
-            list_folds = self._get_folders_in_dir(method_path)
+            self._folds = load_fold_store(method_path, self._nodes)
+            list_folds = self._folds.get_folds()
             list_folds.remove("53")
             for fold in list_folds:
-                self._initialize_data(method_path, fold, data)
-                self._convert_adj_matrix_index_types()
+                self._initialize_data(fold, data)
                 self._get_boundary()
                 n_folds = self._get_n_nearest_folds(n_folds=4)
                 # self._calculate_morans_index(n_folds.keys(), fold, method)
@@ -0,0 +1,160 @@
+"""Spatial weights between the nodes of the adjacency graph"""
+import os
+import hashlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from src.graph import SpatialGraph
+
+W_MATRIX_FILENAME = "normd_matrix.csv"
+
+
+class Weights(ABC):
+    """Represents the weights between the graph nodes.
+
+    Weights are only read for the (rows x cols) blocks a computation needs, so
+    a full n x n table is never materialized.
+    """
+
+    @abstractmethod
+    def align(self, graph: SpatialGraph) -> "Weights":
+        """Return the weights indexed by the graph node positions"""
+
+    @abstractmethod
+    def block(self, rows, cols) -> np.ndarray:
+        """Return the dense weights block between the rows and cols positions"""
+
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """Return a hash of the weights, used to key the stage caches"""
+
+
+class UnitWeights(Weights):
+    """Represents implicit weights equal to one between every pair of nodes"""
+
+    def align(self, graph: SpatialGraph) -> "UnitWeights":
+        """Return the weights indexed by the graph node positions"""
+        return self
+
+    def block(self, rows, cols) -> np.ndarray:
+        """Return the dense weights block between the rows and cols positions"""
+        return np.ones((len(rows), len(cols)))
+
+    def fingerprint(self) -> str:
+        """Return a hash of the weights, used to key the stage caches"""
+        return "unit"
+
+
+@dataclass
+class SparseWeights(Weights):
+    """Represents explicit weights stored as a scipy CSR matrix.
+
+    Only the non-zero entries are stored, missing pairs weigh zero. NaN entries
+    are kept, so they are skipped by the gamma computation as before.
+
+    Attributes
+    ----------
+        matrix: sparse.csr_matrix
+            The weights matrix in CSR format
+        nodes: pd.Index
+            The index label of each node position
+    """
+
+    matrix: sparse.csr_matrix = None
+    nodes: pd.Index = field(default_factory=pd.Index)
+
+    @staticmethod
+    def _cast_labels(labels, index_dtype) -> pd.Index:
+        """Cast the labels to the dataset index type"""
+        labels = pd.Index(labels)
+        if index_dtype is not None:
+            labels = labels.astype(index_dtype)
+        return labels
+
+    @classmethod
+    def _from_entries(cls, rows, cols, values, nodes) -> "SparseWeights":
+        """Build the weights from (row, col, value) entry positions"""
+        valid = cols >= 0
+        matrix = sparse.csr_matrix(
+            (values[valid], (rows[valid], cols[valid])),
+            shape=(len(nodes), len(nodes)),
+        )
+        return cls(matrix=matrix, nodes=nodes)
+
+    @classmethod
+    def from_dataframe(cls, w_matrix: pd.DataFrame, index_dtype=None):
+        """Build the weights from a dense weights matrix dataframe"""
+        nodes = cls._cast_labels(w_matrix.index, index_dtype)
+        col_pos = nodes.get_indexer(cls._cast_labels(w_matrix.columns, nodes.dtype))
+        values = w_matrix.to_numpy(dtype=np.float64)
+        rows, cols = np.nonzero(values != 0)
+        return cls._from_entries(rows, col_pos[cols], values[rows, cols], nodes)
+
+    @classmethod
+    def from_csv(cls, filepath: str, index_dtype=None, chunksize: int = 1000):
+        """Build the weights from a weights matrix csv file, reading it in chunks
+        of rows so the dense matrix is never held in memory"""
+        rows, cols, values, labels = [], [], [], []
+        columns = None
+        for chunk in pd.read_csv(
+            filepath, index_col=0, chunksize=chunksize, low_memory=False
+        ):
+            chunk_values = chunk.to_numpy(dtype=np.float64)
+            chunk_rows, chunk_cols = np.nonzero(chunk_values != 0)
+            rows.append(chunk_rows + len(labels))
+            cols.append(chunk_cols)
+            values.append(chunk_values[chunk_rows, chunk_cols])
+            labels.extend(chunk.index)
+            columns = chunk.columns
+        nodes = cls._cast_labels(labels, index_dtype)
+        col_pos = nodes.get_indexer(cls._cast_labels(columns, nodes.dtype))
+        rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+        values = np.concatenate(values) if values else np.array([])
+        return cls._from_entries(rows, col_pos[cols], values, nodes)
+
+    def align(self, graph: SpatialGraph) -> "SparseWeights":
+        """Return the weights reindexed to the graph node positions. Nodes missing
+        from the graph are dropped"""
+        own_nodes = self._cast_labels(self.nodes, graph.nodes.dtype)
+        new_positions = graph.nodes.get_indexer(own_nodes)
+        entries = self.matrix.tocoo()
+        rows, cols = new_positions[entries.row], new_positions[entries.col]
+        valid = rows >= 0
+        return self._from_entries(
+            rows[valid], cols[valid], entries.data[valid], graph.nodes
+        )
+
+    def block(self, rows, cols) -> np.ndarray:
+        """Return the dense weights block between the rows and cols positions"""
+        return self.matrix[rows][:, cols].toarray()
+
+    def fingerprint(self) -> str:
+        """Return a hash of the nodes and weights, used to key the stage caches"""
+        digest = hashlib.sha1()
+        digest.update(pd.util.hash_array(np.asarray(self.nodes)).tobytes())
+        digest.update(np.asarray(self.matrix.indptr, dtype=np.int64).tobytes())
+        digest.update(np.asarray(self.matrix.indices, dtype=np.int64).tobytes())
+        digest.update(np.asarray(self.matrix.data, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+
+def load_weights(
+    type_graph: str, w_matrix, root_path: str, graph: SpatialGraph
+) -> Weights:
+    """Return the weights for the graph type aligned to the graph nodes. Sparse
+    graphs use unit weights, and weighted ones are read from normd_matrix.csv
+    in root_path when no weights matrix is given"""
+    if type_graph == "Sparse":
+        return UnitWeights()
+    if isinstance(w_matrix, Weights):
+        weights = w_matrix
+    elif w_matrix is None or w_matrix.empty:
+        weights = SparseWeights.from_csv(
+            os.path.join(root_path, W_MATRIX_FILENAME), graph.nodes.dtype
+        )
+    else:
+        weights = SparseWeights.from_dataframe(w_matrix, graph.nodes.dtype)
+    return weights.align(graph)
@@ -0,0 +1,66 @@
+"""Check that the NumPy CFS selects the same features as Weka's CFS"""
+import numpy as np
+import pandas as pd
+from src.feature_selection.cfs import CfsCorrelations, cfs, search
+from src.feature_selection.cfs_worker import CfsSelector
+from src.feature_selection.fold_stats import FoldStatistics
+
+N_ROWS = 200
+N_FOLDS = 5
+FIXTURE = "cfs_fixture"
+
+
+def make_fixture(seed: int = 0) -> pd.DataFrame:
+    """Return a small dataset of redundant and noisy features, with a constant
+    feature, the target being the last column"""
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(size=(N_ROWS, 3))
+    columns = {
+        "a": factors[:, 0],
+        "a_copy": factors[:, 0] + rng.normal(scale=0.1, size=N_ROWS),
+        "b": factors[:, 1],
+        "b_noisy": factors[:, 1] + rng.normal(scale=1.0, size=N_ROWS),
+        "c": factors[:, 2],
+        "mix": factors[:, 0] - factors[:, 2],
+        "constant": np.ones(N_ROWS),
+    }
+    for i in range(5):
+        columns[f"noise_{i}"] = rng.normal(size=N_ROWS)
+    data = pd.DataFrame(columns)
+    data["TARGET"] = (
+        2 * factors[:, 0] + factors[:, 1] - 0.5 * factors[:, 2]
+        + rng.normal(scale=0.5, size=N_ROWS)
+    )
+    return data
+
+
+def get_training_rows():
+    """Return the training rows of each fold, and of one fold kept alone so
+    the fold statistics sum the rows instead of downdating them"""
+    folds = np.array_split(np.arange(N_ROWS), N_FOLDS)
+    training = [np.setdiff1d(np.arange(N_ROWS), fold) for fold in folds]
+    return training + [folds[0]]
+
+
+def main():
+    data = make_fixture()
+    columns = data.columns[:-1]
+    matrix = data.to_numpy(dtype=np.float64)
+    stats = FoldStatistics.from_frame(data, targets=[data.shape[1] - 1])
+    selector = CfsSelector()
+    selector.register(FIXTURE, data)
+    for rows in get_training_rows():
+        direct = columns[cfs(matrix[rows, :-1], matrix[rows, -1])].tolist()
+        downdated = search(CfsCorrelations.from_fold(stats.fold(rows)))
+        downdated = columns[downdated].tolist()
+        weka = selector.select(FIXTURE, rows)
+        if not sorted(direct) == sorted(downdated) == sorted(weka):
+            raise AssertionError(
+                f"CFS selections differ over {len(rows)} rows: "
+                f"cfs {direct}, fold statistics {downdated}, Weka {weka}"
+            )
+    print(">>> NumPy CFS matches Weka CFS!")
+
+
+if __name__ == "__main__":
+    main()